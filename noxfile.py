@@ -145,6 +145,19 @@ def minimums(session: nox.Session) -> None:
     )
 
 
+@nox.session(reuse_venv=True, default=False)
+def benchmarks(session: nox.Session) -> None:
+    """
+    Run the benchmarks in tests/benchmarks. Pass names to run only some of them.
+    """
+    session.install("-e.")
+    names = session.posargs or sorted(
+        p.stem for p in DIR.joinpath("tests/benchmarks").glob("bench_*.py")
+    )
+    for name in names:
+        session.run("python", f"tests/benchmarks/{name}.py")
+
+
 @nox.session(reuse_venv=True, default=False)
 def docs(session: nox.Session) -> None:
     """
@@ -31,6 +31,9 @@ def main_info(_args: argparse.Namespace | None = None, /) -> None:
     rich_print("  scikit-build file-api query        {green}Request CMake file API")
     rich_print("  scikit-build file-api reply        {green}Process CMake file API")
     rich_print("  scikit-build init                  {green}Generate a starter project")
+    rich_print(
+        "  scikit-build wheel retag           {green}Copy a wheel under new tags"
+    )
     rich_print()
 
 
@@ -80,6 +83,14 @@ def main(argv: Sequence[str] | None = None) -> None:
     )
     init_main.populate_parser(init_parser)
 
+    wheel_parser = subparsers.add_parser(
+        "wheel",
+        help="Wheel utilities",
+        description="Wheel utilities.",
+        allow_abbrev=False,
+    )
+    build_main.populate_wheel_parser(wheel_parser)
+
     args = parser.parse_args(argv)
     args.func(args)
 
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import os
+import sys
+
+__all__ = ["process_cpu_count"]
+
+
+def __dir__() -> list[str]:
+    return __all__
+
+
+if sys.version_info >= (3, 13):
+    from os import process_cpu_count
+else:
+
+    def process_cpu_count() -> int | None:
+        if hasattr(os, "sched_getaffinity"):
+            return len(os.sched_getaffinity(0))
+        return os.cpu_count()
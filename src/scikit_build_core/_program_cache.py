@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+__lazy_modules__ = {
+    f"{__spec__.parent}._logging",
+    f"{__spec__.parent}.settings.skbuild_overrides",
+    "contextlib",
+    "hashlib",
+    "json",
+    "pathlib",
+    "re",
+    "stat",
+    "tempfile",
+    "time",
+}
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import stat
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from . import __version__
+from ._logging import logger
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import Any
+
+__all__ = ["cached_probe", "get_program_cache_dir"]
+
+
+def __dir__() -> list[str]:
+    return __all__
+
+
+# An entry is trusted at most this long (in seconds), even if the program looks
+# unchanged; this bounds the damage if a program changes without its size or
+# modification time changing.
+MAX_AGE = 7 * 24 * 60 * 60
+
+
+def get_program_cache_dir() -> Path | None:
+    """
+    The user-level directory holding cached program probes, or None if the
+    cache is disabled with ``SKBUILD_NO_PROGRAM_CACHE``. Set
+    ``SKBUILD_PROGRAM_CACHE_DIR`` to use a different directory.
+    """
+    from .settings.skbuild_overrides import strtobool
+
+    if strtobool(os.environ.get("SKBUILD_NO_PROGRAM_CACHE", "")):
+        return None
+    if custom := os.environ.get("SKBUILD_PROGRAM_CACHE_DIR", ""):
+        return Path(custom).expanduser()
+
+    try:
+        if sys.platform.startswith("win"):
+            local = os.environ.get("LOCALAPPDATA", "")
+            base = Path(local) if local else Path.home() / "AppData" / "Local"
+            return base / "scikit-build-core" / "Cache" / "programs"
+        if sys.platform == "darwin":
+            base = Path.home() / "Library" / "Caches"
+        else:
+            xdg = os.environ.get("XDG_CACHE_HOME", "")
+            base = Path(xdg) if xdg else Path.home() / ".cache"
+    except RuntimeError:
+        # No home directory
+        return None
+    return base / "scikit-build-core" / "programs"
+
+
+# The interpreter of a Python console script as pip writes them: either
+# "#!/path/to/python", or (for a path with spaces, or too long for a shebang)
+# "#!/bin/sh" followed by a line starting "'''exec' /path/to/python".
+_PYTHON_SCRIPT = re.compile(
+    rb"#!(?P<direct>/\S*/(?:python|pypy)[^\s/]*)[ \t]*\r?\n"
+    rb"|#!/bin/sh\r?\n'''exec' (?P<quote>[\"']?)"
+    rb"(?P<sh>/.*?/(?:python|pypy)[^/]*?)(?P=quote) \"\$0\""
+)
+
+
+def _file_identity(path: str | os.PathLike[str]) -> tuple[list[Any], bytes] | None:
+    """
+    The resolved path, device, inode, size and modification time of the
+    regular file at ``path``, and its first bytes. None if it isn't one.
+    """
+    try:
+        real = Path(path).resolve()
+        st = real.stat()
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        with real.open("rb") as f:
+            head = f.read(1024)
+    except (OSError, RuntimeError, ValueError):
+        return None
+    return [str(real), st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns], head
+
+
+def _program_identity(path: str | os.PathLike[str]) -> list[Any] | None:
+    """
+    What identifies the program at ``path``: the identity of the file and, for
+    a Python console script (like the ``cmake`` and ``ninja`` wrappers pip
+    installs), that of its interpreter too. None if it can't be cached: any
+    other script (like a version manager's shim) may run a different program
+    each time, without changing itself.
+    """
+    found = _file_identity(path)
+    if found is None:
+        return None
+    identity, head = found
+    if not head.startswith(b"#!"):
+        return identity
+    match = _PYTHON_SCRIPT.match(head)
+    if match is None:
+        return None
+    interpreter = _file_identity(
+        os.fsdecode(match.group("direct") or match.group("sh"))
+    )
+    if interpreter is None or interpreter[1].startswith(b"#!"):
+        return None
+    return [*identity, *interpreter[0]]
+
+
+def _load(entry: Path, key: list[Any]) -> Any:
+    try:
+        with entry.open(encoding="utf-8") as f:
+            data = json.load(f)
+        age = time.time() - data["time"]
+        if data["key"] == key and 0 <= age < MAX_AGE:
+            return data["value"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _store(cache_dir: Path, entry: Path, key: list[Any], value: Any) -> None:
+    tmp: Path | None = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Written to a temporary file first, so that a concurrent build never
+        # reads a partial entry
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_dir, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as f:
+            tmp = Path(f.name)
+            json.dump({"key": key, "time": time.time(), "value": value}, f)
+        tmp.replace(entry)
+    except OSError as err:
+        logger.debug("Could not write program cache entry {}: {}", entry, err)
+        if tmp is not None:
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+        return
+
+    # Entries of replaced programs are never read again
+    now = time.time()
+    for old in cache_dir.iterdir():
+        with contextlib.suppress(OSError):
+            if now - old.stat().st_mtime > MAX_AGE:
+                old.unlink()
+
+
+def cached_probe(
+    kind: str,
+    path: str | os.PathLike[str],
+    probe: Callable[[], Any],
+    *,
+    extra: Sequence[str] = (),
+) -> Any:
+    """
+    Return what ``probe`` (which runs the program at ``path``) returns, cached
+    across builds as JSON under ``kind`` and ``extra`` (anything else the
+    result depends on). A changed program is probed again. A None result (a
+    failed probe, which may be temporary) is not cached.
+    """
+    cache_dir = get_program_cache_dir()
+    identity = _program_identity(path) if cache_dir is not None else None
+    if cache_dir is None or identity is None:
+        return probe()
+
+    key = [__version__, kind, *identity, *extra]
+    digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+    entry = cache_dir / f"{digest}.json"
+    value = _load(entry, key)
+    if value is not None:
+        logger.debug("Using cached {} probe of {}", kind, path)
+        return value
+
+    value = probe()
+    if value is not None:
+        _store(cache_dir, entry, key, value)
+    return value
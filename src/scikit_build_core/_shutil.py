@@ -1,30 +1,116 @@
 from __future__ import annotations
 
-__lazy_modules__ = {f"{__spec__.parent}._logging", "subprocess", "typing"}
-
+__lazy_modules__ = {
+    f"{__spec__.parent}._logging",
+    "contextlib",
+    "pathlib",
+    "shutil",
+    "subprocess",
+    "tempfile",
+    "threading",
+    "typing",
+}
+
+import contextlib
 import dataclasses
 import os
+import shutil
+import stat
 import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
 from typing import ClassVar
 
 from ._logging import logger
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Generator, Iterable
 
-__all__ = ["Run"]
+__all__ = [
+    "ProcessGroup",
+    "Run",
+    "private_temp_dir",
+    "remove_in_background",
+    "temporary_directory",
+]
 
 
 def __dir__() -> list[str]:
     return __all__
 
 
+class ProcessGroup:
+    """
+    Processes started by :class:`Run` in this group, which :meth:`kill` stops
+    from any thread. Nothing is started in the group after that.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._processes: set[subprocess.Popen[str]] = set()
+        self._killed = False
+
+    def kill(self) -> None:
+        with self._lock:
+            self._killed = True
+            processes = list(self._processes)
+        for process in processes:
+            with contextlib.suppress(OSError):
+                process.kill()
+
+    def run(
+        self,
+        args: list[str],
+        *,
+        capture: bool,
+        env: dict[str, str] | None,
+        cwd: os.PathLike[str] | None,
+        timeout: float | None,
+    ) -> subprocess.CompletedProcess[str]:
+        """
+        Like :func:`subprocess.run` with ``check=True``. Raises
+        :class:`subprocess.SubprocessError` if the group was killed.
+        """
+        pipe = subprocess.PIPE if capture else None
+        with self._lock:
+            if self._killed:
+                msg = f"Not running {args[0]}, the process group was killed"
+                raise subprocess.SubprocessError(msg)
+            process = subprocess.Popen(
+                args, text=True, stdout=pipe, stderr=pipe, env=env, cwd=cwd
+            )
+            self._processes.add(process)
+        try:
+            with process:
+                try:
+                    stdout, stderr = process.communicate(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.communicate()
+                    raise
+        finally:
+            with self._lock:
+                self._processes.discard(process)
+        if self._killed:
+            msg = f"{args[0]} was killed with its process group"
+            raise subprocess.SubprocessError(msg)
+        if process.returncode:
+            raise subprocess.CalledProcessError(
+                process.returncode, args, stdout, stderr
+            )
+        return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+
+
 @dataclasses.dataclass
 class Run:
     env: dict[str, str] | None = None
     cwd: os.PathLike[str] | None = None
     timeout: float | None = None
+    # Runs the command in this group, so it can be killed from another thread
+    group: ProcessGroup | None = None
 
     # Stores last printout, for cleaner debug logging
     _prev_env: ClassVar[dict[str, str]] = {}
@@ -69,6 +155,15 @@ class Run:
 
         logger.info("RUN: {}", " ".join(options))
 
+        if self.group is not None:
+            return self.group.run(
+                options,
+                capture=capture,
+                env=self.env,
+                cwd=self.cwd,
+                timeout=self.timeout,
+            )
+
         return subprocess.run(
             options,
             text=True,
@@ -86,3 +181,71 @@ class Run:
         if k in self._prev_env and k not in self.env:
             return "-"
         return " "
+
+
+def private_temp_dir(name: str, *, create: bool = True) -> Path | None:
+    """
+    A directory in the system temporary directory that only the current user
+    can use, created if needed (and ``create`` is set), or None if it cannot be
+    used safely (it must be a real directory owned by us).
+    """
+    # The temporary directory is already per-user on Windows
+    if hasattr(os, "getuid"):
+        name += f"-{os.getuid()}"
+    path = Path(tempfile.gettempdir()) / name
+    try:
+        if create:
+            path.mkdir(mode=0o700, exist_ok=True)
+        info = path.lstat()
+    except OSError:
+        return None
+    if not stat.S_ISDIR(info.st_mode):
+        return None
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        return None
+    return path
+
+
+def _reap_trash(trash: Path) -> None:
+    # Also removes what earlier runs left when they exited mid-removal. A
+    # concurrent build may be removing the same trees; errors are ignored.
+    for entry in trash.iterdir():
+        shutil.rmtree(entry, ignore_errors=True)
+    logger.debug("Emptied {}", trash)
+
+
+def remove_in_background(path: Path) -> None:
+    """
+    Remove the directory tree ``path`` without waiting for it.
+
+    The tree is renamed into a trash directory and removed on a daemon
+    thread, along with anything earlier runs left in the trash (a daemon
+    thread stops when the process exits). If the tree cannot be moved (for
+    example, a file in it is still open on Windows), it is removed now.
+    """
+    trash = private_temp_dir("scikit-build-core-trash")
+    if trash is not None:
+        target = trash / f"{path.name}-{os.getpid()}-{time.time_ns()}"
+        try:
+            path.rename(target)
+        except OSError:
+            pass
+        else:
+            threading.Thread(
+                target=_reap_trash, args=(trash,), name="skbuild-trash", daemon=True
+            ).start()
+            return
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def temporary_directory() -> Generator[Path, None, None]:
+    """
+    Like :class:`tempfile.TemporaryDirectory`, but the directory is removed
+    with :func:`remove_in_background`.
+    """
+    tmpdir = Path(tempfile.mkdtemp())
+    try:
+        yield tmpdir
+    finally:
+        remove_in_background(tmpdir)
@@ -3,9 +3,12 @@ from __future__ import annotations
 __lazy_modules__ = {
     "argparse",
     "json",
+    "packaging",
+    "packaging.tags",
     "pathlib",
     "scikit_build_core._compat",
     "scikit_build_core._logging",
+    "scikit_build_core.build._wheelfile",
     "scikit_build_core.builder",
     "scikit_build_core.builder._load_provider",
     "typing",
@@ -16,6 +19,8 @@ import json
 from pathlib import Path
 from typing import Any, Literal, get_args
 
+from packaging.tags import parse_tag
+
 from scikit_build_core._compat import tomllib
 from scikit_build_core._logging import rich_error, rich_warning
 from scikit_build_core.build import (
@@ -23,6 +28,7 @@ from scikit_build_core.build import (
     get_requires_for_build_sdist,
     get_requires_for_build_wheel,
 )
+from scikit_build_core.build._wheelfile import retag_wheel
 from scikit_build_core.builder._load_provider import (
     BuildState,
     process_dynamic_metadata,
@@ -77,6 +83,25 @@ def get_requires(mode: Literal["sdist", "wheel", "editable"]) -> None:
     print(json.dumps(sorted(set(requires)), indent=2))
 
 
+def main_retag(args: argparse.Namespace, /) -> None:
+    """Copy a wheel under new tags, without recompressing its contents."""
+    if not args.tag and not args.build_tag:
+        rich_error("Nothing to retag; pass {bold}--tag{normal} or {bold}--build-tag")
+    outdir = args.outdir or args.wheel.parent
+    for tag in args.tag or [None]:
+        for build_tag in args.build_tag or [None]:
+            try:
+                path = retag_wheel(
+                    args.wheel,
+                    outdir,
+                    tags=parse_tag(tag) if tag else None,
+                    build_tag=build_tag,
+                )
+            except ValueError as err:
+                rich_error(str(err))
+            print(path)
+
+
 def populate_parser(parser: argparse.ArgumentParser, /) -> None:
     """Add the ``build`` subcommands to an existing parser."""
     subparsers = parser.add_subparsers(required=True, help="Commands")
@@ -107,6 +132,35 @@ def populate_parser(parser: argparse.ArgumentParser, /) -> None:
     )
 
 
+def populate_wheel_parser(parser: argparse.ArgumentParser, /) -> None:
+    """Add the ``wheel`` subcommands to an existing parser."""
+    subparsers = parser.add_subparsers(required=True, help="Commands")
+    retag = subparsers.add_parser(
+        "retag",
+        help="Copy a wheel under new tags",
+        description="Writes a copy of a wheel for each tag set and build tag given. Files are copied still compressed; only WHEEL and RECORD are rewritten.",
+    )
+    retag.set_defaults(func=main_retag)
+    retag.add_argument("wheel", type=Path, help="The wheel to retag")
+    retag.add_argument(
+        "--tag",
+        action="append",
+        default=[],
+        help="A (compressed) tag set, like cp39-abi3-manylinux_2_17_x86_64.manylinux2014_x86_64; can be repeated",
+    )
+    retag.add_argument(
+        "--build-tag",
+        action="append",
+        default=[],
+        help="A build tag, like 1; can be repeated",
+    )
+    retag.add_argument(
+        "--outdir",
+        type=Path,
+        help="The directory to write wheels to (defaults to the directory of the input wheel)",
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         prog="python -m scikit_build_core.build",
@@ -4,25 +4,31 @@ __lazy_modules__ = {
     "contextlib",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}._logging",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}.format",
+    f"{__spec__.parent}._matcher",
     "pathlib",
-    "pathspec",
+    "subprocess",
     "typing",
 }
 
 import contextlib
 import os
+import subprocess
 from pathlib import Path
 from typing import Literal
 
-import pathspec
-
 from .._logging import logger
 from ..format import pyproject_format
+from ._matcher import path_matcher
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from collections.abc import Generator, Sequence
 
+    from ._matcher import PathMatcher
+
+    # (directory, spec) pairs for the nested .gitignore files, outermost first
+    NestedExcludes = tuple[tuple[Path, PathMatcher], ...]
+
 __all__ = ["each_unignored_file", "symlink_escapes"]
 
 EXCLUDE_LINES = [
@@ -67,6 +73,28 @@ def symlink_escapes(path: Path) -> bool:
     return joined == os.pardir or joined.startswith(os.pardir + os.sep)
 
 
+def _read_gitignore(dirpath: Path) -> PathMatcher:
+    return path_matcher(
+        (dirpath / ".gitignore").read_text(encoding="utf-8").splitlines()
+    )
+
+
+def _ancestor_excludes(starting_path: Path) -> NestedExcludes:
+    """
+    The nested ignore files in the directories between the project root (the
+    current directory, whose ignore file is read separately) and
+    ``starting_path``, which are not visited by the walk.
+    """
+    if starting_path.is_absolute() or os.pardir in starting_path.parts:
+        return ()
+    parents = [p for p in reversed(starting_path.parents) if p != Path()]
+    return tuple(
+        (parent, _read_gitignore(parent))
+        for parent in parents
+        if parent.joinpath(".gitignore").is_file()
+    )
+
+
 def _dir_key(dirstr: str) -> tuple[int, int] | None:
     """
     Identify a directory by its (device, inode) pair so that symlink loops can
@@ -86,7 +114,7 @@ def each_unignored_file(
     exclude: Sequence[str] = (),
     build_dir: str = "",
     *,
-    mode: Literal["classic", "default", "manual", "explicit"],
+    mode: Literal["classic", "default", "manual", "explicit", "git"],
     resolve_symlinks: Literal["all", "external", "none", "classic"] = "all",
     yield_loop_symlinks: bool = False,
 ) -> Generator[Path, None, None]:
@@ -103,7 +131,25 @@ def each_unignored_file(
     A directory symlink loop is never followed; with ``yield_loop_symlinks``
     the link itself is yielded (the SDist stores it as a symlink member),
     otherwise it is skipped (wheel copying can't represent it).
+
+    The "git" mode lists the files git knows about instead of walking the
+    tree, falling back to "default" outside of a git work tree.
     """
+    if mode == "git":
+        git_files = _git_files(starting_path, ignored=bool(include))
+        if git_files is not None:
+            yield from _each_git_file(
+                git_files,
+                include,
+                exclude,
+                build_dir,
+                resolve_symlinks=resolve_symlinks,
+                yield_loop_symlinks=yield_loop_symlinks,
+            )
+            return
+        logger.debug("Not in a git work tree, walking {} instead.", starting_path)
+        mode = "default"
+
     # "manual" and "explicit" do not consult git ignore files at all.
     reads_gitignore = mode in {"classic", "default"}
     explicit = mode == "explicit"
@@ -115,18 +161,13 @@ def each_unignored_file(
             with contextlib.suppress(*ignore_errs), gi.open(encoding="utf-8") as f:
                 global_exclude_lines += f.readlines()
 
-    nested_excludes = (
-        {
-            Path(dirpath): pathspec.GitIgnoreSpec.from_lines(
-                (Path(dirpath) / filename).read_text(encoding="utf-8").splitlines()
-            )
-            for dirpath, _, filenames in os.walk(".")
-            for filename in filenames
-            if filename == ".gitignore" and dirpath != "."
-        }
-        if reads_gitignore
-        else {}
-    )
+    # The nested ignore files that apply in each visited directory: those of
+    # its ancestors and its own, outermost first. They are read as the walk
+    # enters each directory, so only the ancestors' are ever checked.
+    nested_excludes: dict[str, NestedExcludes] = {}
+    # Ignore files between the project root and the starting path
+    base_excludes = _ancestor_excludes(starting_path) if reads_gitignore else ()
+    real_root = os.path.realpath(os.curdir)
 
     exclude_build_dir = build_dir.format(**pyproject_format(dummy=True))
 
@@ -134,11 +175,11 @@ def each_unignored_file(
         [*EXCLUDE_LINES, exclude_build_dir] if exclude_build_dir else EXCLUDE_LINES
     )
 
-    user_exclude_spec = pathspec.GitIgnoreSpec.from_lines(list(exclude))
-    global_exclude_spec = pathspec.GitIgnoreSpec.from_lines(global_exclude_lines)
-    builtin_exclude_spec = pathspec.GitIgnoreSpec.from_lines(exclude_lines)
+    user_exclude_spec = path_matcher(list(exclude))
+    global_exclude_spec = path_matcher(global_exclude_lines)
+    builtin_exclude_spec = path_matcher(exclude_lines)
 
-    include_spec = pathspec.GitIgnoreSpec.from_lines(include)
+    include_spec = path_matcher(include)
 
     # Map each visited directory to the set of (device, inode) keys of itself
     # and all of its ancestors along the walk path. A circular symlink
@@ -154,7 +195,9 @@ def each_unignored_file(
         key = _dir_key(dirstr)
         # os.path.dirname keeps the exact string form os.walk uses for keys
         # (e.g. "" for the root), unlike Path.parent which maps it to ".".
-        parent_keys = ancestor_keys.get(os.path.dirname(dirstr), frozenset())  # noqa: PTH120
+        parent_dirstr = os.path.dirname(dirstr)  # noqa: PTH120
+        parent_keys = ancestor_keys.get(parent_dirstr, frozenset())
+        parent_excludes = nested_excludes.get(parent_dirstr, base_excludes)
         if key is not None and key in parent_keys:
             logger.debug(
                 "Not descending into {} because it is an ancestor of itself "
@@ -170,13 +213,12 @@ def each_unignored_file(
                 yield_loop_symlinks
                 and dirpath.is_symlink()
                 and match_path(
-                    dirpath.parent,
                     dirpath,
                     include_spec,
                     global_exclude_spec,
                     builtin_exclude_spec,
                     user_exclude_spec,
-                    nested_excludes,
+                    parent_excludes,
                     is_path=False,
                     explicit=explicit,
                 )
@@ -185,6 +227,18 @@ def each_unignored_file(
             continue
         if key is not None:
             ancestor_keys[dirstr] = parent_keys | {key}
+        dir_excludes = parent_excludes
+        if (
+            reads_gitignore
+            and ".gitignore" in filenames
+            and os.path.normpath(dirstr) != os.curdir
+            # Like git, ignore files are only read in the project's own
+            # directories, not in ones reached through a symlink
+            and os.path.realpath(dirstr)
+            == os.path.join(real_root, os.path.normpath(dirstr))  # noqa: PTH118
+        ):
+            dir_excludes = (*parent_excludes, (dirpath, _read_gitignore(dirpath)))
+        nested_excludes[dirstr] = dir_excludes
         if resolve_symlinks in {"none", "external"}:
             for dname in list(dirs):
                 dpath = dirpath / dname
@@ -197,13 +251,12 @@ def each_unignored_file(
                 # Store the link itself as a member instead of descending.
                 dirs.remove(dname)
                 if match_path(
-                    dirpath,
                     dpath,
                     include_spec,
                     global_exclude_spec,
                     builtin_exclude_spec,
                     user_exclude_spec,
-                    nested_excludes,
+                    dir_excludes,
                     is_path=False,
                     explicit=explicit,
                 ):
@@ -211,13 +264,12 @@ def each_unignored_file(
         if mode != "classic":
             for dname in list(dirs):
                 if not match_path(
-                    dirpath,
                     dirpath / dname,
                     include_spec,
                     global_exclude_spec,
                     builtin_exclude_spec,
                     user_exclude_spec,
-                    nested_excludes,
+                    dir_excludes,
                     is_path=True,
                     explicit=explicit,
                 ):
@@ -232,19 +284,144 @@ def each_unignored_file(
         for fn in filenames:
             path = dirpath / fn
             if match_path(
-                dirpath,
                 path,
                 include_spec,
                 global_exclude_spec,
                 builtin_exclude_spec,
                 user_exclude_spec,
-                nested_excludes,
+                dir_excludes,
                 is_path=False,
                 explicit=explicit,
             ):
                 yield path
 
 
+def _git_ls_files(prefix: str, *args: str) -> list[str] | None:
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", *args, "--", "pyproject.toml", prefix],
+            check=False,
+            capture_output=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return [os.fsdecode(name) for name in result.stdout.split(b"\0") if name]
+
+
+def _git_files(
+    starting_path: Path, *, ignored: bool
+) -> tuple[list[Path], list[Path]] | None:
+    """
+    The files below ``starting_path`` known to git, relative to the project
+    root (which must be the current directory): the tracked ones that still
+    exist and the untracked ones that are not ignored. With ``ignored``, the
+    ignored files are listed too (separately), so that include patterns can
+    opt them back in.
+
+    Returns None if the project isn't part of a git work tree; this includes
+    a project ignored by an enclosing repository, such as an SDist unpacked
+    inside a checkout.
+    """
+    prefix = Path(os.path.relpath(starting_path)).as_posix()
+    if prefix == os.pardir or prefix.startswith(f"{os.pardir}/"):
+        return None
+    files = _git_ls_files(prefix, "--cached", "--others", "--exclude-standard")
+    if files is None or "pyproject.toml" not in files:
+        return None
+    ignored_files = (
+        _git_ls_files(prefix, "--others", "--ignored", "--exclude-standard") or []
+        if ignored
+        else []
+    )
+
+    # git lists paths relative to the current directory, with "/" separators
+    strip = 0 if prefix == "." else len(prefix) + 1
+
+    def below(names: list[str]) -> list[Path]:
+        # Unmerged files are listed once per stage
+        return [
+            starting_path / name[strip:]
+            for name in dict.fromkeys(names)
+            if (not strip or name.startswith(f"{prefix}/")) and os.path.lexists(name)
+        ]
+
+    return below(files), below(ignored_files)
+
+
+def _each_git_file(
+    git_files: tuple[list[Path], list[Path]],
+    include: Sequence[str],
+    exclude: Sequence[str],
+    build_dir: str,
+    *,
+    resolve_symlinks: Literal["all", "external", "none", "classic"],
+    yield_loop_symlinks: bool,
+) -> Generator[Path, None, None]:
+    """
+    Filter the files listed by git. git has already applied the ignore files,
+    so only the include, exclude, and built-in patterns are checked here;
+    ignored files are only kept if an include pattern matches them.
+
+    git records directory symlinks as links and submodules as single entries;
+    these are walked like in the "default" mode, unless ``resolve_symlinks``
+    keeps the link.
+    """
+    exclude_build_dir = build_dir.format(**pyproject_format(dummy=True))
+    exclude_lines = (
+        [*EXCLUDE_LINES, exclude_build_dir] if exclude_build_dir else EXCLUDE_LINES
+    )
+    include_spec = path_matcher(include)
+    no_exclude_spec = path_matcher([])
+    builtin_exclude_spec = path_matcher(exclude_lines)
+    user_exclude_spec = path_matcher(list(exclude))
+
+    def matches(path: Path, *, is_path: bool) -> bool:
+        return match_path(
+            path,
+            include_spec,
+            no_exclude_spec,
+            builtin_exclude_spec,
+            user_exclude_spec,
+            (),
+            is_path=is_path,
+        )
+
+    files, ignored_files = git_files
+    for path in [*files, *filter(include_spec.match_file, ignored_files)]:
+        if not path.is_dir():
+            if matches(path, is_path=False):
+                yield path
+            continue
+        if path.is_symlink():
+            link_dir = path.parent.resolve()
+            target = path.resolve()
+            if target == link_dir or target in link_dir.parents:
+                # Points to an ancestor, a loop for the walker too
+                if yield_loop_symlinks and matches(path, is_path=False):
+                    yield path
+                continue
+            if resolve_symlinks == "none" or (
+                resolve_symlinks == "external" and not symlink_escapes(path)
+            ):
+                if matches(path, is_path=False):
+                    yield path
+                continue
+        if matches(path, is_path=True) or any(
+            _include_may_match_below(p, path.as_posix().strip("/")) for p in include
+        ):
+            yield from each_unignored_file(
+                path,
+                include,
+                exclude,
+                build_dir,
+                mode="default",
+                resolve_symlinks=resolve_symlinks,
+                yield_loop_symlinks=yield_loop_symlinks,
+            )
+
+
 def _include_may_match_below(pattern: str, dirpath: str) -> bool:
     """
     Decide whether an include ``pattern`` could match any file beneath the
@@ -277,13 +454,12 @@ def _include_may_match_below(pattern: str, dirpath: str) -> bool:
 
 
 def match_path(
-    dirpath: Path,
     p: Path,
-    include_spec: pathspec.GitIgnoreSpec,
-    global_exclude_spec: pathspec.GitIgnoreSpec,
-    builtin_exclude_spec: pathspec.GitIgnoreSpec,
-    user_exclude_spec: pathspec.GitIgnoreSpec,
-    nested_excludes: dict[Path, pathspec.GitIgnoreSpec],
+    include_spec: PathMatcher,
+    global_exclude_spec: PathMatcher,
+    builtin_exclude_spec: PathMatcher,
+    user_exclude_spec: PathMatcher,
+    nested_excludes: NestedExcludes,
     *,
     is_path: bool,
     explicit: bool = False,
@@ -363,11 +539,9 @@ def match_path(
         )
         return False
 
-    # Check relative ignores (Python 3.9's is_relative_to workaround)
-    for np, nex in nested_excludes.items():
-        if (dirpath == np or np in dirpath.parents) and (
-            c := nex.check_file(p.relative_to(np))
-        ).include:
+    # Check relative ignores (only those of directories containing p are given)
+    for np, nex in nested_excludes:
+        if (c := nex.check_file(p.relative_to(np))).include:
             assert c.index is not None
             logger.debug(
                 "Excluding {} {} because it is explicitly excluded by nested ignore with {!r}.",
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+__lazy_modules__ = {
+    f"{(__spec__.parent or '').rsplit('.', 1)[0]}._compat.os",
+    "collections",
+    "concurrent.futures",
+    "struct",
+    "zlib",
+}
+
+import collections
+import io
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from .._compat.os import process_cpu_count
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from pathlib import Path
+
+__all__ = ["ParallelGzipFile"]
+
+
+def __dir__() -> list[str]:
+    return __all__
+
+
+# Input is split into blocks of this size, compressed independently (like
+# pigz). The split does not depend on the number of threads, so neither does
+# the output.
+BLOCK_SIZE = 128 * 1024
+# Each block is primed with the end of the previous one (the deflate window),
+# so splitting costs almost nothing in size.
+DICT_SIZE = 32 * 1024
+# RFC 1952 member header: magic, method (deflate), flags, mtime, extra flags, OS
+GZIP_HEADER = struct.Struct("<2sBBIBB")
+FNAME = 0x08
+
+
+def _compress_block(data: bytes, *, zdict: bytes, level: int, last: bool) -> bytes:
+    compressor = (
+        zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=zdict)
+        if zdict
+        else zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    )
+    # A sync flush ends the block on a byte boundary without marking the
+    # deflate stream as finished, so the next block can be appended to it
+    return compressor.compress(data) + compressor.flush(
+        zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    )
+
+
+class ParallelGzipFile(io.RawIOBase):
+    """
+    A write-only gzip file, compressed on a thread pool.
+
+    The output is a single standard gzip member (readable by :mod:`gzip` and
+    :mod:`tarfile`), made of blocks of :data:`BLOCK_SIZE` deflated in
+    parallel. The header matches :class:`gzip.GzipFile`'s. The bytes only
+    depend on the data, ``compresslevel`` and ``mtime``, not on ``jobs`` (0
+    uses the number of CPUs).
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        *,
+        compresslevel: int = 9,
+        mtime: float | None = None,
+        jobs: int = 0,
+    ) -> None:
+        super().__init__()
+        self._jobs = jobs or process_cpu_count() or 1
+        self._level = compresslevel
+        self._file = filename.open("wb")
+        self._pool = ThreadPoolExecutor(max_workers=self._jobs)
+        self._pending: collections.deque[Future[bytes]] = collections.deque()
+        self._buffer = bytearray()
+        self._zdict = b""
+        self._crc = 0
+        self._size = 0
+
+        name = filename.name.removesuffix(".gz")
+        xfl = 2 if compresslevel == 9 else 4 if compresslevel == 1 else 0
+        self._file.write(
+            GZIP_HEADER.pack(
+                b"\x1f\x8b",
+                zlib.DEFLATED,
+                FNAME,
+                int(time.time() if mtime is None else mtime),
+                xfl,
+                255,
+            )
+        )
+        self._file.write(name.encode("latin-1") + b"\0")
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._size
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        view = memoryview(data)
+        self._crc = zlib.crc32(view, self._crc)
+        self._size += len(view)
+        self._buffer += view
+        while len(self._buffer) >= BLOCK_SIZE:
+            block = bytes(self._buffer[:BLOCK_SIZE])
+            del self._buffer[:BLOCK_SIZE]
+            self._submit(block, last=False)
+        return len(view)
+
+    def _submit(self, block: bytes, *, last: bool) -> None:
+        self._pending.append(
+            self._pool.submit(
+                _compress_block,
+                block,
+                zdict=self._zdict,
+                level=self._level,
+                last=last,
+            )
+        )
+        self._zdict = block[-DICT_SIZE:]
+        # Keep a bounded number of blocks in flight, written in order
+        while len(self._pending) > 2 * self._jobs:
+            self._file.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._submit(bytes(self._buffer), last=True)
+            self._buffer.clear()
+            while self._pending:
+                self._file.write(self._pending.popleft().result())
+            self._file.write(struct.pack("<2I", self._crc, self._size & 0xFFFFFFFF))
+        finally:
+            self._pool.shutdown()
+            self._file.close()
+            super().close()
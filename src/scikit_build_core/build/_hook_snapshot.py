@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+__lazy_modules__ = {
+    f"{(__spec__.parent or '').rsplit('.', 1)[0]}._logging",
+    f"{(__spec__.parent or '').rsplit('.', 1)[0]}._shutil",
+    "contextlib",
+    "hashlib",
+    "json",
+    "pathlib",
+    "pickle",
+    "time",
+}
+
+import contextlib
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+
+from .. import __version__
+from .._logging import logger
+from .._shutil import private_temp_dir
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .._vendor.pyproject_metadata import StandardMetadata
+    from ..settings.skbuild_model import ScikitBuildSettings
+
+__all__ = ["dump_snapshot", "load_snapshot", "snapshot_path", "write_snapshot"]
+
+
+def __dir__() -> list[str]:
+    return __all__
+
+
+# Snapshots are consumed by the next hook; anything older was abandoned
+MAX_SNAPSHOT_AGE = 60 * 60
+
+
+def snapshot_path(
+    pyproject_bytes: bytes,
+    config_settings: Mapping[str, list[str] | str] | None,
+    *,
+    editable: bool,
+    create: bool = True,
+) -> Path | None:
+    """
+    Where ``prepare_metadata_for_build_{wheel,editable}`` leaves its resolved
+    settings and metadata for the matching build hook, or None if they cannot
+    be shared.
+
+    Frontends run each hook in a new subprocess of the frontend; the path is
+    keyed by the frontend's process, the working directory, the environment,
+    ``pyproject.toml`` and the config settings, so a snapshot is only found by
+    hooks of the same build. Without ``create``, None is also returned if no
+    snapshot was ever saved.
+    """
+    snapshot_dir = private_temp_dir("scikit-build-core-hooks", create=create)
+    if snapshot_dir is None:
+        return None
+    inputs = {
+        "scikit-build-core": __version__,
+        "python": sys.executable,
+        "parent": os.getppid(),
+        "cwd": str(Path.cwd()),
+        "editable": editable,
+        "pyproject": hashlib.sha256(pyproject_bytes).hexdigest(),
+        "config_settings": config_settings or {},
+        "env": dict(os.environ),
+    }
+    key = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+    return snapshot_dir / f"{key}.pickle"
+
+
+def dump_snapshot(settings: ScikitBuildSettings, metadata: StandardMetadata) -> bytes:
+    """
+    Serialize a snapshot, to be written with :func:`write_snapshot` once the
+    hook succeeds.
+    """
+    return pickle.dumps((settings, metadata))
+
+
+def write_snapshot(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    logger.debug("Saved settings and metadata for the build hook in {}", path)
+    now = time.time()
+    for old in path.parent.glob("*.pickle"):
+        with contextlib.suppress(OSError):
+            if now - old.stat().st_mtime > MAX_SNAPSHOT_AGE:
+                old.unlink()
+
+
+def load_snapshot(
+    path: Path,
+) -> tuple[ScikitBuildSettings, StandardMetadata] | None:
+    """
+    Load and remove the snapshot left by the prepare-metadata hook, if any.
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    path.unlink(missing_ok=True)
+    # Written by this user, in a directory only this user can access
+    settings, metadata = pickle.loads(data)  # noqa: S301
+    logger.debug("Reusing settings and metadata from {}", path)
+    return settings, metadata
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+__lazy_modules__ = {"pathspec", "pathspec.util"}
+
+import functools
+import re
+
+import pathspec
+import pathspec.util
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Sequence
+
+__all__ = ["PathMatcher", "path_matcher"]
+
+
+def __dir__() -> list[str]:
+    return __all__
+
+
+# Named groups (pathspec marks directory matches with one) can't be repeated
+# in a combined regex
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+# Shared leading parts of pathspec's regexes, longest first
+_PREFIXES = ("^(?:.+/)?", "^")
+
+# Bounds the memory used by the directory verdicts of a long-lived matcher
+MAX_CACHED_DIRS = 100_000
+
+
+def _combine(regexes: Sequence[str]) -> re.Pattern[str]:
+    """
+    One regex matching if any of ``regexes`` does. Patterns matching at any
+    depth share a ``(?:.+/)?`` prefix, which is factored out: the regex
+    engine then skips most alternatives by their first character, instead of
+    backtracking through the prefix of each one.
+    """
+    groups: dict[str, list[str]] = {}
+    for regex in regexes:
+        prefix = next((p for p in _PREFIXES if regex.startswith(p)), "")
+        groups.setdefault(prefix, []).append(regex[len(prefix) :])
+    return re.compile(
+        "|".join(
+            f"{prefix}(?:{'|'.join(f'(?:{r})' for r in rest)})"
+            for prefix, rest in groups.items()
+        )
+    )
+
+
+class PathMatcher:
+    """
+    A :class:`pathspec.GitIgnoreSpec` with faster checks, giving the same
+    results. All the patterns are compiled into one regex, so a path no
+    pattern matches (most of them) is rejected in a single search. If no
+    pattern is negated, a directory's verdict is cached and applies to
+    everything below it, so an excluded subtree costs one check.
+    """
+
+    def __init__(self, lines: Sequence[str]) -> None:
+        self.spec = pathspec.GitIgnoreSpec.from_lines(lines)
+        self.patterns = self.spec.patterns
+        regexes = [
+            _NAMED_GROUP.sub("(?:", pattern.regex.pattern)
+            for pattern in self.patterns
+            if pattern.include is not None and pattern.regex is not None
+        ]
+        self._any = _combine(regexes) if regexes else None
+        # Without negations, nothing below an excluded directory is included
+        self._prunable = not any(p.include is False for p in self.patterns)
+        self._dirs: dict[str, pathspec.util.CheckResult[str]] = {}
+
+    def check_file(
+        self, file: str | os.PathLike[str]
+    ) -> pathspec.util.CheckResult[str | os.PathLike[str]]:
+        if self._any is None:
+            return pathspec.util.CheckResult(file, None, None)
+        norm = pathspec.util.normalize_file(file)
+        if self._prunable:
+            parent = self._check_dir(norm.rpartition("/")[0])
+            if parent is not None and parent.include:
+                return pathspec.util.CheckResult(file, include=True, index=parent.index)
+        if self._any.match(norm) is None:
+            return pathspec.util.CheckResult(file, None, None)
+        result = self.spec.check_file(norm)
+        return pathspec.util.CheckResult(file, result.include, result.index)
+
+    def match_file(self, file: str | os.PathLike[str]) -> bool:
+        return bool(self.check_file(file).include)
+
+    def _check_dir(self, norm: str) -> pathspec.util.CheckResult[str] | None:
+        """
+        Check the directory ``norm`` (normalized, without a trailing slash)
+        as ``norm/``; the first excluded ancestor's verdict is reused.
+        """
+        if not norm:
+            return None
+        if (cached := self._dirs.get(norm)) is not None:
+            return cached
+        result = self._check_dir(norm.rpartition("/")[0])
+        if result is None or not result.include:
+            dirname = f"{norm}/"
+            result = (
+                self.spec.check_file(dirname)
+                if self._any is not None and self._any.match(dirname)
+                else pathspec.util.CheckResult(dirname, None, None)
+            )
+        if len(self._dirs) >= MAX_CACHED_DIRS:
+            self._dirs.clear()
+        self._dirs[norm] = result
+        return result
+
+
+@functools.lru_cache(maxsize=128)
+def _path_matcher(lines: tuple[str, ...]) -> PathMatcher:
+    return PathMatcher(lines)
+
+
+def path_matcher(lines: Sequence[str]) -> PathMatcher:
+    """
+    The matcher for these gitignore-style lines, shared by every part of the
+    build that checks the same patterns, so that they are only compiled once
+    and the cached directory verdicts are reused.
+    """
+    return _path_matcher(tuple(lines))
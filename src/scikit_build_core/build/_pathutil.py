@@ -2,24 +2,31 @@ from __future__ import annotations
 
 __lazy_modules__ = {
     f"{__spec__.parent}._file_processor",
+    f"{__spec__.parent}._matcher",
+    "concurrent.futures",
     "pathlib",
-    "pathspec",
+    "shutil",
     "typing",
 }
 
 import importlib.machinery
 import os
 import re
+import shutil
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePosixPath, PureWindowsPath
 from typing import Literal
 
-import pathspec
-
+from .._compat.os import process_cpu_count
 from ._file_processor import EXCLUDE_LINES, each_unignored_file
+from ._matcher import path_matcher
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from collections.abc import Generator, Iterator, Mapping, Sequence
+    from collections.abc import Set as AbstractSet
 
 __all__ = [
     "NON_PLATLIB_REBUILD_MSG",
@@ -34,8 +41,14 @@ __all__ = [
     "resolve_from_sdist_force_include",
     "resolve_wheel_tree",
     "scantree",
+    "stage_file",
+    "sync_file",
+    "sync_files",
 ]
 
+# From linux/fs.h; fcntl only has it on Python 3.12+
+_FICLONE = 0x40049409
+
 # Importable suffixes for this interpreter, in order.
 _MODULE_SUFFIXES = (
     *importlib.machinery.EXTENSION_SUFFIXES,
@@ -57,6 +70,141 @@ def scantree(path: Path) -> Generator[Path, None, None]:
             yield Path(entry)
 
 
+def _clone_file(source: os.PathLike[str] | str, target: Path) -> bool:
+    """
+    Create ``target`` as a reflink (copy-on-write clone) of ``source``. Returns
+    False if the filesystem does not support it.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    with Path(source).open("rb") as src, target.open("wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), getattr(fcntl, "FICLONE", _FICLONE), src.fileno())
+        except OSError:
+            cloned = False
+        else:
+            cloned = True
+    if not cloned:
+        target.unlink()
+    return cloned
+
+
+def _copy_file_range(source: os.PathLike[str] | str, target: Path) -> None:
+    """
+    Copy the contents of ``source`` to ``target`` with ``copy_file_range``,
+    which stays in the kernel (and can share blocks on some filesystems).
+    Falls back to a plain copy if it is not available.
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copyfile(source, target)
+        return
+    with Path(source).open("rb") as src, target.open("wb") as dst:
+        try:
+            while os.copy_file_range(src.fileno(), dst.fileno(), 1 << 30):
+                pass
+        except OSError:
+            # Not supported here (e.g. across filesystems); start over
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+            shutil.copyfileobj(src, dst)
+
+
+def stage_file(
+    source: os.PathLike[str] | str,
+    target: Path,
+    *,
+    mode: Literal["copy", "link", "auto"] = "copy",
+) -> None:
+    """
+    Copy ``source`` to ``target`` with its metadata, like :func:`shutil.copy2`.
+
+    With ``mode="auto"``, the file is cloned if the filesystem supports it,
+    and copied with ``copy_file_range`` otherwise. ``mode="link"`` also tries a
+    hard link before copying; the caller must not modify ``target`` in place
+    afterwards. A hard-linked ``target`` shares the metadata of ``source``.
+    """
+    if mode == "copy":
+        shutil.copy2(source, target)
+        return
+    # A clone or link must not write through an existing file at ``target``,
+    # which could itself be a link to a source file
+    target.unlink(missing_ok=True)
+    if not _clone_file(source, target):
+        if mode == "link":
+            try:
+                os.link(source, target)
+            except OSError:
+                pass
+            else:
+                return
+        _copy_file_range(source, target)
+    shutil.copystat(source, target)
+
+
+def sync_file(
+    source: os.PathLike[str] | str,
+    target: Path,
+    *,
+    mode: Literal["copy", "link", "auto"] = "copy",
+) -> bool:
+    """
+    Copy ``source`` to ``target`` with :func:`stage_file`, unless ``target``
+    already has the same size and mtime (as a previous copy leaves it). Returns
+    True if the file was copied.
+    """
+    src = Path(source).stat()
+    try:
+        dst = target.lstat()
+    except FileNotFoundError:
+        pass
+    else:
+        if stat.S_ISREG(dst.st_mode) and (dst.st_size, dst.st_mtime_ns) == (
+            src.st_size,
+            src.st_mtime_ns,
+        ):
+            return False
+        if stat.S_ISLNK(dst.st_mode):
+            # copy2 would write through the link
+            target.unlink()
+    stage_file(source, target, mode=mode)
+    return True
+
+
+def sync_files(
+    mapping: Mapping[str, str],
+    *,
+    mode: Literal["copy", "link", "auto"] = "copy",
+    jobs: int = 1,
+) -> set[Path]:
+    """
+    Sync each source file in ``mapping`` to its target with :func:`sync_file`,
+    on a thread pool of ``jobs`` threads (0 uses the number of CPUs). Returns
+    the absolute target paths.
+    """
+    # If two sources map to the same target, the last one wins, as in a loop
+    targets = {Path(target): source for source, target in mapping.items()}
+    for target in targets:
+        target.parent.mkdir(exist_ok=True, parents=True)
+
+    jobs = min(jobs or process_cpu_count() or 1, len(targets))
+    if jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            # list() re-raises the first error
+            list(
+                pool.map(
+                    lambda item: sync_file(item[1], item[0], mode=mode),
+                    targets.items(),
+                )
+            )
+    else:
+        for target, source in targets.items():
+            sync_file(source, target, mode=mode)
+    return {target.absolute() for target in targets}
+
+
 def path_to_module(path: Path) -> str:
     name, _, _ = path.name.partition(".")
     assert name, f"Empty name should be filtered by is_trackable first, got {path}"
@@ -74,13 +222,30 @@ def packages_to_file_mapping(
     src_exclude: Sequence[str],
     target_exclude: Sequence[str],
     build_dir: str,
-    mode: Literal["classic", "default", "manual", "explicit"],
+    mode: Literal["classic", "default", "manual", "explicit", "git"],
+    staged: AbstractSet[Path] | None = None,
+    since_ns: int = 0,
 ) -> dict[str, str]:
     """
-    This will output a mapping of source files to target files.
+    This will output a mapping of source files to target files. Files already
+    in ``platlib_dir`` (installed by CMake) are left out.
+
+    In a persistent staging tree, pass the absolute paths CMake installed in
+    this build as ``staged``, and its start time as ``since_ns``. Any other
+    existing file written before then was copied by an earlier build, so it is
+    mapped again, for :func:`sync_file` to compare with its source.
     """
     mapping = {}
-    exclude_spec = pathspec.GitIgnoreSpec.from_lines(target_exclude)
+    exclude_spec = path_matcher(target_exclude)
+
+    def installed_by_cmake(target_path: Path) -> bool:
+        if not target_path.is_file():
+            return False
+        if staged is None or target_path.absolute() in staged:
+            return True
+        # Written by install(CODE) in this build, not in the manifest
+        return target_path.stat().st_mtime_ns >= since_ns
+
     for package_str, source_str in packages.items():
         package_dir = Path(package_str)
         source_dir = Path(source_str)
@@ -91,7 +256,7 @@ def packages_to_file_mapping(
         if source_dir.is_file():
             if not exclude_spec.match_file(package_dir):
                 target_path = platlib_dir / package_dir
-                if not target_path.is_file():
+                if not installed_by_cmake(target_path):
                     mapping[str(source_dir)] = str(target_path)
             continue
 
@@ -110,7 +275,9 @@ def packages_to_file_mapping(
         ):
             rel_path = filepath.relative_to(source_dir)
             target_path = platlib_dir / package_dir / rel_path
-            if not exclude_spec.match_file(rel_path) and not target_path.is_file():
+            if not exclude_spec.match_file(rel_path) and not installed_by_cmake(
+                target_path
+            ):
                 mapping[str(filepath)] = str(target_path)
 
     return mapping
@@ -313,7 +480,7 @@ def iter_force_include(
     if src.is_file():
         yield src, base / dest
     elif src.is_dir():
-        exclude_spec = pathspec.GitIgnoreSpec.from_lines(EXCLUDE_LINES)
+        exclude_spec = path_matcher(EXCLUDE_LINES)
         for filepath in scantree(src):
             rel_path = filepath.relative_to(src)
             if not exclude_spec.match_file(rel_path):
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+__lazy_modules__ = {"collections", "concurrent.futures", "pathlib", "stat"}
+
+import collections
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from concurrent.futures import Future
+    from typing import TypeVar
+
+    _S = TypeVar("_S")
+    _T = TypeVar("_T")
+
+__all__ = ["ordered_map", "read_ahead"]
+
+
+def __dir__() -> list[str]:
+    return __all__
+
+
+# Reading ahead waits on the file system, not the CPU, so this does not
+# depend on the number of CPUs. It bounds the requests in flight.
+READ_AHEAD_THREADS = 8
+
+
+def ordered_map(
+    pool: ThreadPoolExecutor,
+    func: Callable[[_S], _T],
+    items: Iterable[_S],
+    *,
+    window: int,
+) -> Iterator[_T]:
+    """
+    Like ``pool.map``, but keeps at most ``window`` results in flight, so a slow
+    consumer doesn't pile up every finished result in memory.
+    """
+    pending: collections.deque[Future[_T]] = collections.deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(func, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _regular_file_size(path: str | os.PathLike[str]) -> int | None:
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return None
+    return st.st_size if stat.S_ISREG(st.st_mode) else None
+
+
+def _read(path: str | os.PathLike[str], size: int) -> bytes | None:
+    try:
+        with Path(path).open("rb") as f:
+            data = f.read(size + 1)
+    except OSError:
+        return None
+    # Changed since it was stat'd; keeps the memory bound strict
+    return data if len(data) == size else None
+
+
+def read_ahead(
+    paths: Sequence[str | os.PathLike[str]],
+    *,
+    max_bytes: int,
+    threads: int = READ_AHEAD_THREADS,
+) -> Iterator[bytes | None]:
+    """
+    Yield the contents of each of ``paths``, in order, while the following
+    files are stat'd and read on a thread pool. This hides the per-file
+    latency of network file systems from a consumer that handles one file at
+    a time.
+
+    At most ``max_bytes`` are held for files not consumed yet. None is yielded
+    instead of the contents for anything that isn't a regular file, can't be
+    read, or is larger than ``max_bytes`` on its own; the consumer then handles
+    that path as it would without reading ahead. Following symlinks, like
+    :func:`open`.
+    """
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        sizes = ordered_map(pool, _regular_file_size, paths, window=4 * threads)
+        pending: collections.deque[tuple[Future[bytes | None] | None, int]] = (
+            collections.deque()
+        )
+        in_flight = 0
+        for path, stat_size in zip(paths, sizes):
+            size = (
+                stat_size if stat_size is not None and stat_size <= max_bytes else None
+            )
+            needed = size or 0
+            # Make room; the oldest files are the ones consumed next
+            while pending and (
+                len(pending) >= 4 * threads or in_flight + needed > max_bytes
+            ):
+                future, done_size = pending.popleft()
+                in_flight -= done_size
+                yield future.result() if future is not None else None
+            future = pool.submit(_read, path, size) if size is not None else None
+            pending.append((future, needed))
+            in_flight += needed
+        while pending:
+            future, _ = pending.popleft()
+            yield future.result() if future is not None else None
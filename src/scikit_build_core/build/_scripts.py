@@ -4,6 +4,7 @@ __lazy_modules__ = {"contextlib"}
 
 import contextlib
 import re
+import stat
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
@@ -35,6 +36,13 @@ def process_script_dir(script_dir: Path) -> None:
             if match:
                 content = [f"#!python{match.group(1) or ''}\n", *file_iter]
         if content:
+            info = item.stat()
+            if info.st_nlink > 1:
+                # Hard linked to its source (wheel.staging = "link"); rewrite
+                # a new file instead of the source
+                item.unlink()
+                item.touch()
+                item.chmod(stat.S_IMODE(info.st_mode))
             # newline="\n" keeps the rewritten shebang on LF on every platform;
             # the default text mode would emit CRLF on Windows, which is wrong in
             # a "#!" line and would make the wheel script bytes platform-dependent.
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+__lazy_modules__ = {
+    "json",
+    f"{(__spec__.parent or '').rsplit('.', 1)[0]}._logging",
+}
+
+import json
+
+from .._logging import logger
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+    from typing import Any
+
+__all__ = ["log_size_report", "size_report", "write_size_report"]
+
+
+def __dir__() -> list[str]:
+    return __all__
+
+
+def _entry(path: str, size: int, compressed_size: int, **extra: int) -> dict[str, Any]:
+    return {
+        "path": path,
+        "size": size,
+        "compressed_size": compressed_size,
+        "ratio": round(compressed_size / size, 4) if size else 1.0,
+        **extra,
+    }
+
+
+def size_report(
+    wheelpath: Path, members: Iterable[tuple[str, int, int]]
+) -> dict[str, Any]:
+    """
+    Summarize the (arcname, size, compressed size) of each member of a wheel.
+    Directory totals include everything below them; files and directories are
+    listed largest (compressed) first.
+    """
+    files = []
+    directories: dict[str, list[int]] = {}
+    for arcname, size, compressed_size in members:
+        files.append(_entry(arcname, size, compressed_size))
+        parts = arcname.split("/")[:-1]
+        for i in range(1, len(parts) + 1):
+            totals = directories.setdefault("/".join(parts[:i]) + "/", [0, 0, 0])
+            totals[0] += size
+            totals[1] += compressed_size
+            totals[2] += 1
+
+    def largest_first(entry: dict[str, Any]) -> tuple[int, str]:
+        return -entry["compressed_size"], entry["path"]
+
+    return {
+        **_entry(
+            wheelpath.name,
+            sum(f["size"] for f in files),
+            sum(f["compressed_size"] for f in files),
+        ),
+        "wheel_size": wheelpath.stat().st_size,
+        "files": sorted(files, key=largest_first),
+        "directories": sorted(
+            (
+                _entry(path, size, compressed_size, files=count)
+                for path, (size, compressed_size, count) in directories.items()
+            ),
+            key=largest_first,
+        ),
+    }
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def log_size_report(report: dict[str, Any], *, top: int = 10) -> None:
+    """Log the totals and the largest files and directories at INFO level."""
+    # The ratio is of the members alone; the file also holds the zip headers
+    logger.info(
+        "Wheel size: {} ({} of members compressed from {}, {:.0%})",
+        _format_size(report["wheel_size"]),
+        _format_size(report["compressed_size"]),
+        _format_size(report["size"]),
+        report["ratio"],
+    )
+    for key in ("files", "directories"):
+        if not report[key]:
+            continue
+        logger.info("Largest {} (compressed, uncompressed, ratio):", key)
+        for entry in report[key][:top]:
+            logger.info(
+                "  {:>10} {:>10} {:>5.0%}  {}",
+                _format_size(entry["compressed_size"]),
+                _format_size(entry["size"]),
+                entry["ratio"],
+                entry["path"],
+            )
+
+
+def write_size_report(report: dict[str, Any], wheelpath: Path) -> Path:
+    """Write the report as ``<wheel name>.size-report.json`` next to the wheel."""
+    path = wheelpath.with_name(f"{wheelpath.stem}.size-report.json")
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return path
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+__lazy_modules__ = {
+    f"{(__spec__.parent or '').rsplit('.', 1)[0]}._logging",
+    f"{__spec__.parent}._file_processor",
+    f"{__spec__.parent}._pathutil",
+    "contextlib",
+    "dataclasses",
+    "hashlib",
+    "importlib",
+    "json",
+    "pathlib",
+    "platform",
+    "shutil",
+    "sysconfig",
+    "threading",
+    "typing",
+}
+
+import contextlib
+import dataclasses
+import hashlib
+import importlib
+import json
+import os
+import platform
+import shutil
+import sys
+import sysconfig
+import threading
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+from .. import __version__
+from .._logging import logger, rich_error
+from ._file_processor import each_unignored_file
+from ._pathutil import iter_force_include, resolve_from_sdist_force_include
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from ..cmake import CMake
+    from ..settings.skbuild_model import ScikitBuildSettings
+
+__all__ = [
+    "LocalWheelCache",
+    "WheelCacheBackend",
+    "get_wheel_cache_backends",
+    "wheel_cache_key",
+]
+
+
+def __dir__() -> list[str]:
+    return __all__
+
+
+# Environment variables read by compilers or CMake that can change the wheel,
+# besides any starting with these prefixes
+BUILD_ENV_VARS = frozenset(
+    {
+        "AR",
+        "ARCHFLAGS",
+        "CC",
+        "CFLAGS",
+        "CPPFLAGS",
+        "CUDACXX",
+        "CUDAFLAGS",
+        "CXX",
+        "CXXFLAGS",
+        "FC",
+        "FFLAGS",
+        "LDFLAGS",
+        "MACOSX_DEPLOYMENT_TARGET",
+        "SDKROOT",
+        "SOURCE_DATE_EPOCH",
+        "_PYTHON_HOST_PLATFORM",
+    }
+)
+BUILD_ENV_PREFIXES = ("CMAKE_", "SKBUILD_")
+
+# The cache locations and build parallelism do not change what is built
+_CACHE_ENV_PREFIX = "SKBUILD_WHEEL_BUILD_CACHE_"
+_IGNORED_ENV_VARS = frozenset(
+    {
+        "CMAKE_BUILD_PARALLEL_LEVEL",
+        "SKBUILD_NO_PROGRAM_CACHE",
+        "SKBUILD_PROGRAM_CACHE_DIR",
+    }
+)
+
+# Compilers CMake finds by default, if not set in the environment
+_DEFAULT_COMPILERS = {"CC": "cc", "CXX": "c++"} if os.name != "nt" else {"CXX": "cl"}
+
+
+@runtime_checkable
+class WheelCacheBackend(Protocol):
+    """
+    A store for built wheels. An entry is the set of files written next to a
+    wheel (the wheel and its ``.metadata`` and size report files, if enabled),
+    keyed by :func:`wheel_cache_key`.
+    """
+
+    def get(self, key: str, folder: Path) -> list[str] | None:
+        """
+        Copy the files cached under ``key`` into ``folder``, returning their
+        names, or None if there is no entry.
+        """
+
+    def put(self, key: str, files: Sequence[Path]) -> None:
+        """
+        Store ``files`` under ``key``.
+        """
+
+
+@dataclasses.dataclass(frozen=True)
+class LocalWheelCache:
+    """
+    A wheel cache in a local directory; each entry is a directory named after
+    its key. The least recently used entries are removed above ``max_size``.
+    """
+
+    path: Path
+    max_size: int
+
+    def get(self, key: str, folder: Path) -> list[str] | None:
+        entry = self.path / key
+        try:
+            files = sorted(entry.iterdir())
+        except FileNotFoundError:
+            return None
+        # The mtime marks the last use (atime is often not updated)
+        with contextlib.suppress(OSError):
+            os.utime(entry)
+        for file in files:
+            shutil.copy2(file, folder / file.name)
+        return [file.name for file in files]
+
+    def put(self, key: str, files: Sequence[Path]) -> None:
+        entry = self.path / key
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp = self.path / f".{key}.{os.getpid()}.{threading.get_ident()}"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir()
+        for file in files:
+            shutil.copy2(file, tmp / file.name)
+        try:
+            # Atomic, so concurrent builds sharing a cache never see partial
+            # entries; if another build stored this key first, keep that one
+            tmp.rename(entry)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.prune()
+
+    def prune(self) -> None:
+        entries = []
+        for entry in self.path.iterdir():
+            if entry.name.startswith("."):
+                continue
+            with contextlib.suppress(OSError):
+                size = sum(file.stat().st_size for file in entry.iterdir())
+                entries.append((entry.stat().st_mtime, size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+
+def get_wheel_cache_backends(settings: ScikitBuildSettings) -> list[WheelCacheBackend]:
+    """
+    The configured wheel caches, in lookup order: the local directory, then
+    the ``wheel.build-cache.backend`` one.
+    """
+    cache_settings = settings.wheel.build_cache
+    backends: list[WheelCacheBackend] = []
+    if cache_settings.dir:
+        backends.append(
+            LocalWheelCache(
+                Path(cache_settings.dir).expanduser().resolve(),
+                cache_settings.max_size * 1024 * 1024,
+            )
+        )
+    if cache_settings.backend:
+        module_name, _, attr = cache_settings.backend.partition(":")
+        if not attr:
+            rich_error(
+                f"wheel.build-cache.backend must be 'module:object', got {cache_settings.backend!r}"
+            )
+        try:
+            factory = getattr(importlib.import_module(module_name), attr)
+        except Exception as err:  # noqa: BLE001
+            rich_error(
+                f"wheel.build-cache.backend {cache_settings.backend!r} could not be loaded: {err}"
+            )
+        try:
+            backend = factory()
+        except Exception as err:  # noqa: BLE001
+            rich_error(
+                f"wheel.build-cache.backend {cache_settings.backend!r} failed: {err}"
+            )
+        if not isinstance(backend, WheelCacheBackend):
+            rich_error(
+                f"wheel.build-cache.backend {cache_settings.backend!r} did not return a wheel cache backend"
+            )
+        backends.append(backend)
+    return backends
+
+
+def _file_digest(path: Path) -> bytes:
+    sha = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha.update(chunk)
+    return sha.digest()
+
+
+def _settings_fingerprint(settings: ScikitBuildSettings) -> object:
+    data = dataclasses.asdict(settings)
+    del data["wheel"]["build_cache"]
+    return data
+
+
+def _compiler_fingerprint(env: Mapping[str, str]) -> dict[str, object]:
+    """
+    Identify the compilers by path, size and modification time, which change
+    when a compiler is upgraded, without running them.
+    """
+    compilers: dict[str, object] = {}
+    for var in ("CC", "CXX", "FC", "CUDACXX"):
+        name = env.get(var, _DEFAULT_COMPILERS.get(var, ""))
+        # May include arguments (like "gcc -m32"), which are in the env part
+        exe = shutil.which(name.split()[0]) if name.strip() else None
+        if exe is None:
+            continue
+        st = Path(exe).resolve().stat()
+        compilers[var] = [str(Path(exe).resolve()), st.st_size, st.st_mtime_ns]
+    return compilers
+
+
+def _source_files(settings: ScikitBuildSettings) -> Iterable[Path]:
+    assert settings.sdist.inclusion_mode is not None
+    return each_unignored_file(
+        Path(),
+        include=settings.sdist.include,
+        exclude=settings.sdist.exclude,
+        build_dir=settings.build_dir,
+        mode=settings.sdist.inclusion_mode,
+    )
+
+
+def _force_include_files(settings: ScikitBuildSettings) -> Iterable[Path]:
+    """
+    The files ``wheel.force-include`` adds, which may be outside the project
+    (so not among the source files). A missing source is left for the build
+    to report.
+    """
+    for source in settings.wheel.force_include:
+        resolved = resolve_from_sdist_force_include(
+            source, settings.sdist.force_include
+        )
+        with contextlib.suppress(FileNotFoundError):
+            for src_file, _ in iter_force_include(resolved, ".", Path()):
+                yield src_file
+
+
+def wheel_cache_key(
+    settings: ScikitBuildSettings,
+    *,
+    version: str,
+    tags: str,
+    cmake: CMake | None,
+    env: Mapping[str, str],
+) -> str:
+    """
+    Fingerprint everything a wheel build depends on: the source files that
+    would go into the SDist and the ``wheel.force-include`` files, the
+    settings (except the cache's own), the project version, the wheel tags,
+    the Python and CMake in use, the compilers, and the environment variables
+    that affect a build.
+    """
+    hasher = hashlib.sha256()
+    for path in sorted(_source_files(settings), key=lambda p: p.as_posix()):
+        hasher.update(path.as_posix().encode() + b"\0" + _file_digest(path))
+    for path in sorted(_force_include_files(settings), key=lambda p: p.as_posix()):
+        hasher.update(path.as_posix().encode() + b"\0" + _file_digest(path))
+
+    inputs = {
+        "scikit-build-core": __version__,
+        "settings": _settings_fingerprint(settings),
+        "version": version,
+        "tags": tags,
+        "python": [sys.version, sysconfig.get_platform(), platform.machine()],
+        # Not the path: CMake is often installed into a temporary build env
+        "cmake": str(cmake.version) if cmake else None,
+        "compilers": _compiler_fingerprint(env),
+        "env": {
+            k: v
+            for k, v in sorted(env.items())
+            if (k in BUILD_ENV_VARS or k.startswith(BUILD_ENV_PREFIXES))
+            and not k.startswith(_CACHE_ENV_PREFIX)
+            and k not in _IGNORED_ENV_VARS
+        },
+    }
+    hasher.update(json.dumps(inputs, sort_keys=True, default=str).encode())
+    key = hasher.hexdigest()
+    logger.debug("Wheel cache key: {}", key)
+    return key
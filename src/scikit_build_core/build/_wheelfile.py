@@ -2,37 +2,74 @@ from __future__ import annotations
 
 __lazy_modules__ = {
     "base64",
+    "concurrent",
+    "concurrent.futures",
+    "contextlib",
     "csv",
     "datetime",
     "email",
     "email.message",
+    "email.parser",
+    f"{(__spec__.parent or '').rsplit('.', 1)[0]}._compat.os",
+    f"{(__spec__.parent or '').rsplit('.', 1)[0]}._logging",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}._reproducible",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}._variants",
+    f"{(__spec__.parent or '').rsplit('.', 1)[0]}._vendor.pyproject_metadata",
+    f"{__spec__.parent}._matcher",
+    f"{__spec__.parent}._prefetch",
     "hashlib",
+    "importlib",
+    "importlib.util",
     "io",
+    "itertools",
+    "marshal",
+    "packaging",
+    "packaging.tags",
+    "packaging.version",
     "pathlib",
-    "pathspec",
+    "shutil",
+    "struct",
+    "tempfile",
+    "threading",
     "zipfile",
+    "zlib",
 }
 
 import base64
+import contextlib
 import csv
 import dataclasses
 import datetime
+import functools
 import hashlib
+import importlib.util
 import io
+import itertools
+import marshal
 import os
+import shutil
 import stat
+import struct
+import sys
+import tempfile
+import threading
 import time
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from email.message import Message
+from email.parser import BytesParser
 from email.policy import EmailPolicy
 from pathlib import Path
+from typing import IO
 from zipfile import ZipInfo
 
-import pathspec
+from packaging.tags import Tag, interpreter_name, interpreter_version
+from packaging.version import Version
 
 from .. import __version__
+from .._compat.os import process_cpu_count
+from .._logging import logger
 from .._reproducible import (
     MAX_TIMESTAMP,
     MIN_TIMESTAMP,
@@ -41,25 +78,293 @@ from .._reproducible import (
     parse_source_date_epoch,
 )
 from .._variants import VARIANT_DIST_INFO_FILENAME
+from .._vendor.pyproject_metadata import StandardMetadata
+from ._matcher import path_matcher
+from ._prefetch import ordered_map, read_ahead
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
     from collections.abc import Set as AbstractSet
 
-    from packaging.tags import Tag
-
     from .._compat.typing import Self
-    from .._vendor.pyproject_metadata import StandardMetadata
+    from ._matcher import PathMatcher
 
 EMAIL_POLICY = EmailPolicy(max_line_length=0, mangle_from_=False, utf8=True)
 
+# Files are read, hashed and compressed in chunks of this size, so memory use
+# does not grow with the size of the largest file.
+CHUNK_SIZE = 1024 * 1024
+# Compressed output of a member waiting to be written is kept in memory up to
+# this size, then spills to a temporary file.
+SPOOL_SIZE = 8 * CHUNK_SIZE
+# Zip local file header (APPNOTE 4.3.7); zipfile's own copy is not public.
+# The file name and extra field lengths are the last two fields.
+LOCAL_FILE_HEADER = struct.Struct("<4s2B4HL2L2H")
+LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+# Leading bytes of a file trial-compressed to decide if it is worth compressing
+SAMPLE_SIZE = 64 * 1024
+
 
 def _b64encode(data: bytes) -> bytes:
     return base64.urlsafe_b64encode(data).rstrip(b"=")
 
 
-__all__ = ["WheelMetadata", "WheelWriter"]
+def _is_incompressible(sample: bytes) -> bool:
+    # Already compressed data (archives, images, ...) barely shrinks, even at
+    # the fastest level.
+    return bool(sample) and len(zlib.compress(sample, 1)) > 0.95 * len(sample)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Compressed:
+    """A member compressed ahead of time, ready to be appended verbatim."""
+
+    data: IO[bytes]
+    compress_type: int
+    compress_size: int
+    crc: int
+    size: int
+    digest: bytes
+
+
+@dataclasses.dataclass(frozen=True)
+class _MemberCache:
+    """
+    Content-addressed store of deflated members, kept across rebuilds. Entries
+    are keyed by the sha256 of the uncompressed file and the compression
+    settings; the least recently used entries are evicted above ``max_size``.
+    """
+
+    path: Path
+    max_size: int
+    level: int = 6
+
+    @property
+    def key(self) -> str:
+        # The raw-deflate stream depends on the level and on the zlib in use,
+        # so both are part of the key; a hit is byte-identical to recompressing.
+        return f"deflate{self.level}-zlib{zlib.ZLIB_RUNTIME_VERSION}"
+
+    def _entry(self, digest: bytes) -> Path:
+        name = digest.hex()
+        return self.path / name[:2] / f"{name}-{self.key}"
+
+    def get(self, digest: bytes) -> IO[bytes] | None:
+        entry = self._entry(digest)
+        try:
+            f = entry.open("rb")
+        except FileNotFoundError:
+            return None
+        # The mtime marks the last use (atime is often not updated)
+        with contextlib.suppress(OSError):
+            os.utime(entry)
+        return f
+
+    def put(self, digest: bytes, data: IO[bytes]) -> None:
+        entry = self._entry(digest)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}")
+        with tmp.open("wb") as f:
+            shutil.copyfileobj(data, f, CHUNK_SIZE)
+        # Atomic, so concurrent builds sharing a cache never see partial entries
+        tmp.replace(entry)
+        data.seek(0)
+
+    def prune(self) -> None:
+        entries = []
+        for entry in self.path.glob("*/*"):
+            with contextlib.suppress(OSError):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            # May be in use by a concurrent build on Windows; retried next time
+            with contextlib.suppress(OSError):
+                entry.unlink()
+                total -= size
+
+
+def _read_and_compress(
+    filename: str,
+    *,
+    level: int = 6,
+    store: bool = False,
+    store_incompressible: bool = False,
+    cache: _MemberCache | None = None,
+) -> _Compressed:
+    with Path(filename).open("rb") as f:
+        head = f.read(CHUNK_SIZE)
+        store = store or (
+            store_incompressible and _is_incompressible(head[:SAMPLE_SIZE])
+        )
+        if store or cache is not None:
+            # Hash in a separate pass; stored members are then copied straight
+            # from the file, and cache hits from the cache.
+            sha = hashlib.sha256()
+            crc = size = 0
+            chunk = head
+            while chunk:
+                sha.update(chunk)
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                chunk = f.read(CHUNK_SIZE)
+            digest = sha.digest()
+            if store:
+                data = Path(filename).open("rb")  # noqa: SIM115
+                return _Compressed(data, zipfile.ZIP_STORED, size, crc, size, digest)
+            assert cache is not None
+            cached = cache.get(digest)
+            if cached is not None:
+                compress_size = os.fstat(cached.fileno()).st_size
+                return _Compressed(
+                    cached, zipfile.ZIP_DEFLATED, compress_size, crc, size, digest
+                )
+            f.seek(0)
+            head = f.read(CHUNK_SIZE)
+
+        # Same raw-deflate stream zipfile produces for ZIP_DEFLATED (deflate
+        # output does not depend on how the input is chunked), so precompressed
+        # members are byte-identical to writestr output.
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        sha = hashlib.sha256()
+        crc = size = compress_size = 0
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)  # noqa: SIM115
+        chunk = head
+        while chunk:
+            sha.update(chunk)
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            compress_size += spool.write(compressor.compress(chunk))
+            chunk = f.read(CHUNK_SIZE)
+    compress_size += spool.write(compressor.flush())
+    spool.seek(0)
+    if cache is not None:
+        cache.put(sha.digest(), spool)
+    return _Compressed(
+        spool, zipfile.ZIP_DEFLATED, compress_size, crc, size, sha.digest()
+    )
+
+
+def _scan_wheel_dir(
+    root: Path,
+    exclude_spec: PathMatcher,
+    exclude_exempt: AbstractSet[Path] = frozenset(),
+) -> list[tuple[str, os.stat_result]]:
+    """
+    Walk ``root`` once, returning the files to package as sorted (Posix
+    relpath, stat) pairs. The order and filtering match the sorted
+    ``root.glob("**/*")`` this replaces: symlinked directories are not entered,
+    and ``.dist-info`` entries and bytecode are skipped. Directories excluded by
+    ``exclude_spec`` are not entered at all when no exempt file is inside.
+    """
+    # A negated pattern can re-include a file below an excluded directory, so
+    # then every file has to be matched on its own.
+    prune = not any(pattern.include is False for pattern in exclude_spec.patterns)
+    files: list[tuple[str, os.stat_result]] = []
+
+    def walk(directory: str, prefix: str) -> None:
+        with os.scandir(directory) as it:
+            # Same order as sorting Paths (by parts, case-folded on Windows)
+            entries = sorted(it, key=lambda entry: os.path.normcase(entry.name))
+        for entry in entries:
+            if entry.name.endswith(".dist-info"):
+                continue
+            relpath = f"{prefix}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if prune and exclude_spec.match_file(f"{relpath}/"):
+                    resolved = Path(entry.path).resolve()
+                    if not any(p.is_relative_to(resolved) for p in exclude_exempt):
+                        continue
+                walk(entry.path, f"{relpath}/")
+            elif entry.is_file():
+                if len(entry.name) > 4 and entry.name[-4:] in {".pyc", ".pyo"}:
+                    continue
+                # Force-included files are exempt from wheel.exclude.
+                if (
+                    exclude_spec.match_file(relpath)
+                    and Path(entry.path).resolve() not in exclude_exempt
+                ):
+                    continue
+                files.append((relpath, entry.stat()))
+
+    if root.is_dir() and not any(x.endswith(".dist-info") for x in root.parts):
+        walk(os.fspath(root), "")
+    return files
+
+
+def _read_raw(wheel: Path, info: ZipInfo) -> IO[bytes]:
+    """Open ``wheel`` positioned at the still-compressed data of ``info``."""
+    f = wheel.open("rb")
+    f.seek(info.header_offset)
+    header = LOCAL_FILE_HEADER.unpack(f.read(LOCAL_FILE_HEADER.size))
+    if header[0] != LOCAL_FILE_HEADER_SIGNATURE:
+        f.close()
+        msg = f"Bad local file header for {info.filename} in {wheel}"
+        raise zipfile.BadZipFile(msg)
+    f.seek(header[-2] + header[-1], os.SEEK_CUR)
+    return f
+
+
+# Read by installers, so they go last (just before RECORD), in this order
+DIST_INFO_TAIL = ("entry_points.txt", VARIANT_DIST_INFO_FILENAME, "WHEEL", "METADATA")
+
+
+def _dist_info_layout(contents: Mapping[str, bytes]) -> list[str]:
+    """
+    Order .dist-info files so installers reading METADATA with an HTTP range
+    request only need the tail of the wheel: other files (licenses, extra
+    metadata) largest first, then ``DIST_INFO_TAIL``. RECORD follows.
+    """
+    tail = [key for key in DIST_INFO_TAIL if key in contents]
+    rest = sorted(
+        contents.keys() - set(tail), key=lambda key: (-len(contents[key]), key)
+    )
+    return [*rest, *tail]
+
+
+# Handing a module to a worker thread costs more than compiling a tiny one
+MIN_FILES_PER_COMPILE_WORKER = 32
+
+
+def _compile_bytecode(source: str, arcname: str) -> bytes | str:
+    """
+    Compile a Python file to an unchecked hash-based pyc (PEP 552), returning
+    its contents, or the error message if it does not compile. The pyc does
+    not depend on the file's mtime or location, so it is reproducible; the
+    importer fixes up the filename in the code object when loading it.
+    """
+    data = Path(source).read_bytes()
+    try:
+        # Not the running interpreter's level: under -O, that would strip
+        # asserts from a pyc that is loaded without -O
+        code = compile(data, arcname, "exec", dont_inherit=True, optimize=0)
+    except (SyntaxError, ValueError) as err:
+        return str(err)
+    # marshal only emits back-references for objects with other references,
+    # so the bytes would depend on who else holds arcname; a round trip leaves
+    # only the references inside the code object.
+    code = marshal.loads(marshal.dumps(code))  # noqa: S302 (our own data)
+    flags = 0b01  # hash-based, check_source unset
+    return b"".join(
+        (
+            importlib.util.MAGIC_NUMBER,
+            flags.to_bytes(4, "little"),
+            importlib.util.source_hash(data),
+            marshal.dumps(code),
+        )
+    )
+
+
+def _pyc_arcname(arcname: str, cache_tag: str) -> str:
+    directory, _, filename = arcname.rpartition("/")
+    pycache = f"{directory}/__pycache__" if directory else "__pycache__"
+    return f"{pycache}/{filename[:-3]}.{cache_tag}.pyc"
+
+
+__all__ = ["WheelMetadata", "WheelWriter", "retag_wheel"]
 
 
 def __dir__() -> list[str]:
@@ -101,7 +406,22 @@ class WheelWriter:
     variant_label: str = ""
     variant_dist_info_contents: bytes | None = None
     reproducible: bool = False
+    jobs: int = 0
+    cache_dir: Path | None = None
+    cache_max_size: int = 1024 * 1024 * 1024
+    compresslevel: int = 6
+    store: Sequence[str] = ()
+    store_incompressible: bool = False
+    compile_bytecode: bool = False
+    read_ahead: int = 0
     _zipfile: zipfile.ZipFile | None = None
+    # RECORD rows (arcname, urlsafe-b64 sha256, size), collected as members are
+    # written so the finished zip never has to be read back.
+    _records: list[tuple[str, str, int]] = dataclasses.field(default_factory=list)
+    _member_sizes: list[tuple[str, int, int]] = dataclasses.field(default_factory=list)
+    # .dist-info files from build(), written on exit so they end up together
+    # at the end of the zip, see _dist_info_layout.
+    _dist_info: dict[str, bytes] = dataclasses.field(default_factory=dict)
 
     @property
     def name_ver(self) -> str:
@@ -125,6 +445,11 @@ class WheelWriter:
     def wheelpath(self) -> Path:
         return self.folder / f"{self.basename}.whl"
 
+    @property
+    def member_sizes(self) -> list[tuple[str, int, int]]:
+        """The (arcname, size, compressed size) of each member of the written wheel."""
+        return self._member_sizes
+
     @property
     def dist_info(self) -> str:
         return f"{self.name_ver}.dist-info"
@@ -151,6 +476,20 @@ class WheelWriter:
         ) + datetime.timedelta(seconds=timestamp)
         return (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
 
+    def write_metadata_sidecar(self, metadata: bytes | None = None) -> Path:
+        """
+        Write the PEP 658 ``<wheel>.metadata`` file (a copy of METADATA) next to
+        the wheel, so indexes can serve it without opening the wheel.
+        """
+        if metadata is None:
+            metadata = self.dist_info_contents()["METADATA"]
+        path = self.wheelpath.with_name(f"{self.wheelpath.name}.metadata")
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}")
+        tmp.write_bytes(metadata)
+        # Atomic, so an index never serves a partially written file
+        tmp.replace(path)
+        return path
+
     def dist_info_contents(self) -> dict[str, bytes]:
         entry_points = io.StringIO()
         ep = self.metadata.entrypoints.copy()
@@ -220,48 +559,149 @@ class WheelWriter:
         for key in sorted({"data", "headers", "scripts"} & wheel_dirs.keys()):
             plans[key] = wheel_dirs[key]
 
-        exclude_spec = pathspec.GitIgnoreSpec.from_lines(exclude)
+        exclude_spec = path_matcher(exclude)
 
+        members: list[tuple[str, str, os.stat_result]] = []
+        modules: list[tuple[str, str, os.stat_result]] = []
         for key, path in plans.items():
-            for filename in sorted(path.glob("**/*")):
-                if not filename.is_file():
-                    continue
-                if any(x.endswith(".dist-info") for x in filename.parts):
-                    continue
-                if filename.suffix in {".pyc", ".pyo"}:
-                    continue
-                relpath = filename.relative_to(path)
-                # Force-included files are exempt from wheel.exclude.
-                if (
-                    exclude_spec.match_file(relpath)
-                    and filename.resolve() not in exclude_exempt
-                ):
-                    continue
-                target = Path(data_dir) / key / relpath if key else relpath
-                self.write(str(filename), str(target))
-
-        dist_info_contents = self.dist_info_contents()
-        for key, data in dist_info_contents.items():
-            self.writestr(f"{self.dist_info}/{key}", data)
+            for relpath, st in _scan_wheel_dir(path, exclude_spec, exclude_exempt):
+                target = f"{data_dir}/{key}/{relpath}" if key else relpath
+                members.append((f"{path}{os.sep}{relpath}", target, st))
+                if not key and relpath.endswith(".py"):
+                    modules.append(members[-1])
+
+        cache = (
+            None
+            if self.cache_dir is None
+            else _MemberCache(self.cache_dir, self.cache_max_size, self.compresslevel)
+        )
+        jobs = self.jobs or process_cpu_count() or 1
+        if cache is None and (jobs == 1 or len(members) < 2):
+            contents = (
+                read_ahead(
+                    [source for source, _, _ in members], max_bytes=self.read_ahead
+                )
+                if self.read_ahead and len(members) > 1
+                else itertools.repeat(None)
+            )
+            for (source, arcname, st), data in zip(members, contents):
+                with (
+                    io.BytesIO(data) if data is not None else Path(source).open("rb")
+                ) as f:
+                    self._write_file(f, arcname, st)
+        else:
+            # zlib and hashlib release the GIL, so compression scales across
+            # threads; members are still appended one at a time in sorted order.
+            compress = functools.partial(
+                _read_and_compress,
+                level=self.compresslevel,
+                store_incompressible=self.store_incompressible,
+                cache=cache,
+            )
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                compressed = ordered_map(
+                    pool,
+                    lambda member: compress(member[0], store=member[1]),
+                    (
+                        (source, self._store_spec.match_file(arcname))
+                        for source, arcname, _ in members
+                    ),
+                    window=2 * jobs,
+                )
+                for (_, arcname, st), member in zip(members, compressed):
+                    self._write_compressed(self._file_zinfo(arcname, st), member)
+        if cache is not None:
+            cache.prune()
+
+        if self.compile_bytecode:
+            self._write_bytecode(modules, jobs)
+
+        self._dist_info = self.dist_info_contents()
+
+    def _write_bytecode(
+        self, modules: Sequence[tuple[str, str, os.stat_result]], jobs: int
+    ) -> None:
+        """
+        Add a pyc for each module, compiled by the running interpreter. With
+        enough modules, they are compiled on a thread pool, but still written
+        in sorted order. Compiling holds the GIL, so this only helps on a
+        free-threaded Python; a process pool would have to fork this already
+        threaded process, or re-import ``__main__`` in each worker.
+        """
+        cache_tag = sys.implementation.cache_tag
+        if cache_tag is None:
+            logger.warning("This Python cannot cache bytecode, not compiling")
+            return
+        # Other Pythons would never load the pycs (like for a py3-none or
+        # abi3 wheel, or a cross build)
+        interpreter = interpreter_name() + interpreter_version()
+        if any(t.interpreter != interpreter or t.abi == "abi3" for t in self.tags):
+            logger.warning(
+                "Not compiling bytecode for a {} wheel, only used by {}",
+                ".".join(sorted(str(t) for t in self.tags)),
+                interpreter,
+            )
+            return
+        sources = [source for source, _, _ in modules]
+        arcnames = [arcname for _, arcname, _ in modules]
+        jobs = min(jobs, len(modules) // MIN_FILES_PER_COMPILE_WORKER)
+        if jobs > 1:
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(_compile_bytecode, sources, arcnames))
+        else:
+            results = list(map(_compile_bytecode, sources, arcnames))
+        for (_, arcname, st), result in zip(modules, results):
+            if isinstance(result, str):
+                logger.warning("Not compiling {} to bytecode: {}", arcname, result)
+                continue
+            zinfo = self._file_zinfo(_pyc_arcname(arcname, cache_tag), st)
+            zinfo.external_attr = (0o644 | stat.S_IFREG) << 16
+            self.writestr(zinfo, result)
 
     def write(self, filename: str, arcname: str | None = None) -> None:
-        """Write a file to the archive. Paths are normalized to Posix paths."""
-
+        """
+        Write a file to the archive. Paths are normalized to Posix paths. The
+        file is streamed in chunks, so it is never fully held in memory.
+        """
         with Path(filename).open("rb") as f:
-            st = os.fstat(f.fileno())
-            data = f.read()
+            self._write_file(f, arcname or filename, os.fstat(f.fileno()))
 
+    def _write_file(self, f: IO[bytes], arcname: str, st: os.stat_result) -> None:
+        assert self._zipfile is not None
+        sha = hashlib.sha256()
+        size = 0
+        zinfo = self._file_zinfo(arcname, st)
+        assert "\\" not in zinfo.filename, (
+            f"\\ not supported in zip; got {zinfo.filename!r}"
+        )
+        # Known up front, so zipfile makes the same zip64 choice as writestr
+        zinfo.file_size = st.st_size
+        chunk = f.read(CHUNK_SIZE)
+        if self._store_spec.match_file(zinfo.filename) or (
+            self.store_incompressible and _is_incompressible(chunk[:SAMPLE_SIZE])
+        ):
+            zinfo.compress_type = zipfile.ZIP_STORED
+        with self._zipfile.open(zinfo, "w") as dest:
+            while chunk:
+                sha.update(chunk)
+                size += len(chunk)
+                dest.write(chunk)
+                chunk = f.read(CHUNK_SIZE)
+        self._add_record(zinfo.filename, sha.digest(), size)
+
+    def _file_zinfo(self, arcname: str, st: os.stat_result) -> ZipInfo:
         # Zipfiles require Posix paths for the arcname
         zinfo = ZipInfo(
-            (arcname or filename).replace("\\", "/"),
+            arcname.replace("\\", "/"),
             date_time=self.timestamp(st.st_mtime),
         )
         zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo._compresslevel = self.compresslevel  # type: ignore[attr-defined]
         mode = (
             normalize_file_permissions(st.st_mode) if self.reproducible else st.st_mode
         )
         zinfo.external_attr = (stat.S_IMODE(mode) | stat.S_IFMT(st.st_mode)) << 16
-        self.writestr(zinfo, data)
+        return zinfo
 
     def writestr(self, zinfo_or_arcname: str | ZipInfo, data: bytes) -> None:
         """Write bytes (not strings) to the archive."""
@@ -275,12 +715,59 @@ class WheelWriter:
                 date_time=self.timestamp(),
             )
             zinfo.compress_type = zipfile.ZIP_DEFLATED
+            zinfo._compresslevel = self.compresslevel  # type: ignore[attr-defined]
             mode = 0o644 if self.reproducible else 0o664
             zinfo.external_attr = (mode | stat.S_IFREG) << 16
         assert "\\" not in zinfo.filename, (
             f"\\ not supported in zip; got {zinfo.filename!r}"
         )
         self._zipfile.writestr(zinfo, data)
+        self._add_record(zinfo.filename, hashlib.sha256(data).digest(), len(data))
+
+    @functools.cached_property
+    def _store_spec(self) -> PathMatcher:
+        return path_matcher(self.store)
+
+    def _write_compressed(self, zinfo: ZipInfo, member: _Compressed) -> None:
+        """
+        Append an already-compressed member. Mirrors what ``ZipFile.writestr``
+        does for a seekable file, minus the compression, so the archive bytes
+        are identical.
+        """
+        assert self._zipfile is not None
+        assert "\\" not in zinfo.filename, (
+            f"\\ not supported in zip; got {zinfo.filename!r}"
+        )
+        zf = self._zipfile
+        assert zf.fp is not None
+        zinfo.compress_type = member.compress_type
+        zinfo.file_size = member.size
+        zinfo.compress_size = member.compress_size
+        zinfo.CRC = member.crc
+        zinfo.flag_bits = 0
+        # Same zip64 decision zipfile makes when the size is known up front
+        zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+        zf.fp.seek(zf.start_dir)
+        zinfo.header_offset = zf.fp.tell()
+        zf._writecheck(zinfo)  # type: ignore[attr-defined]
+        zf._didModify = True  # type: ignore[attr-defined]
+        zf.fp.write(zinfo.FileHeader(zip64))
+        with member.data:
+            remaining = member.compress_size
+            while remaining:
+                chunk = member.data.read(min(remaining, CHUNK_SIZE))
+                if not chunk:
+                    msg = f"Unexpected end of data for {zinfo.filename}"
+                    raise EOFError(msg)
+                zf.fp.write(chunk)
+                remaining -= len(chunk)
+        zf.start_dir = zf.fp.tell()
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+        self._add_record(zinfo.filename, member.digest, member.size)
+
+    def _add_record(self, arcname: str, digest: bytes, size: int) -> None:
+        self._records.append((arcname, _b64encode(digest).decode("ascii"), size))
 
     def __enter__(self) -> Self:
         if not self.wheelpath.parent.exists():
@@ -289,22 +776,121 @@ class WheelWriter:
         self._zipfile = zipfile.ZipFile(
             self.wheelpath, "w", compression=zipfile.ZIP_DEFLATED
         )
+        self._records = []
         return self
 
     def __exit__(self, *args: object) -> None:
         assert self._zipfile is not None
+        for key in _dist_info_layout(self._dist_info):
+            self.writestr(f"{self.dist_info}/{key}", self._dist_info[key])
+        self._dist_info = {}
         record = f"{self.dist_info}/RECORD"
         data = io.StringIO()
         writer = csv.writer(data, delimiter=",", quotechar='"', lineterminator="\n")
-        for member in self._zipfile.infolist():
-            assert "\\" not in member.filename, (
-                f"Invalid zip contents: {member.filename}"
-            )
-            with self._zipfile.open(member) as f:
-                member_data = f.read()
-            sha = _b64encode(hashlib.sha256(member_data).digest()).decode("ascii")
-            writer.writerow((member.filename, f"sha256={sha}", member.file_size))
+        for filename, sha, size in self._records:
+            assert "\\" not in filename, f"Invalid zip contents: {filename}"
+            writer.writerow((filename, f"sha256={sha}", size))
         writer.writerow((record, "", ""))
         self.writestr(record, data.getvalue().encode("utf-8"))
+        self._member_sizes = [
+            (info.filename, info.file_size, info.compress_size)
+            for info in self._zipfile.infolist()
+        ]
         self._zipfile.close()
         self._zipfile = None
+
+
+def retag_wheel(
+    wheel: Path,
+    folder: Path,
+    *,
+    tags: AbstractSet[Tag] | None = None,
+    build_tag: str | None = None,
+) -> Path:
+    """
+    Write a copy of ``wheel`` into ``folder`` with new tags and/or build tag,
+    returning the path of the new wheel. Members are copied still compressed;
+    only WHEEL and RECORD are rewritten.
+    """
+    with zipfile.ZipFile(wheel) as source:
+        (dist_info,) = {
+            name.split("/")[0]
+            for name in source.namelist()
+            if name.count("/") == 1 and name.endswith(".dist-info/WHEEL")
+        }
+        wheel_file = BytesParser(policy=EMAIL_POLICY).parsebytes(
+            source.read(f"{dist_info}/WHEEL")
+        )
+        records = {
+            row[0]: row[1]
+            for row in csv.reader(
+                io.StringIO(source.read(f"{dist_info}/RECORD").decode("utf-8"))
+            )
+            if row
+        }
+
+        name, version = dist_info.removesuffix(".dist-info").rsplit("-", 1)
+        has_variant = f"{dist_info}/{VARIANT_DIST_INFO_FILENAME}" in records
+        writer = WheelWriter(
+            StandardMetadata(name=name, version=Version(version)),
+            folder,
+            tags=tags or {Tag(*t.split("-")) for t in wheel_file.get_all("Tag", [])},
+            wheel_metadata=WheelMetadata(
+                root_is_purelib=wheel_file["Root-Is-Purelib"] == "true",
+                metadata_version=wheel_file["Wheel-Version"],
+                generator=wheel_file["Generator"],
+                build_tag=wheel_file.get("Build", "")
+                if build_tag is None
+                else build_tag,
+            ),
+            metadata_dir=None,
+            variant_label=wheel.stem.rsplit("-", 1)[-1] if has_variant else "",
+            reproducible=True,
+        )
+        writer.wheel_metadata.tags = writer.tags
+        if writer.dist_info != dist_info:
+            msg = f"Cannot retag {wheel.name}: {dist_info} is not normalized"
+            raise ValueError(msg)
+        if writer.wheelpath.resolve() == wheel.resolve():
+            msg = f"Retagging {wheel.name} would overwrite it"
+            raise ValueError(msg)
+
+        with writer:
+            for info in source.infolist():
+                if info.filename == f"{dist_info}/RECORD":
+                    continue
+                if info.filename == f"{dist_info}/WHEEL":
+                    zinfo = ZipInfo(info.filename, info.date_time)
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    zinfo.external_attr = info.external_attr
+                    writer.writestr(zinfo, writer.wheel_metadata.as_bytes())
+                    continue
+
+                algorithm, _, b64digest = records.get(info.filename, "").partition("=")
+                if algorithm == "sha256":
+                    digest = base64.urlsafe_b64decode(
+                        b64digest + "=" * (-len(b64digest) % 4)
+                    )
+                else:
+                    sha = hashlib.sha256()
+                    with source.open(info) as f:
+                        while chunk := f.read(CHUNK_SIZE):
+                            sha.update(chunk)
+                    digest = sha.digest()
+
+                zinfo = ZipInfo(info.filename, info.date_time)
+                zinfo.create_system = info.create_system
+                zinfo.external_attr = info.external_attr
+                writer._write_compressed(
+                    zinfo,
+                    _Compressed(
+                        _read_raw(wheel, info),
+                        info.compress_type,
+                        info.compress_size,
+                        info.CRC,
+                        info.file_size,
+                        digest,
+                    ),
+                )
+
+    return writer.wheelpath
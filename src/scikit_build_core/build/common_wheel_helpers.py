@@ -11,6 +11,7 @@ configure/build/install. The wheel-assembly side (WheelWriter vs hatchling
 from __future__ import annotations
 
 __lazy_modules__ = {
+    "contextlib",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}._logging",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}.builder.builder",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}.builder.wheel_tag",
@@ -21,6 +22,7 @@ __lazy_modules__ = {
     "sysconfig",
 }
 
+import contextlib
 import os
 import shutil
 import sysconfig
@@ -43,6 +45,7 @@ from ._pathutil import resolve_wheel_tree
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from collections.abc import Mapping
+    from collections.abc import Set as AbstractSet
 
     from packaging.version import Version
 
@@ -54,6 +57,7 @@ __all__ = [
     "build_wheel",
     "configure_wheel",
     "editable_rebuild_options",
+    "find_stale_files",
     "get_build_dir",
     "get_editable_rebuild_dir",
     "get_install_dir",
@@ -62,6 +66,7 @@ __all__ = [
     "install_wheel",
     "prepare_editable_rebuild_dir",
     "prepare_wheel_dirs",
+    "remove_stale_files",
 ]
 
 # A cache-directory tag (https://bford.info/cachedir/) dropped into a user-chosen
@@ -214,7 +219,10 @@ def prepare_editable_rebuild_dir(targetlib_dir: Path, *, guard: bool) -> None:
 
 
 def prepare_wheel_dirs(wheel_root: Path, *, targetlib: TargetLib) -> dict[str, Path]:
-    """Create the staging wheel tree under ``wheel_root`` and return its dirs."""
+    """
+    Create the staging wheel tree under ``wheel_root`` and return its dirs.
+    An existing tree (a persistent staging dir) is reused as is.
+    """
     wheel_dirs = {
         targetlib: wheel_root / targetlib,
         "data": wheel_root / "data",
@@ -224,10 +232,60 @@ def prepare_wheel_dirs(wheel_root: Path, *, targetlib: TargetLib) -> dict[str, P
         "metadata": wheel_root / "metadata",
     }
     for d in wheel_dirs.values():
-        d.mkdir(parents=True)
+        d.mkdir(parents=True, exist_ok=True)
     return wheel_dirs
 
 
+def find_stale_files(
+    wheel_root: Path, staged: AbstractSet[Path], *, since_ns: int
+) -> set[Path]:
+    """
+    Files in a persistent staging tree left over from earlier builds: not in
+    ``staged`` (absolute paths) and not modified since ``since_ns``, which
+    catches files CMake writes without listing them in its install manifest
+    (``install(CODE)``). A couple of seconds of slack covers coarse mtimes.
+    """
+    before_ns = since_ns - 2_000_000_000
+    stale = set()
+
+    def scan(directory: Path) -> None:
+        with os.scandir(directory) as it:
+            for entry in it:
+                path = Path(entry.path).absolute()
+                if entry.is_dir(follow_symlinks=False):
+                    scan(path)
+                elif (
+                    path not in staged
+                    and entry.stat(follow_symlinks=False).st_mtime_ns < before_ns
+                ):
+                    stale.add(path)
+
+    scan(wheel_root)
+    return stale
+
+
+def remove_stale_files(wheel_root: Path, stale: AbstractSet[Path]) -> None:
+    """
+    Remove ``stale`` files from a persistent staging tree, then the directories
+    left empty. The top-level wheel directories are kept.
+    """
+    for path in stale:
+        path.unlink(missing_ok=True)
+
+    def prune(directory: Path) -> None:
+        for path in directory.iterdir():
+            if path.is_dir() and not path.is_symlink():
+                prune(path)
+                with contextlib.suppress(OSError):  # Not empty
+                    path.rmdir()
+
+    for tree in wheel_root.iterdir():
+        if tree.is_dir() and not tree.is_symlink():
+            prune(tree)
+    if stale:
+        logger.info("Removed {} stale files from {}", len(stale), wheel_root)
+
+
 def get_install_dir(
     settings: ScikitBuildSettings,
     *,
@@ -317,16 +375,17 @@ def build_wheel(builder: Builder) -> None:
     builder.build(build_args=[])
 
 
-def install_wheel(builder: Builder, *, install_dir: Path, editable: bool) -> None:
+def install_wheel(builder: Builder, *, install_dir: Path, editable: bool) -> set[Path]:
     """
-    Install the built project into the wheel tree.
+    Install the built project into the wheel tree, returning the installed
+    files CMake reports.
 
     Skipped for editable inplace builds, which load from the build tree directly.
     """
     if editable and builder.settings.editable.mode == "inplace":
-        return
+        return set()
     rich_print("{green}***", "{bold}Installing project into wheel...")
-    builder.install(install_dir)
+    return builder.install(install_dir)
 
 
 def build_install_extra_build_types(
@@ -340,15 +399,17 @@ def build_install_extra_build_types(
     version: Version,
     editable: bool,
     extra_cache_entries: Mapping[str, str | Path] | None = None,
-) -> None:
+) -> set[Path]:
     """
-    Build and install build types beyond the primary into the same wheel.
+    Build and install build types beyond the primary into the same wheel,
+    returning the installed files CMake reports.
 
     Single-config generators (Ninja, Makefiles) are reconfigured into a fresh
     builder for each extra build type; multi-config generators just build the
     extra ``--config`` with the original builder. Everything installs to the same
     prefix. Call this after the primary build and install.
     """
+    installed: set[Path] = set()
     build_types = normalize_build_types(settings.cmake.build_type)
     for extra_build_type in build_types[1:]:
         if builder.config.single_config:
@@ -374,7 +435,7 @@ def build_install_extra_build_types(
                 "{green}***",
                 f"{{bold}}Installing {{blue}}{extra_build_type}{{default}} project into wheel...",
             )
-            builder.install(install_dir, build_type=extra_build_type)
+            installed |= builder.install(install_dir, build_type=extra_build_type)
 
     # A single-config rebuild shim shares this build directory and runs
     # ``cmake --build`` without a ``--config`` (it was given the primary build
@@ -399,6 +460,7 @@ def build_install_extra_build_types(
             version=version,
             extra_cache_entries=extra_cache_entries,
         )
+    return installed
 
 
 def editable_rebuild_options(builder: Builder) -> tuple[list[str], list[str]]:
@@ -9,17 +9,20 @@ __lazy_modules__ = {
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}._reproducible",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}.settings.skbuild_read_settings",
     f"{__spec__.parent}._file_processor",
+    f"{__spec__.parent}._gzip",
     f"{__spec__.parent}._init",
+    f"{__spec__.parent}._matcher",
     f"{__spec__.parent}._pathutil",
+    f"{__spec__.parent}._prefetch",
     f"{__spec__.parent}.generate",
     f"{__spec__.parent}.metadata",
     f"{__spec__.parent}.wheel",
     "gzip",
     "io",
+    "itertools",
     "packaging",
     "packaging.utils",
     "pathlib",
-    "pathspec",
     "tarfile",
 }
 
@@ -27,10 +30,10 @@ import contextlib
 import copy
 import gzip
 import io
+import itertools
 import tarfile
 from pathlib import Path
 
-import pathspec
 from packaging.utils import canonicalize_name
 
 from .. import __version__
@@ -39,8 +42,11 @@ from .._logging import rich_print, rich_warning
 from .._reproducible import get_reproducible_epoch, normalize_file_permissions
 from ..settings.skbuild_read_settings import SettingsReader
 from ._file_processor import each_unignored_file, symlink_escapes
+from ._gzip import ParallelGzipFile
 from ._init import setup_logging
+from ._matcher import path_matcher
 from ._pathutil import iter_force_include
+from ._prefetch import read_ahead
 from .generate import generate_file_contents
 from .metadata import get_standard_metadata
 from .wheel import _build_wheel_impl
@@ -95,10 +101,12 @@ def add_path_to_tar(
     arcname: Path,
     *,
     tar_filter: Callable[[tarfile.TarInfo], tarfile.TarInfo],
+    data: bytes | None = None,
 ) -> None:
     """
     Add ``filepath`` to ``tar`` at ``arcname``, applying ``tar_filter`` for
-    reproducibility normalization.
+    reproducibility normalization. A regular file's contents are taken from
+    ``data`` if given (read ahead), instead of reading the file again.
 
     ``tar.dereference`` (``sdist.resolve-symlinks = "all"``) makes ``tar.add``
     stat through symlinks; a dangling symlink then raises ``FileNotFoundError``
@@ -122,6 +130,15 @@ def add_path_to_tar(
             tar.add(filepath, arcname=arcname, filter=tar_filter)
         finally:
             tar.dereference = True
+    elif data is not None:
+        tarinfo = tar.gettarinfo(filepath, arcname=str(arcname))
+        if not tarinfo.isreg() or tarinfo.size != len(data):
+            # Changed since it was read
+            tar.add(filepath, arcname=arcname, filter=tar_filter)
+            return
+        tarinfo = tar_filter(tarinfo)
+        with io.BytesIO(data) as bio:
+            tar.addfile(tarinfo, bio)
     else:
         tar.add(filepath, arcname=arcname, filter=tar_filter)
 
@@ -171,7 +188,17 @@ def build_sdist(
     with contextlib.ExitStack() as stack:
         gzip_container = stack.enter_context(
             gzip.GzipFile(
-                sdist_dir / filename, mode="wb", compresslevel=9, mtime=timestamp
+                sdist_dir / filename,
+                mode="wb",
+                compresslevel=settings.sdist.compression.level,
+                mtime=timestamp,
+            )
+            if settings.sdist.jobs == 1
+            else ParallelGzipFile(
+                sdist_dir / filename,
+                compresslevel=settings.sdist.compression.level,
+                mtime=timestamp,
+                jobs=settings.sdist.jobs,
             )
         )
         resolve_symlinks = settings.sdist.resolve_symlinks
@@ -196,6 +223,7 @@ def build_sdist(
                 yield_loop_symlinks=True,
             )
         )
+        names = []
         for filepath in paths:
             # In "external" mode, a file symlink pointing outside the project
             # is stored dereferenced: add its target under the link's name.
@@ -213,16 +241,24 @@ def build_sdist(
                         f"{filepath} is a dangling symlink pointing outside the "
                         "project; storing it as a symlink instead of resolving it."
                     )
+            names.append(name)
+        file_contents = (
+            read_ahead(names, max_bytes=settings.sdist.read_ahead * 1024 * 1024)
+            if settings.sdist.read_ahead
+            else itertools.repeat(None)
+        )
+        for filepath, name, data in zip(paths, names, file_contents):
             add_path_to_tar(
                 tar,
                 name,
                 arcname=srcdirname / filepath,
                 tar_filter=normalize_tar_info if reproducible else lambda x: x,
+                data=data,
             )
 
         # A force-included file is forced in; a force-included directory's
         # members stay subject to sdist.exclude (mirrors wheel.force-include).
-        sdist_exclude_spec = pathspec.GitIgnoreSpec.from_lines(settings.sdist.exclude)
+        sdist_exclude_spec = path_matcher(settings.sdist.exclude)
         forced = []
         for source, dest in settings.sdist.force_include.items():
             source_is_file = Path(source).expanduser().is_file()
@@ -4,14 +4,19 @@ __lazy_modules__ = {
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}._compat",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}._compat.typing",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}._logging",
+    f"{(__spec__.parent or '').rsplit('.', 1)[0]}._shutil",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}._variants",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}.cmake",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}.errors",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}.settings.skbuild_read_settings",
     f"{__spec__.parent}._editable",
+    f"{__spec__.parent}._hook_snapshot",
     f"{__spec__.parent}._init",
+    f"{__spec__.parent}._matcher",
     f"{__spec__.parent}._pathutil",
     f"{__spec__.parent}._scripts",
+    f"{__spec__.parent}._size_report",
+    f"{__spec__.parent}._wheel_cache",
     f"{__spec__.parent}._wheelfile",
     f"{__spec__.parent}.common_wheel_helpers",
     f"{__spec__.parent}.generate",
@@ -22,11 +27,10 @@ __lazy_modules__ = {
     "packaging.tags",
     "packaging.utils",
     "pathlib",
-    "pathspec",
     "platform",
     "shutil",
-    "tempfile",
     "typing",
+    "zipfile",
 }
 
 import dataclasses
@@ -35,11 +39,11 @@ import os
 import platform
 import shutil
 import sys
-import tempfile
+import time
+import zipfile
 from pathlib import Path
 from typing import Any, Literal
 
-import pathspec
 from packaging.requirements import Requirement
 from packaging.tags import Tag
 from packaging.utils import canonicalize_name
@@ -47,6 +51,7 @@ from packaging.utils import canonicalize_name
 from .._compat import tomllib
 from .._compat.typing import assert_never
 from .._logging import LEVEL_VALUE, logger, rich_error, rich_print
+from .._shutil import temporary_directory
 from .._variants import get_wheel_variant
 from ..cmake import CMake
 from ..errors import FailedLiveProcessError
@@ -57,7 +62,14 @@ from ._editable import (
     get_packages,
     package_search_dirs,
 )
+from ._hook_snapshot import (
+    dump_snapshot,
+    load_snapshot,
+    snapshot_path,
+    write_snapshot,
+)
 from ._init import setup_logging
+from ._matcher import path_matcher
 from ._pathutil import (
     NON_PLATLIB_REBUILD_MSG,
     editable_redirectable,
@@ -65,14 +77,19 @@ from ._pathutil import (
     packages_to_file_mapping,
     resolve_from_sdist_force_include,
     resolve_wheel_tree,
+    sync_file,
+    sync_files,
 )
 from ._scripts import process_script_dir
+from ._size_report import log_size_report, size_report, write_size_report
+from ._wheel_cache import get_wheel_cache_backends, wheel_cache_key
 from ._wheelfile import WheelMetadata, WheelWriter
 from .common_wheel_helpers import (
     build_install_extra_build_types,
     build_wheel,
     configure_wheel,
     editable_rebuild_options,
+    find_stale_files,
     get_build_dir,
     get_editable_rebuild_dir,
     get_install_dir,
@@ -81,6 +98,7 @@ from .common_wheel_helpers import (
     install_wheel,
     prepare_editable_rebuild_dir,
     prepare_wheel_dirs,
+    remove_stale_files,
 )
 from .generate import generate_file_contents
 from .metadata import get_standard_metadata
@@ -89,6 +107,7 @@ TYPE_CHECKING = False
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
 
+    from .._vendor.pyproject_metadata import StandardMetadata
     from ..settings.skbuild_model import ScikitBuildSettings
 
 __all__ = ["_build_wheel_impl"]
@@ -133,6 +152,8 @@ def _force_include_into_wheel(
     only_metadata: bool = False,
     redirect_mapping: dict[str, str] | None = None,
     redirect_libdir: Path | None = None,
+    staged: set[Path] | None = None,
+    staging_mode: Literal["copy", "link", "auto"] = "copy",
 ) -> set[Path]:
     """
     Copy ``wheel.force-include`` entries into the staged wheel trees.
@@ -151,13 +172,13 @@ def _force_include_into_wheel(
     Returns the resolved target paths of force-included *files*, so the caller
     can exempt them from ``wheel.exclude`` (naming an exact file forces it past
     an exclude pattern). Files copied from a force-included *directory* are not
-    returned, so a bulk directory copy stays subject to ``wheel.exclude``.
+    returned, so a bulk directory copy stays subject to ``wheel.exclude``. Every
+    copied path is added to ``staged``, if given, and is copied according to
+    ``staging_mode`` (``wheel.staging``).
     """
     written: set[Path] = set()
     exclude_spec = (
-        pathspec.GitIgnoreSpec.from_lines(settings.wheel.exclude)
-        if redirect_mapping is not None
-        else None
+        path_matcher(settings.wheel.exclude) if redirect_mapping is not None else None
     )
     for source, dest in settings.wheel.force_include.items():
         base, rest = resolve_wheel_tree(
@@ -199,7 +220,9 @@ def _force_include_into_wheel(
                     redirect_mapping[str(src_file)] = live_target
                     continue
             target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src_file, target)
+            sync_file(src_file, target, mode=staging_mode)
+            if staged is not None:
+                staged.add(target.absolute())
             if source_is_file:
                 written.add(target.resolve())
     return written
@@ -212,6 +235,146 @@ class WheelImplReturn:
     mapping: dict[str, str] = dataclasses.field(default_factory=dict)
 
 
+def _copy_license_files(
+    settings: ScikitBuildSettings, metadata: StandardMetadata, metadata_dir: Path
+) -> set[Path]:
+    """
+    Copy the license files into ``licenses`` in the metadata tree, returning
+    the copied paths.
+    """
+    # Include the metadata license.file entry if provided
+    if metadata.license_files is not None:
+        license_paths = metadata.license_files
+    else:
+        if settings.wheel.license_files is None:
+            license_file_globs = [
+                "LICEN[CS]E*",
+                "COPYING*",
+                "NOTICE*",
+                "AUTHORS*",
+            ]
+        else:
+            license_file_globs = list(settings.wheel.license_files)
+        if (
+            metadata.license
+            and not isinstance(metadata.license, str)
+            and metadata.license.file
+        ):
+            license_file_globs.append(str(metadata.license.file))
+
+        license_paths = [
+            x for y in license_file_globs for x in Path().glob(y) if x.is_file()
+        ]
+
+    copied = set()
+    for x in license_paths:
+        path = metadata_dir / "licenses" / x
+        path.parent.mkdir(parents=True, exist_ok=True)
+        sync_file(x, path)
+        copied.add(path.absolute())
+
+    if settings.wheel.license_files and not (metadata_dir / "licenses").is_dir():
+        logger.warning(
+            "No license files found, set wheel.license-files to [] to suppress this warning"
+        )
+    return copied
+
+
+def _check_metadata(
+    metadata_directory: Path, dist_info_contents: dict[str, bytes]
+) -> None:
+    """
+    The ``.dist-info`` prepared by ``prepare_metadata_for_build_wheel`` must
+    match the wheel's.
+    """
+    for key, data in dist_info_contents.items():
+        path = metadata_directory / key
+        previous_data = path.read_bytes()
+        if previous_data != data:
+            msg = f"Metadata mismatch in {key}"
+            logger.error("{}: {!r} != {!r}", msg, previous_data, data)
+            raise AssertionError(msg)
+
+
+def _wheel_dist_info_contents(wheel_path: Path) -> dict[str, bytes]:
+    """
+    The ``.dist-info`` files of a built wheel, except RECORD.
+    """
+    contents = {}
+    with zipfile.ZipFile(wheel_path) as zf:
+        for name in zf.namelist():
+            top, _, key = name.partition("/")
+            if (
+                top.endswith(".dist-info")
+                and key != "RECORD"
+                and not name.endswith("/")
+            ):
+                contents[key] = zf.read(name)
+    return contents
+
+
+def _prepare_metadata(
+    metadata_directory: Path,
+    *,
+    settings: ScikitBuildSettings,
+    pyproject: dict[str, Any],
+    metadata: StandardMetadata,
+    override_wheel_tags: set[Tag] | None,
+) -> WheelImplReturn:
+    """
+    Write the ``.dist-info`` for the metadata-only hooks. Nothing is staged:
+    the ``.dist-info`` directory itself is the metadata tree. The tags are
+    still needed for WHEEL, but are computed in-process.
+    """
+    targetlib = get_targetlib(settings)
+    wheel_variant = get_wheel_variant(settings, pyproject, metadata)
+    wheel = WheelWriter(
+        metadata,
+        metadata_directory,
+        tags=override_wheel_tags
+        or get_wheel_tag(settings, targetlib=targetlib).as_tags_set(),
+        wheel_metadata=WheelMetadata(
+            root_is_purelib=targetlib == "purelib",
+            build_tag=settings.wheel.build_tag,
+        ),
+        metadata_dir=None,
+        variant_label=wheel_variant.label if wheel_variant else "",
+        variant_dist_info_contents=(
+            wheel_variant.dist_info_contents if wheel_variant else None
+        ),
+    )
+    dist_info = metadata_directory / f"{wheel.name_ver}.dist-info"
+    dist_info.mkdir(parents=True)
+    wheel.metadata_dir = dist_info
+
+    _copy_license_files(settings, metadata, dist_info)
+
+    # Metadata-tree force-includes must land here too, so the prepared
+    # .dist-info matches the final wheel (it is compared on build). The other
+    # trees are never written, but are named so destinations resolve the same.
+    wheel_dirs = {
+        tree: metadata_directory / tree
+        for tree in (targetlib, "data", "headers", "scripts", "null")
+    }
+    wheel_dirs["metadata"] = dist_info
+    _force_include_into_wheel(
+        settings,
+        wheel_dirs=wheel_dirs,
+        targetlib=targetlib,
+        only_metadata=True,
+    )
+
+    dist_info_contents = wheel.dist_info_contents()
+    for key, data in dist_info_contents.items():
+        path = dist_info / key
+        if not path.parent.is_dir():
+            path.parent.mkdir(exist_ok=True, parents=True)
+        path.write_bytes(data)
+    if settings.wheel.metadata_sidecar:
+        wheel.write_metadata_sidecar(dist_info_contents["METADATA"])
+    return WheelImplReturn(wheel_filename=dist_info.name, settings=settings)
+
+
 def _build_wheel_impl(
     wheel_directory: str | None,
     config_settings: dict[str, list[str] | str] | None,
@@ -232,23 +395,44 @@ def _build_wheel_impl(
     else:
         state = "editable" if editable else "wheel"
 
-    pyproject_path = Path("pyproject.toml")
-    with pyproject_path.open("rb") as ft:
-        pyproject = tomllib.load(ft)
+    pyproject_bytes = Path("pyproject.toml").read_bytes()
+    pyproject = tomllib.loads(pyproject_bytes.decode("utf-8"))
 
     settings_reader = SettingsReader(
         pyproject, config_settings or {}, state=state, retry=False
     )
-    setup_logging(settings_reader.settings.logging.level)
+    settings = settings_reader.settings
+    setup_logging(settings.logging.level)
 
     settings_reader.validate_may_exit()
 
-    if settings_reader.settings.fail:
-        if settings_reader.settings.messages.after_failure:
-            rich_print(settings_reader.settings.messages.after_failure)
+    if settings.fail:
+        if settings.messages.after_failure:
+            rich_print(settings.messages.after_failure)
             raise SystemExit(7)
         rich_error("scikit-build-core's fail setting was enabled. Exiting immediately.")
 
+    # The prepare-metadata hook can hand its settings and metadata to the
+    # build hook, which frontends run in another process. Overrides
+    # conditional on the state could resolve different settings for the two
+    # hooks, so those builds never share them.
+    loaded = None
+    if (
+        metadata_directory is not None
+        and state in {"wheel", "editable"}
+        and not settings_reader.state_dependent
+    ):
+        snapshot = snapshot_path(
+            pyproject_bytes, config_settings, editable=editable, create=False
+        )
+        if snapshot is not None:
+            loaded = load_snapshot(snapshot)
+
+    if loaded is not None:
+        settings, metadata = loaded
+    else:
+        metadata = get_standard_metadata(pyproject, settings, build_state=state)
+
     # Warn if cmake or ninja is in build-system.requires
     requirements = [
         canonicalize_name(Requirement(p).name)
@@ -263,15 +447,26 @@ def _build_wheel_impl(
             "ninja should not be in build-system.requires - scikit-build-core will inject it as needed"
         )
 
+    snapshot = snapshot_data = None
+    if (
+        state in {"metadata_wheel", "metadata_editable"}
+        and settings.wheel.reuse_metadata
+        and not settings_reader.state_dependent
+    ):
+        snapshot = snapshot_path(pyproject_bytes, config_settings, editable=editable)
+        # Before the hook runs, since it modifies the settings
+        snapshot_data = dump_snapshot(settings, metadata) if snapshot else None
+
     try:
-        return _build_wheel_impl_impl(
+        result = _build_wheel_impl_impl(
             wheel_directory,
             metadata_directory,
             exit_after_config=exit_after_config,
             editable=editable,
             state=state,
-            settings=settings_reader.settings,
+            settings=settings,
             pyproject=pyproject,
+            metadata=metadata,
         )
     except FailedLiveProcessError as err:
         settings_reader = SettingsReader(
@@ -306,6 +501,10 @@ def _build_wheel_impl(
             err2.msg = settings_reader.settings.messages.after_failure
             raise
 
+    if snapshot is not None and snapshot_data is not None:
+        write_snapshot(snapshot, snapshot_data)
+    return result
+
 
 def _build_wheel_impl_impl(
     wheel_directory: str | None,
@@ -316,12 +515,14 @@ def _build_wheel_impl_impl(
     state: Literal["sdist", "wheel", "editable", "metadata_wheel", "metadata_editable"],
     settings: ScikitBuildSettings,
     pyproject: dict[str, Any],
+    metadata: StandardMetadata | None = None,
 ) -> WheelImplReturn:
     """
     Build a wheel or just prepare metadata (if wheel dir is None). Can be editable.
     """
 
-    metadata = get_standard_metadata(pyproject, settings, build_state=state)
+    if metadata is None:
+        metadata = get_standard_metadata(pyproject, settings, build_state=state)
 
     if metadata.version is None:
         msg = "project.version is not specified, must be statically present or tool.scikit-build metadata.version.provider configured when dynamic"
@@ -337,7 +538,11 @@ def _build_wheel_impl_impl(
     # Normalized like the wheel/sdist filename, for the {name} build-dir placeholder
     placeholder_name = metadata.canonical_name.replace("-", "_")
 
-    if settings.wheel.cmake:
+    # The metadata-only hooks are called often by resolvers; they do not need
+    # CMake, so skip the search (a subprocess) and the staging below.
+    metadata_only = wheel_directory is None and not exit_after_config
+
+    if settings.wheel.cmake and not metadata_only:
         cmake = CMake.default_search(version=settings.cmake.version, env=os.environ)
         cmake_msg = [f"using {{blue}}CMake {cmake.version}{{default}}"]
     else:
@@ -356,17 +561,70 @@ def _build_wheel_impl_impl(
         platform.machine(),
     )
 
+    for gen in settings.generate:
+        if gen.location == "source":
+            contents = generate_file_contents(gen, metadata)
+            gen.path.write_text(contents, encoding="utf-8")
+            settings.sdist.include.append(gen.path.as_posix())
+
     override_wheel_tags = None
     if settings.wheel.tags:
         override_wheel_tags = {Tag(*tag.split("-")) for tag in settings.wheel.tags}
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        build_tmp_folder = Path(tmpdir)
-        wheel_dir = build_tmp_folder / "wheel"
+    if metadata_only:
+        if metadata_directory is None:
+            msg = "metadata_directory must be specified if wheel_directory is None"
+            raise AssertionError(msg)
+        return _prepare_metadata(
+            Path(metadata_directory),
+            settings=settings,
+            pyproject=pyproject,
+            metadata=metadata,
+            override_wheel_tags=override_wheel_tags,
+        )
+
+    targetlib = get_targetlib(settings)
+    tags = get_wheel_tag(settings, targetlib=targetlib)
+
+    wheel_caches = (
+        get_wheel_cache_backends(settings)
+        if wheel_directory is not None and not editable and not exit_after_config
+        else []
+    )
+    cache_key = ""
+    if wheel_caches:
+        assert wheel_directory is not None
+        cache_key = wheel_cache_key(
+            settings,
+            version=str(metadata.version),
+            tags=str(tags),
+            cmake=cmake,
+            env=os.environ,
+        )
+        Path(wheel_directory).mkdir(parents=True, exist_ok=True)
+        for i, wheel_cache in enumerate(wheel_caches):
+            cached = wheel_cache.get(cache_key, Path(wheel_directory))
+            if cached is None:
+                continue
+            # Fill the caches checked before this one
+            cached_paths = [Path(wheel_directory) / name for name in cached]
+            for earlier_cache in wheel_caches[:i]:
+                earlier_cache.put(cache_key, cached_paths)
+            (cached_wheel,) = (name for name in cached if name.endswith(".whl"))
+            if metadata_directory is not None:
+                _check_metadata(
+                    Path(metadata_directory),
+                    _wheel_dist_info_contents(Path(wheel_directory) / cached_wheel),
+                )
+            rich_print("{green}***", f"{{bold}}Reused cached{{normal}} {cached_wheel}")
+            if settings.messages.after_success:
+                rich_print(settings.messages.after_success)
+            return WheelImplReturn(wheel_filename=cached_wheel, settings=settings)
+
+    # Removed in the background, so the hook returns once the wheel is written
+    with temporary_directory() as build_tmp_folder:
         wheel_variant = get_wheel_variant(settings, pyproject, metadata)
 
-        targetlib = get_targetlib(settings)
-        tags = get_wheel_tag(settings, targetlib=targetlib)
         build_dir = get_build_dir(
             settings,
             tags=tags,
@@ -376,7 +634,32 @@ def _build_wheel_impl_impl(
             fallback=build_tmp_folder / "build",
             name=placeholder_name,
         )
+
+        # With a persistent build-dir, the wheel is staged there and synced:
+        # unchanged files are not copied (or installed by CMake) again, and
+        # files left from earlier builds are removed before zipping.
+        sync_staging = False
+        staging_start_ns = time.time_ns()
+        staging_mode = settings.wheel.staging
+        if settings.build_dir and not (
+            editable and settings.editable.mode == "inplace"
+        ):
+            # Absolute, like a temporary dir: CMake is given these paths
+            wheel_dir = (build_dir / ".skbuild-wheel-staging").resolve()
+            # Later builds install over the staged files, which would write
+            # through a hard link into the sources
+            if staging_mode == "link":
+                staging_mode = "auto"
+            if cmake is not None and settings.install.targets:
+                # Files installed by building targets are not reported by
+                # CMake, so stale ones could not be found; start over.
+                shutil.rmtree(wheel_dir, ignore_errors=True)
+            else:
+                sync_staging = True
+        else:
+            wheel_dir = build_tmp_folder / "wheel"
         wheel_dirs = prepare_wheel_dirs(wheel_dir, targetlib=targetlib)
+        staged: set[Path] = set()
         install_dir = get_install_dir(
             settings, wheel_dirs=wheel_dirs, targetlib=targetlib
         )
@@ -412,6 +695,14 @@ def _build_wheel_impl_impl(
         else:
             targetlib_dir = wheel_dirs[targetlib]
 
+        # Inplace editables build in the source dir; keep the cache out of it.
+        compression_cache_dir = (
+            build_dir / ".skbuild-wheel-cache"
+            if settings.wheel.compression.cache
+            and not (editable and settings.editable.mode == "inplace")
+            else None
+        )
+
         # The metadata-only and full-wheel paths build identical WheelWriters
         # except for the output folder; share a single constructor.
         make_wheel = functools.partial(
@@ -428,6 +719,15 @@ def _build_wheel_impl_impl(
                 wheel_variant.dist_info_contents if wheel_variant else None
             ),
             reproducible=settings.wheel.reproducible,
+            jobs=settings.wheel.jobs,
+            cache_dir=compression_cache_dir,
+            cache_max_size=settings.wheel.compression.cache_size * 1024 * 1024,
+            compresslevel=settings.wheel.compression.level,
+            store=settings.wheel.compression.store,
+            store_incompressible=settings.wheel.compression.store_incompressible,
+            # An editable wheel does not contain the modules
+            compile_bytecode=settings.wheel.compile_bytecode and not editable,
+            read_ahead=settings.wheel.read_ahead * 1024 * 1024,
         )
 
         # A rebuildable editable re-points install_dir into the persistent
@@ -445,71 +745,7 @@ def _build_wheel_impl_impl(
             install_dir = targetlib_dir / install_relative
             editable_rebuild_cache = {f"SKBUILD_{targetlib.upper()}_DIR": targetlib_dir}
 
-        # Include the metadata license.file entry if provided
-        if metadata.license_files is not None:
-            license_paths = metadata.license_files
-        else:
-            if settings.wheel.license_files is None:
-                license_file_globs = [
-                    "LICEN[CS]E*",
-                    "COPYING*",
-                    "NOTICE*",
-                    "AUTHORS*",
-                ]
-            else:
-                license_file_globs = list(settings.wheel.license_files)
-            if (
-                metadata.license
-                and not isinstance(metadata.license, str)
-                and metadata.license.file
-            ):
-                license_file_globs.append(str(metadata.license.file))
-
-            license_paths = [
-                x for y in license_file_globs for x in Path().glob(y) if x.is_file()
-            ]
-
-        for x in license_paths:
-            path = wheel_dirs["metadata"] / "licenses" / x
-            path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(x, path)
-
-        if (
-            settings.wheel.license_files
-            and not (wheel_dirs["metadata"] / "licenses").is_dir()
-        ):
-            logger.warning(
-                "No license files found, set wheel.license-files to [] to suppress this warning"
-            )
-
-        for gen in settings.generate:
-            if gen.location == "source":
-                contents = generate_file_contents(gen, metadata)
-                gen.path.write_text(contents, encoding="utf-8")
-                settings.sdist.include.append(gen.path.as_posix())
-
-        if wheel_directory is None and not exit_after_config:
-            if metadata_directory is None:
-                msg = "metadata_directory must be specified if wheel_directory is None"
-                raise AssertionError(msg)
-            # Metadata-tree force-includes must land here too, so the prepared
-            # .dist-info matches the final wheel (it is compared on build).
-            _force_include_into_wheel(
-                settings,
-                wheel_dirs=wheel_dirs,
-                targetlib=targetlib,
-                only_metadata=True,
-            )
-            wheel = make_wheel(folder=Path(metadata_directory))
-            dist_info_contents = wheel.dist_info_contents()
-            dist_info = Path(metadata_directory) / f"{wheel.name_ver}.dist-info"
-            dist_info.mkdir(parents=True)
-            for key, data in dist_info_contents.items():
-                path = dist_info / key
-                if not path.parent.is_dir():
-                    path.parent.mkdir(exist_ok=True, parents=True)
-                path.write_bytes(data)
-            return WheelImplReturn(wheel_filename=dist_info.name, settings=settings)
+        staged |= _copy_license_files(settings, metadata, wheel_dirs["metadata"])
 
         for gen in settings.generate:
             contents = generate_file_contents(gen, metadata)
@@ -522,7 +758,10 @@ def _build_wheel_impl_impl(
             else:
                 assert_never(gen.location)
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(contents, encoding="utf-8")
+            # Unchanged files are left alone, to keep a persistent tree in sync
+            if not path.is_file() or path.read_text(encoding="utf-8") != contents:
+                path.write_text(contents, encoding="utf-8")
+            staged.add(path.absolute())
 
         build_options: list[str] = []
         install_options: list[str] = []
@@ -542,9 +781,9 @@ def _build_wheel_impl_impl(
             if exit_after_config:
                 return WheelImplReturn("", settings=settings)
             build_wheel(builder)
-            install_wheel(builder, install_dir=install_dir, editable=editable)
+            staged |= install_wheel(builder, install_dir=install_dir, editable=editable)
             build_options, install_options = editable_rebuild_options(builder)
-            build_install_extra_build_types(
+            staged |= build_install_extra_build_types(
                 builder,
                 settings=settings,
                 wheel_dirs=wheel_dirs,
@@ -563,6 +802,11 @@ def _build_wheel_impl_impl(
             packages=settings.wheel.packages,
             name=metadata.name,
         )
+        stale = (
+            find_stale_files(wheel_dir, staged, since_ns=staging_start_ns)
+            if sync_staging
+            else set()
+        )
         assert settings.sdist.inclusion_mode is not None
         mapping = packages_to_file_mapping(
             packages=packages,
@@ -572,12 +816,12 @@ def _build_wheel_impl_impl(
             target_exclude=settings.wheel.exclude,
             build_dir=settings.build_dir,
             mode=settings.sdist.inclusion_mode,
+            staged=staged if sync_staging else None,
+            since_ns=staging_start_ns,
         )
 
         if not editable:
-            for filepath, package_dir in mapping.items():
-                Path(package_dir).parent.mkdir(exist_ok=True, parents=True)
-                shutil.copy2(filepath, package_dir)
+            staged |= sync_files(mapping, mode=staging_mode, jobs=settings.wheel.jobs)
 
         # Force-include into the wheel, after the package copy so entries
         # override package files and CMake output at the same destination. In a
@@ -590,6 +834,8 @@ def _build_wheel_impl_impl(
             targetlib=targetlib,
             redirect_mapping=mapping if redirecting else None,
             redirect_libdir=targetlib_dir if redirecting else None,
+            staged=staged,
+            staging_mode=staging_mode,
         )
 
         # Normalize script shebangs after force-includes, so force-included
@@ -598,6 +844,9 @@ def _build_wheel_impl_impl(
         # normalize them as well.
         process_script_dir(wheel_dirs["scripts"])
 
+        if sync_staging:
+            remove_stale_files(wheel_dir, stale - staged)
+
         with make_wheel(folder=Path(wheel_directory)) as wheel:
             wheel.build(
                 wheel_dirs,
@@ -641,16 +890,19 @@ def _build_wheel_impl_impl(
                 ).items():
                     wheel.writestr(filename, editable_contents)
 
+        artifacts = [wheel.wheelpath]
+        report = size_report(wheel.wheelpath, wheel.member_sizes)
+        log_size_report(report)
+        if settings.wheel.size_report:
+            artifacts.append(write_size_report(report, wheel.wheelpath))
+        if settings.wheel.metadata_sidecar:
+            artifacts.append(wheel.write_metadata_sidecar())
+
     if metadata_directory is not None:
-        dist_info_contents = wheel.dist_info_contents()
-        dist_info = Path(metadata_directory)
-        for key, data in dist_info_contents.items():
-            path = dist_info / key
-            previous_data = path.read_bytes()
-            if previous_data != data:
-                msg = f"Metadata mismatch in {key}"
-                logger.error("{}: {!r} != {!r}", msg, previous_data, data)
-                raise AssertionError(msg)
+        _check_metadata(Path(metadata_directory), wheel.dist_info_contents())
+
+    for wheel_cache in wheel_caches:
+        wheel_cache.put(cache_key, artifacts)
 
     wheel_filename: str = wheel.wheelpath.name
     rich_print("{green}***", f"{{bold}}Created{{normal}} {wheel_filename}")
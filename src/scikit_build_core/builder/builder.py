@@ -518,9 +518,9 @@ class Builder:
 
     def install(
         self, install_dir: Path | None, *, build_type: str | None = None
-    ) -> None:
+    ) -> set[Path]:
         """
-        Install to a path.
+        Install to a path. Returns the installed files CMake reports.
 
         Warning: if a package hard-codes CMAKE_INSTALL_PREFIX in the install
         commands, this will not rewrite those; set that variable when
@@ -530,7 +530,7 @@ class Builder:
         targets = self.settings.install.targets
         strip = self.settings.install.strip
         assert strip is not None
-        self.config.install(
+        return self.config.install(
             install_dir,
             strip=strip,
             components=components,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 __lazy_modules__ = {
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}._logging",
+    f"{(__spec__.parent or '').rsplit('.', 1)[0]}._program_cache",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}.errors",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}.program_search",
     f"{__spec__.parent}.sysconfig",
@@ -11,6 +12,8 @@ __lazy_modules__ = {
     "sysconfig",
 }
 
+import functools
+import os
 import re
 import shlex
 import subprocess
@@ -18,6 +21,7 @@ import sys
 import sysconfig
 
 from .._logging import logger
+from .._program_cache import cached_probe
 from ..errors import NinjaNotFoundError
 from ..program_search import best_program, get_make_programs, get_ninja_programs
 from .sysconfig import get_cmake_platform
@@ -69,12 +73,7 @@ def parse_help_default(txt: str) -> str | None:
     return lines[0]
 
 
-def get_default_from_cmake(cmake: CMake) -> str | None:
-    """
-    Returns the default generator for the current platform from CMake's output.
-    None if it cannot be determined.
-    """
-
+def _probe_default(cmake: CMake) -> dict[str, str | None] | None:
     result = subprocess.run(
         [str(cmake.cmake_path), "--help"],
         check=False,
@@ -84,7 +83,29 @@ def get_default_from_cmake(cmake: CMake) -> str | None:
     if result.returncode != 0:
         return None
 
-    return parse_help_default(result.stdout)
+    return {"generator": parse_help_default(result.stdout)}
+
+
+def get_default_from_cmake(cmake: CMake) -> str | None:
+    """
+    Returns the default generator for the current platform from CMake's output.
+    None if it cannot be determined. The result is cached across builds until
+    CMake changes, except on Windows.
+    """
+
+    # On Windows, CMake's default depends on the Visual Studio installations
+    # found, which can be added or removed without CMake changing
+    if sys.platform.startswith("win"):
+        info = _probe_default(cmake)
+        return None if info is None else info["generator"]
+
+    info = cached_probe(
+        "cmake-default-generator",
+        cmake.cmake_path,
+        functools.partial(_probe_default, cmake),
+        extra=[os.environ.get("CMAKE_GENERATOR", "")],
+    )
+    return None if info is None else info["generator"]
 
 
 def get_default(cmake: CMake) -> str | None:
@@ -341,8 +341,18 @@ class CMaker:
             self._build(*local_args, *build_args)
             return
 
-        for target in targets:
-            self._build(*local_args, "--target", target, *build_args)
+        for target_args in self._target_args(targets):
+            self._build(*local_args, *target_args, *build_args)
+
+    def _target_args(self, targets: Sequence[str]) -> list[list[str]]:
+        """
+        The ``--target`` arguments of each ``cmake --build`` needed for
+        ``targets``. CMake 3.15+ builds them all in one go, letting the build
+        tool schedule them together; older CMakes build one target per call.
+        """
+        if self.cmake.version >= Version("3.15"):
+            return [[arg for target in targets for arg in ("--target", target)]]
+        return [["--target", target] for target in targets]
 
     def _build(self, *args: str) -> None:
         try:
@@ -359,7 +369,12 @@ class CMaker:
         components: Sequence[str] = (),
         targets: Sequence[str] = (),
         build_type: str | None = None,
-    ) -> None:
+    ) -> set[Path]:
+        """
+        Install the project, returning the files CMake reports as installed
+        (read from its install manifests), including up-to-date ones. Files
+        installed by ``targets`` are not known, so are not included.
+        """
         build_type = self.build_type if build_type is None else build_type
         opts = ["--prefix", str(prefix)] if prefix else []
         if not self.single_config and build_type:
@@ -368,23 +383,40 @@ class CMaker:
             opts.append("--strip")
 
         # These are "built", so --prefix/--strip/--component do not apply.
-        for target in targets:
-            logger.info("Installing target {}", target)
+        if targets:
+            logger.info("Installing targets {}", ", ".join(targets))
             build_args = list(
                 self._compute_build_args(verbose=False, build_type=build_type)
             )
-            self._build(*build_args, "--target", target)
+            for target_args in self._target_args(targets):
+                self._build(*build_args, *target_args)
 
+        installed: set[Path] = set()
         if not components:
             # With no components and no targets, run the default install.
             if not targets:
                 self._install(opts)
-            return
+                installed.update(self._install_manifest())
+            return installed
 
         for comp in components:
             opts_with_comp = [*opts, "--component", comp]
             logger.info("Installing component {}", comp)
             self._install(opts_with_comp)
+            installed.update(self._install_manifest(comp))
+        return installed
+
+    def _install_manifest(self, component: str = "") -> list[Path]:
+        # Rewritten by every install, so it must be read right after one
+        suffix = f"_{component}" if component else ""
+        manifest = self.build_dir / f"install_manifest{suffix}.txt"
+        with contextlib.suppress(FileNotFoundError):
+            return [
+                Path(line)
+                for line in manifest.read_text(encoding="utf-8").splitlines()
+                if line
+            ]
+        return []
 
     def _install(self, opts: Sequence[str]) -> None:
         try:
@@ -4,6 +4,7 @@ __lazy_modules__ = {
     "copy",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}._check_extra",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}._logging",
+    f"{(__spec__.parent or '').rsplit('.', 1)[0]}._shutil",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}.build._editable",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}.build._init",
     f"{(__spec__.parent or '').rsplit('.', 1)[0]}.build._pathutil",
@@ -18,7 +19,6 @@ __lazy_modules__ = {
     "packaging.utils",
     "packaging.version",
     "pathlib",
-    "shutil",
     "tempfile",
     "typing",
 }
@@ -26,7 +26,6 @@ __lazy_modules__ = {
 import copy
 import importlib.metadata
 import os
-import shutil
 import tempfile
 import typing
 from pathlib import Path
@@ -38,6 +37,7 @@ from packaging.version import Version
 
 from .._check_extra import warn_missing_extra
 from .._logging import logger, rich_print
+from .._shutil import remove_in_background
 from ..build._editable import (
     editable_inplace_files,
     editable_redirect_files,
@@ -381,5 +381,5 @@ class ScikitBuildHook(BuildHookInterface):  # type: ignore[type-arg]
 
     def _cleanup(self) -> None:
         if self.__tmp_dir:
-            shutil.rmtree(self.__tmp_dir, ignore_errors=True)
+            remove_in_background(self.__tmp_dir)
             self.__tmp_dir = None
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 __lazy_modules__ = {
+    "concurrent.futures",
     "contextlib",
     f"{__spec__.parent}._logging",
+    f"{__spec__.parent}._program_cache",
     f"{__spec__.parent}._shutil",
+    "importlib.metadata",
     "json",
     "packaging",
     "packaging.version",
@@ -15,23 +18,26 @@ __lazy_modules__ = {
 
 import contextlib
 import functools
+import importlib.metadata
 import json
 import os
 import platform
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal, NamedTuple
+from typing import Any, Literal, NamedTuple
 
 from packaging.version import InvalidVersion, Version
 
 from ._logging import logger, rich_print
-from ._shutil import Run
+from ._program_cache import cached_probe
+from ._shutil import ProcessGroup, Run
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Callable, Generator, Iterable, Sequence
 
     from packaging.specifiers import SpecifierSet
 
@@ -52,6 +58,9 @@ def __dir__() -> list[str]:
 
 BASE_TIMEOUT = 5
 
+# At most this many candidates are probed at once
+MAX_CONCURRENT_PROBES = 4
+
 
 @functools.lru_cache(None)
 def _macos_binary_is_x86(path: Path) -> bool:
@@ -108,59 +117,81 @@ class Program(NamedTuple):
     version: Version | None
 
 
+def _distribution_scripts(name: str, candidates: Iterable[str]) -> set[Path]:
+    """
+    The resolved paths of the files named like one of ``candidates`` (with
+    any suffix, like ``.exe``) installed by distribution ``name``. The
+    ``cmake`` and ``ninja`` console scripts only run the module's binary.
+    """
+    try:
+        dist = importlib.metadata.distribution(name)
+    except importlib.metadata.PackageNotFoundError:
+        return set()
+    stems = set(candidates)
+    return {
+        Path(str(dist.locate_file(file))).resolve()
+        for file in dist.files or []
+        if file.name.partition(".")[0] in stems
+    }
+
+
 def _get_cmake_path(*, module: bool = True) -> Generator[Path, None, None]:
     """
-    Get the path to CMake.
+    Get the path to CMake. The scripts of the ``cmake`` module, which run its
+    binary, are not returned again.
     """
+    candidates = ("cmake", "cmake3")
+    module_scripts: set[Path] = set()
     if module:
         with contextlib.suppress(ImportError):
             # If a "cmake" directory exists, this will also ImportError
             from cmake import CMAKE_BIN_DIR
 
             yield Path(CMAKE_BIN_DIR) / "cmake"
+            module_scripts = _distribution_scripts("cmake", candidates)
 
-    candidates = ("cmake", "cmake3")
     for candidate in candidates:
         cmake_path = shutil.which(candidate)
-        if cmake_path is not None:
+        if cmake_path is not None and Path(cmake_path).resolve() not in module_scripts:
             yield Path(cmake_path)
 
 
 def _get_ninja_path(*, module: bool = True) -> Generator[Path, None, None]:
     """
-    Get the path to ninja.
+    Get the path to ninja. The scripts of the ``ninja`` module, which run its
+    binary, are not returned again.
     """
 
+    # Matches https://gitlab.kitware.com/cmake/cmake/-/blob/master/Modules/CMakeNinjaFindMake.cmake
+    candidates = ("ninja-build", "ninja", "samu")
+    module_scripts: set[Path] = set()
     if module:
         with contextlib.suppress(ImportError):
             from ninja import BIN_DIR
 
             yield Path(BIN_DIR) / "ninja"
+            module_scripts = _distribution_scripts("ninja", candidates)
 
-    # Matches https://gitlab.kitware.com/cmake/cmake/-/blob/master/Modules/CMakeNinjaFindMake.cmake
-    candidates = ("ninja-build", "ninja", "samu")
     for candidate in candidates:
         ninja_path = shutil.which(candidate)
-        if ninja_path is not None:
+        if ninja_path is not None and Path(ninja_path).resolve() not in module_scripts:
             yield Path(ninja_path)
 
 
-def get_cmake_program(cmake_path: Path) -> Program:
+def _probe_cmake(cmake_path: Path, group: ProcessGroup | None) -> dict[str, Any] | None:
     """
-    Get the Program (with version) for CMake given a path. The version will be
-    None if it cannot be determined.
+    Run CMake to get its version and capabilities (None for very old CMakes).
+    None if the version cannot be determined.
     """
     try:
         try:
-            result = Run(timeout=compute_timeout(cmake_path)).capture(
+            result = Run(timeout=compute_timeout(cmake_path), group=group).capture(
                 cmake_path, "-E", "capabilities"
             )
             try:
-                version = Version(
-                    json.loads(result.stdout)["version"]["string"].split("-")[0]
-                )
-                logger.info("CMake version: {}", version)
-                return Program(cmake_path, version)
+                capabilities = json.loads(result.stdout)
+                version = Version(capabilities["version"]["string"].split("-")[0])
+                return {"version": str(version), "capabilities": capabilities}
             except (json.decoder.JSONDecodeError, KeyError, InvalidVersion):
                 logger.warning(
                     "Could not determine CMake version, got {!r}", result.stdout
@@ -169,15 +200,14 @@ def get_cmake_program(cmake_path: Path) -> Program:
             # `cmake -E capabilities` is not available on very old CMakes, fall
             # back to `--version`. This nested try ensures Permission/Timeout
             # errors raised here are still handled by the outer handlers below.
-            result = Run(timeout=compute_timeout(cmake_path)).capture(
+            result = Run(timeout=compute_timeout(cmake_path), group=group).capture(
                 cmake_path, "--version"
             )
             try:
                 version = Version(
                     result.stdout.splitlines()[0].split()[-1].split("-")[0]
                 )
-                logger.info("CMake version via --version: {}", version)
-                return Program(cmake_path, version)
+                return {"version": str(version), "capabilities": None}
             except (IndexError, InvalidVersion):
                 logger.warning(
                     "Could not determine CMake version via --version, got {!r}",
@@ -194,46 +224,113 @@ def get_cmake_program(cmake_path: Path) -> Program:
     except subprocess.TimeoutExpired:
         logger.warning("Accessing CMake timed out, ignoring")
 
-    return Program(cmake_path, None)
+    return None
+
+
+def get_cmake_program(cmake_path: Path) -> Program:
+    """
+    Get the Program (with version) for CMake given a path. The version will be
+    None if it cannot be determined. The result is cached across builds until
+    the program changes.
+    """
+    return _get_cmake_program(cmake_path, None)
+
+
+def _get_cmake_program(cmake_path: Path, group: ProcessGroup | None) -> Program:
+    info = cached_probe(
+        "cmake", cmake_path, functools.partial(_probe_cmake, cmake_path, group)
+    )
+    if info is None:
+        return Program(cmake_path, None)
+    version = Version(info["version"])
+    if info["capabilities"] is None:
+        logger.info("CMake version via --version: {}", version)
+    else:
+        logger.info("CMake version: {}", version)
+    return Program(cmake_path, version)
+
+
+def _probe_concurrently(
+    get_program: Callable[[Path, ProcessGroup | None], Program], paths: Sequence[Path]
+) -> Generator[Program, None, None]:
+    """
+    Probe ``paths`` concurrently (up to :data:`MAX_CONCURRENT_PROBES` at once),
+    yielding the results in order as each becomes available. When the consumer
+    stops early (like :func:`best_program`), the probes still running are
+    killed and the rest are not started, so nothing waits for them.
+    """
+    if len(paths) < 2:
+        yield from (get_program(path, None) for path in paths)
+        return
+
+    group = ProcessGroup()
+    pool = ThreadPoolExecutor(
+        max_workers=min(len(paths), MAX_CONCURRENT_PROBES),
+        thread_name_prefix="skbuild-probe",
+    )
+    try:
+        futures = [pool.submit(get_program, path, group) for path in paths]
+        for future in futures:
+            yield future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        group.kill()
 
 
 def get_cmake_programs(*, module: bool = True) -> Generator[Program, None, None]:
     """
     Get the path and version for CMake. If the version cannot be determined,
     yields (path, None). Otherwise, yields (path, version). Best matches are
-    yielded first.
+    yielded first; all the candidates are probed at once.
     """
-    for cmake_path in _get_cmake_path(module=module):
-        yield get_cmake_program(cmake_path)
+    yield from _probe_concurrently(
+        _get_cmake_program, list(_get_cmake_path(module=module))
+    )
+
+
+def _probe_ninja(ninja_path: Path, group: ProcessGroup | None) -> str | None:
+    """
+    Run Ninja to get its version, or None if it cannot be determined.
+    """
+    try:
+        result = Run(timeout=compute_timeout(ninja_path), group=group).capture(
+            ninja_path, "--version"
+        )
+    except (
+        subprocess.CalledProcessError,
+        PermissionError,
+        subprocess.TimeoutExpired,
+    ):
+        return None
+
+    try:
+        version = Version(".".join(result.stdout.strip().split(".")[:3]))
+    except ValueError:
+        return None
+
+    return str(version)
+
+
+def _get_ninja_program(ninja_path: Path, group: ProcessGroup | None) -> Program:
+    version = cached_probe(
+        "ninja", ninja_path, functools.partial(_probe_ninja, ninja_path, group)
+    )
+    if version is None:
+        return Program(ninja_path, None)
+    logger.info("Ninja version: {}", version)
+    return Program(ninja_path, Version(version))
 
 
 def get_ninja_programs(*, module: bool = True) -> Generator[Program, None, None]:
     """
     Get the path and version for Ninja. If the version cannot be determined,
     yields (path, None). Otherwise, yields (path, version). Best matches are
-    yielded first.
+    yielded first; all the candidates are probed at once. Versions are cached
+    across builds until the program changes.
     """
-    for ninja_path in _get_ninja_path(module=module):
-        try:
-            result = Run(timeout=compute_timeout(ninja_path)).capture(
-                ninja_path, "--version"
-            )
-        except (
-            subprocess.CalledProcessError,
-            PermissionError,
-            subprocess.TimeoutExpired,
-        ):
-            yield Program(ninja_path, None)
-            continue
-
-        try:
-            version = Version(".".join(result.stdout.strip().split(".")[:3]))
-        except ValueError:
-            yield Program(ninja_path, None)
-            continue
-
-        logger.info("Ninja version: {}", version)
-        yield Program(ninja_path, version)
+    yield from _probe_concurrently(
+        _get_ninja_program, list(_get_ninja_path(module=module))
+    )
 
 
 def get_make_programs() -> Generator[Path, None, None]:
@@ -252,6 +349,7 @@ def best_program(
 ) -> Program | None:
     """
     Select the first program entry that is of a supported version, or None if not found.
+    The remaining entries are not waited for.
     """
 
     for program in programs:
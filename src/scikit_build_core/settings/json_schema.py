@@ -165,6 +165,8 @@ def convert_type(t: Any, *, normalize_keys: bool) -> dict[str, Any]:
         return {"type": "string"}
     if t is bool:
         return {"type": "boolean"}
+    if t is int:
+        return {"type": "integer"}
     origin = get_origin(t)
     args = get_args(t)
     if origin is list:
@@ -329,6 +329,110 @@ class LoggingSettings:
     """
 
 
+@dataclasses.dataclass
+class SDistCompressionSettings:
+    level: int = 9
+    """
+    The gzip compression level (0-9) used for the SDist.
+
+    Lower levels are faster and usually produce archives only slightly larger.
+
+    .. versionadded:: 1.1
+    """
+
+
+@dataclasses.dataclass
+class WheelCompressionSettings:
+    level: int = 6
+    """
+    The deflate compression level (0-9) used for files in the wheel.
+
+    .. versionadded:: 1.1
+    """
+
+    store: list[str] = dataclasses.field(default_factory=list)
+    """
+    Files to store in the wheel without compression.
+
+    Useful for files that are already compressed, such as ``*.gz`` or ``*.png``.
+    Supports gitignore syntax, matched against the path inside the wheel.
+
+    .. versionadded:: 1.1
+    """
+
+    store_incompressible: bool = False
+    """
+    Store files without compression if their contents do not compress.
+
+    The start of each file is compressed at a fast level to decide, so already
+    compressed files don't pay for a full compression pass.
+
+    .. versionadded:: 1.1
+    """
+
+    cache: bool = False
+    """
+    Reuse compressed files from previous builds. Requires ``build-dir``.
+
+    Compressed wheel members are stored in the build directory, keyed by the
+    hash of their contents and the compression settings. Files unchanged since
+    an earlier build are copied into the wheel without recompressing them; the
+    wheel is identical to one built without the cache.
+
+    .. versionadded:: 1.1
+    """
+
+    cache_size: int = 1024
+    """
+    Maximum size of the compression cache, in MiB.
+
+    The least recently used entries are removed after each build to stay under
+    this size.
+
+    .. versionadded:: 1.1
+    """
+
+
+@dataclasses.dataclass
+class WheelBuildCacheSettings:
+    dir: str = ""
+    """
+    A directory to cache built wheels in, so unchanged builds are skipped.
+
+    Before configuring, the build is fingerprinted: the files that would go
+    into the SDist, the ``wheel.force-include`` files, the settings, the
+    project version, the wheel tags, the Python, CMake and compiler versions,
+    and the environment variables that affect a build (like ``CC``,
+    ``CFLAGS``, ``CMAKE_*`` and ``SKBUILD_*``). If a wheel was built with the
+    same fingerprint, it is returned without building. Not used for editable
+    installs. Empty (the default) disables the cache.
+
+    .. versionadded:: 1.1
+    """
+
+    max_size: int = 4096
+    """
+    Maximum size of the wheel cache directory, in MiB.
+
+    The least recently used wheels are removed after each build to stay under
+    this size.
+
+    .. versionadded:: 1.1
+    """
+
+    backend: str = ""
+    """
+    A wheel cache backend to use, as ``module:object``.
+
+    The object is called without arguments and must return an object with
+    ``get(key, folder)`` and ``put(key, files)`` methods (see
+    ``scikit_build_core.build._wheel_cache.WheelCacheBackend``). It is used
+    after the cache directory, if both are set, and is filled in the same way.
+
+    .. versionadded:: 1.1
+    """
+
+
 @dataclasses.dataclass
 class SDistSettings:
     include: list[str] = dataclasses.field(default_factory=list)
@@ -349,11 +453,11 @@ class SDistSettings:
        :confval:`sdist.include`
     """
 
-    inclusion_mode: Optional[Literal["classic", "default", "manual", "explicit"]] = (
-        dataclasses.field(
-            default=None,
-            metadata=SettingsFieldMetadata(display_default='"default"  # "classic"'),
-        )
+    inclusion_mode: Optional[
+        Literal["classic", "default", "manual", "explicit", "git"]
+    ] = dataclasses.field(
+        default=None,
+        metadata=SettingsFieldMetadata(display_default='"default"  # "classic"'),
     )
     """
     Method to use to compute the files to include and exclude.
@@ -366,6 +470,9 @@ class SDistSettings:
     * "explicit": Opt-in only. Nothing is included unless it matches an ``include``
       pattern, and ``exclude`` is applied after, so it can trim included files back
       out. Like "manual", git ignore files are not read.
+    * "git": Like "default", but the files are listed by git (tracked files, and
+      untracked files that are not ignored) instead of walking the directory
+      tree. Falls back to "default" outside a git work tree.
 
     If you don't set this, it will be "default" unless you set the minimum
     version below 0.12, in which case it will be "classic".
@@ -373,6 +480,8 @@ class SDistSettings:
     .. versionadded:: 0.12
     .. versionchanged:: 1.0
        Added the "explicit" mode.
+    .. versionchanged:: 1.1
+       Added the "git" mode.
     """
 
     reproducible: bool = True
@@ -439,6 +548,37 @@ class SDistSettings:
     .. versionadded:: 1.0
     """
 
+    compression: SDistCompressionSettings = dataclasses.field(
+        default_factory=SDistCompressionSettings
+    )
+    """
+    Compression settings for the SDist.
+    """
+
+    jobs: int = 1
+    """
+    Number of threads used to compress the SDist.
+
+    With any value but 1, the archive is compressed in independent blocks on
+    a thread pool (like ``pigz``), and is a bit larger. The blocks do not
+    depend on the number of threads, so the SDist is reproducible for any
+    value other than 1. 0 uses the number of CPUs available to the process.
+
+    .. versionadded:: 1.1
+    """
+
+    read_ahead: int = 0
+    """
+    Read up to this many MiB of upcoming files ahead while writing the SDist.
+
+    Files are opened and read on a thread pool, ahead of the one being added
+    to the archive, which hides the per-file latency of network file systems
+    (like NFS or Lustre). The archive is the same. The default (0) reads each
+    file when it is added.
+
+    .. versionadded:: 1.1
+    """
+
 
 @dataclasses.dataclass
 class WheelSettings:
@@ -631,6 +771,112 @@ class WheelSettings:
        :confval:`sdist.reproducible`
     """
 
+    jobs: int = 0
+    """
+    Number of threads used to stage and compress files into the wheel.
+
+    Package files are copied into the staging directory and compressed ahead
+    on a thread pool, and written in the usual sorted order, so the wheel
+    contents do not depend on this value. The default (0) uses the number of
+    CPUs available to the process; set it to 1 to work serially.
+
+    .. versionadded:: 1.1
+    """
+
+    read_ahead: int = 0
+    """
+    Read up to this many MiB of upcoming files ahead while writing the wheel.
+
+    Only used when :confval:`wheel.jobs` is 1 (otherwise, the compression
+    threads already read ahead). Files are opened and read on a thread pool,
+    ahead of the one being added to the wheel, which hides the per-file
+    latency of network file systems (like NFS or Lustre). The wheel is the
+    same. The default (0) reads each file when it is added.
+
+    .. versionadded:: 1.1
+    """
+
+    compression: WheelCompressionSettings = dataclasses.field(
+        default_factory=WheelCompressionSettings
+    )
+    """
+    Compression settings for the wheel.
+    """
+
+    size_report: bool = False
+    """
+    Write a JSON report of the wheel's size next to the wheel.
+
+    The report, ``<wheel name>.size-report.json``, lists the uncompressed size,
+    compressed size and ratio of every file and directory in the wheel, largest
+    first. A summary of the largest entries is always logged at the INFO level.
+
+    .. versionadded:: 1.1
+    """
+
+    compile_bytecode: bool = False
+    """
+    Include bytecode for the Python modules in the wheel.
+
+    The modules in the wheel's platlib or purelib are compiled by the Python
+    running the build, as unchecked hash-based pycs (PEP 552), so the wheel
+    stays reproducible. They are only used by that Python version, and are
+    not checked against the source files once installed. Modules that do not
+    compile are skipped with a warning. Nothing is compiled (with a warning)
+    if the wheel's tags are for other Pythons too, like ``py3-none`` or abi3
+    wheels. Ignored for editable installs.
+
+    .. versionadded:: 1.1
+    """
+
+    metadata_sidecar: bool = False
+    """
+    Write a PEP 658 ``<wheel>.metadata`` file next to the wheel.
+
+    This is a copy of the wheel's METADATA that package indexes can serve so
+    installers can resolve dependencies without downloading the wheel. It is
+    written atomically, and is also written into the metadata directory by
+    ``prepare_metadata_for_build_wheel``.
+
+    .. versionadded:: 1.1
+    """
+
+    build_cache: WheelBuildCacheSettings = dataclasses.field(
+        default_factory=WheelBuildCacheSettings
+    )
+    """
+    Cache whole wheels across builds.
+    """
+
+    reuse_metadata: bool = False
+    """
+    Reuse the settings and metadata of ``prepare_metadata_for_build_wheel`` when building.
+
+    Frontends call each PEP 517 hook in a new process. With this enabled, the
+    prepare-metadata hook saves its resolved settings and metadata (including
+    dynamic metadata) in a private temporary directory, and the build hook of
+    the same frontend run, environment, ``pyproject.toml`` and config settings
+    loads them instead of computing the metadata again (the settings are still
+    read and validated). Not used if an override from any configuration
+    source depends on the ``state``.
+
+    .. versionadded:: 1.1
+    """
+
+    staging: Literal["copy", "link", "auto"] = "auto"
+    """
+    How package files are copied into the wheel staging directory.
+
+    ``"auto"`` clones files (a reflink, on filesystems like XFS or btrfs that
+    support it), and otherwise copies them with ``copy_file_range``. ``"link"``
+    also hard links files when they cannot be cloned; the staged files are
+    never modified in place. Hard links are not used for a persistent
+    ``build-dir``, where later builds write into the staged tree. ``"copy"``
+    always makes a plain copy. The wheel contents are the same in every mode.
+
+    .. versionadded:: 1.1
+    """
+
 
 @dataclasses.dataclass
 class BackportSettings:
@@ -933,7 +1179,9 @@ class ScikitBuildSettings:
     """
     The CMake build directory. Defaults to a unique temporary directory.
 
-    This can be set to reuse the build directory from previous runs.
+    This can be set to reuse the build directory from previous runs. The wheel
+    is then also staged in ``.skbuild-wheel-staging`` inside it and kept in
+    sync between builds, so unchanged files are not copied or installed again.
     """
 
     fail: Optional[bool] = dataclasses.field(
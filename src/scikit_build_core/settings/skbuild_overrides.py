@@ -35,7 +35,12 @@ from ..cmake import CMake
 from ..errors import CMakeNotFoundError
 from ..resources import resources
 
-__all__ = ["OverrideRecord", "process_overrides", "regex_match"]
+__all__ = [
+    "OverrideRecord",
+    "has_state_condition",
+    "process_overrides",
+    "regex_match",
+]
 
 
 def __dir__() -> list[str]:
@@ -353,6 +358,24 @@ def record_override(
     )
 
 
+def has_state_condition(tool_skb: Mapping[str, Any]) -> bool:
+    """
+    Check if any of the overrides in a ``tool.scikit-build`` table is
+    conditional on the build state. Malformed overrides are left for
+    :func:`process_overrides` to report.
+    """
+    for override in tool_skb.get("overrides", []):
+        if_override = override.get("if") if isinstance(override, dict) else None
+        if not isinstance(if_override, dict):
+            continue
+        any_override = if_override.get("any", {})
+        if "state" in if_override or (
+            isinstance(any_override, dict) and "state" in any_override
+        ):
+            return True
+    return False
+
+
 def process_overrides(
     tool_skb: dict[str, Any],
     *,
@@ -48,7 +48,7 @@ from .skbuild_model import (
     ScikitBuildSettings,
     normalize_build_types,
 )
-from .skbuild_overrides import process_overrides, strtobool
+from .skbuild_overrides import has_state_condition, process_overrides, strtobool
 from .sources import ConfSource, EnvSource, Source, SourceChain, TOMLSource
 
 TYPE_CHECKING = False
@@ -279,6 +279,11 @@ class SettingsReader:
 
         # Handle overrides
         pyproject = copy.deepcopy(pyproject)
+        # True if an override from any source depends on the state, so the
+        # settings could differ between hooks of one build
+        self.state_dependent = has_state_condition(
+            pyproject.get("tool", {}).get("scikit-build", {})
+        )
         self.overrides, self.overridden_items = process_overrides(
             pyproject.get("tool", {}).get("scikit-build", {}),
             state=state,
@@ -322,6 +327,7 @@ class SettingsReader:
 
         if extra_settings is not None:
             extra_skb = copy.deepcopy(dict(extra_settings))
+            self.state_dependent |= has_state_condition(extra_skb)
             extra_matched, extra_overridden = process_overrides(
                 extra_skb, state=state, env=env, retry=retry
             )
@@ -351,6 +357,7 @@ class SettingsReader:
                 state=state, env=environ
             ):
                 ep_skb = copy.deepcopy(ep_table)
+                self.state_dependent |= has_state_condition(ep_skb)
                 # Any [[overrides]] in the provider table (including inherit
                 # append/prepend) resolve against the provider's own table
                 # here; cross-source merging happens later in SourceChain,
@@ -456,6 +463,18 @@ class SettingsReader:
             elif not self.settings.build_dir:
                 rich_error("editable mode with rebuild requires build-dir")
 
+        if self.settings.wheel.compression.cache and not self.settings.build_dir:
+            rich_error("wheel.compression.cache requires build-dir")
+
+        for name, compression in (
+            ("sdist", self.settings.sdist.compression),
+            ("wheel", self.settings.wheel.compression),
+        ):
+            if not 0 <= compression.level <= 9:
+                rich_error(
+                    f"{name}.compression.level must be between 0 and 9, got {compression.level}"
+                )
+
         install_policy = (
             self.settings.minimum_version is None
             or self.settings.minimum_version >= Version("0.5")
@@ -555,6 +574,14 @@ class SettingsReader:
                 rich_error(
                     'minimum-version must be at least 1.0 to use sdist.inclusion-mode = "explicit"'
                 )
+            if (
+                self.settings.sdist.inclusion_mode == "git"
+                and self.settings.minimum_version is not None
+                and self.settings.minimum_version < Version("1.1")
+            ):
+                rich_error(
+                    'minimum-version must be at least 1.1 to use sdist.inclusion-mode = "git"'
+                )
         elif (
             self.settings.minimum_version is not None
             and self.settings.minimum_version < Version("0.12")
@@ -68,6 +68,7 @@ When setting up your dataclasses, these types are handled:
 
 - ``str``: A string type, nothing special.
 - ``bool``: Supports bool in TOML, not handled in envvar/config (so only useful in a Union)
+- ``int``: Supports int in TOML, parsed from the string in envvar/config.
 - Any callable (`Path`, `Version`): Passed the string input.
 - ``Optional[T]``: Treated like T. Default should be None, since no input format supports None's.
 - ``Union[str, ...]``: Supports other input types in TOML form (bool currently). Otherwise a string.
@@ -80,7 +81,7 @@ When setting up your dataclasses, these types are handled:
 
 These are supported for JSON schema generation for the TOML, as well.
 
-Integers/floats would be easy to add, but haven't been needed yet.
+Floats would be easy to add, but haven't been needed yet.
 """
 
 from __future__ import annotations
@@ -0,0 +1,89 @@
+"""
+Compare PathMatcher with the plain pathspec.GitIgnoreSpec it wraps, checking
+many paths against many gitignore-style patterns.
+
+Run with ``nox -s benchmarks -- bench_matcher`` or directly with Python.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import pathspec
+
+from scikit_build_core.build._matcher import PathMatcher
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def make_patterns(count: int) -> list[str]:
+    # A mix of the pattern kinds found in real ignore files; one in ten
+    # excludes a whole package directory.
+    kinds = [
+        "*.ext{i}",
+        "/generated{i}.py",
+        "**/cache{i}/",
+        "docs/build{i}/**",
+        "file{i}.txt",
+        "pkg/sub{i}/data/*.bin",
+        "tmp{i}?",
+        "*.bak{i}",
+        "notes{i}.md",
+        "pkg/sub{i}/",
+    ]
+    return [kinds[i % len(kinds)].format(i=i) for i in range(count)]
+
+
+def make_paths(count: int) -> list[str]:
+    # Packages of 100 modules each, like a source tree walked file by file
+    return [f"pkg/sub{i // 100}/mod{i % 100}.py" for i in range(count)]
+
+
+def count_spec(patterns: list[str], paths: list[str]) -> int:
+    spec = pathspec.GitIgnoreSpec.from_lines(patterns)
+    return sum(spec.match_file(p) for p in paths)
+
+
+def count_matcher(patterns: list[str], paths: list[str]) -> int:
+    # A new matcher each time, so compiling and caching are included
+    matcher = PathMatcher(patterns)
+    return sum(matcher.match_file(p) for p in paths)
+
+
+def best_of(repeat: int, func: Callable[[], int]) -> tuple[float, int]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--patterns", type=int, default=2_000)
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    patterns = make_patterns(args.patterns)
+    paths = make_paths(args.files)
+
+    spec_time, spec_count = best_of(args.repeat, lambda: count_spec(patterns, paths))
+    matcher_time, matcher_count = best_of(
+        args.repeat, lambda: count_matcher(patterns, paths)
+    )
+
+    assert spec_count == matcher_count
+    print(f"{args.patterns} patterns, {args.files} files, {matcher_count} matched")
+    print(f"GitIgnoreSpec: {spec_time:.3f}s")
+    print(
+        f"PathMatcher:   {matcher_time:.3f}s ({spec_time / matcher_time:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
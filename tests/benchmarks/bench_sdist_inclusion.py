@@ -0,0 +1,90 @@
+"""
+Compare the "git" SDist inclusion mode, which lists files with git ls-files,
+with the "default" mode's directory walk, on a synthetic git checkout of many
+small files.
+
+Run with ``nox -s benchmarks -- bench_sdist_inclusion`` or directly with Python.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from scikit_build_core.build._file_processor import each_unignored_file
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def make_repo(root: Path, files: int) -> None:
+    # Packages of 500 modules each, with a build directory and an ignored
+    # cache next to every package, and a few nested ignore files.
+    (root / "pyproject.toml").write_text("[project]\nname = 'bench'\n")
+    (root / ".gitignore").write_text("*.pyc\n/build/\n")
+    for i in range(files):
+        pkg, mod = divmod(i, 500)
+        path = root / "src" / "bench" / f"sub{pkg}" / f"mod{mod}.py"
+        if mod == 0:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if pkg % 10 == 0:
+                path.parent.joinpath(".gitignore").write_text("*.tmp\n")
+            path.parent.joinpath("mod0.pyc").write_bytes(b"")
+        path.write_bytes(b"")
+    (root / "build").mkdir()
+    for i in range(files // 10):
+        (root / "build" / f"obj{i}.o").write_bytes(b"")
+    env = {**os.environ, "GIT_AUTHOR_NAME": "bench", "GIT_COMMITTER_NAME": "bench"}
+    for args in (["init", "-q"], ["add", "."]):
+        subprocess.run(["git", *args], cwd=root, check=True, env=env)
+
+
+def best_of(repeat: int, func: Callable[[], list[Path]]) -> tuple[float, list[Path]]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        make_repo(root, args.files)
+        cwd = Path.cwd()
+        os.chdir(root)
+        try:
+            walk_time, walk_files = best_of(
+                args.repeat,
+                lambda: sorted(
+                    each_unignored_file(Path(), build_dir="build", mode="default")
+                ),
+            )
+            git_time, git_files = best_of(
+                args.repeat,
+                lambda: sorted(
+                    each_unignored_file(Path(), build_dir="build", mode="git")
+                ),
+            )
+        finally:
+            os.chdir(cwd)
+
+    assert walk_files == git_files
+    print(f"{args.files} files, {len(git_files)} included")
+    print(f"walk: {walk_time:.3f}s")
+    print(f"git:  {git_time:.3f}s ({walk_time / git_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
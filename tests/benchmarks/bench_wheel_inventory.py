@@ -0,0 +1,97 @@
+"""
+Compare the scandir inventory used by WheelWriter.build with the sorted glob
+walk it replaced, on a synthetic tree of many small files.
+
+Run with ``nox -s benchmarks -- bench_wheel_inventory`` or directly with Python.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pathspec
+
+from scikit_build_core.build._matcher import PathMatcher, path_matcher
+from scikit_build_core.build._wheelfile import _scan_wheel_dir
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def glob_inventory(root: Path, exclude_spec: pathspec.GitIgnoreSpec) -> list[str]:
+    exclude_exempt: frozenset[Path] = frozenset()
+    files = []
+    for filename in sorted(root.glob("**/*")):
+        if not filename.is_file():
+            continue
+        if any(x.endswith(".dist-info") for x in filename.parts):
+            continue
+        if filename.suffix in {".pyc", ".pyo"}:
+            continue
+        relpath = filename.relative_to(root)
+        if (
+            exclude_spec.match_file(relpath)
+            and filename.resolve() not in exclude_exempt
+        ):
+            continue
+        # The writer used to fstat each file again when opening it
+        filename.stat()
+        files.append(relpath.as_posix())
+    return files
+
+
+def scandir_inventory(root: Path, exclude_spec: PathMatcher) -> list[str]:
+    return [relpath for relpath, _ in _scan_wheel_dir(root, exclude_spec)]
+
+
+def make_tree(root: Path, files: int) -> None:
+    # Packages of 500 modules each, with a fifth of the files in test data
+    # directories that wheel.exclude removes.
+    for i in range(files):
+        pkg, mod = divmod(i, 500)
+        subdir = "tests" if pkg % 5 == 4 else f"sub{pkg}"
+        path = root / "pkg" / subdir / f"group{pkg}" / f"mod{mod}.py"
+        if mod == 0:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+
+
+def best_of(repeat: int, func: Callable[[], list[str]]) -> tuple[float, list[str]]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    exclude = ["tests/"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        make_tree(root, args.files)
+        glob_time, glob_files = best_of(
+            args.repeat,
+            lambda: glob_inventory(root, pathspec.GitIgnoreSpec.from_lines(exclude)),
+        )
+        scan_time, scan_files = best_of(
+            args.repeat, lambda: scandir_inventory(root, path_matcher(exclude))
+        )
+
+    assert glob_files == scan_files
+    print(f"{args.files} files, {len(scan_files)} packaged")
+    print(f"sorted glob: {glob_time:.3f}s")
+    print(f"scandir:     {scan_time:.3f}s ({glob_time / scan_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
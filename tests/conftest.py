@@ -417,6 +417,15 @@ def protect_get_requires(fp, monkeypatch):
     monkeypatch.setattr(importlib.util, "find_spec", find_spec)
 
 
+@pytest.fixture(autouse=True)
+def _no_program_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests fake the output of CMake and Ninja; a result cached by an earlier
+    test (or build) for the same program would hide it.
+    """
+    monkeypatch.setenv("SKBUILD_NO_PROGRAM_CACHE", "1")
+
+
 @pytest.fixture(autouse=True)
 def _stub_macos_arch_probe(request: pytest.FixtureRequest) -> None:
     """
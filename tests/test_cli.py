@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import zipfile
+from pathlib import Path
+
 from scikit_build_core.__main__ import main
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from pathlib import Path
-
     import pytest
 
 
@@ -16,6 +17,7 @@ def test_cli_no_args(capsys: pytest.CaptureFixture[str]) -> None:
     assert "scikit-build builder" in out
     assert "scikit-build file-api" in out
     assert "scikit-build init" in out
+    assert "scikit-build wheel retag" in out
 
 
 def test_cli_builder(capsys: pytest.CaptureFixture[str]) -> None:
@@ -63,3 +65,35 @@ def test_cli_build_requires(
     main(["build", "requires", "--mode=sdist"])
     out, _ = capsys.readouterr()
     assert "scikit-build-core" in out
+
+
+def test_cli_wheel_retag(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    wheel = tmp_path / "pkg-1.0-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("pkg/__init__.py", "")
+        zf.writestr(
+            "pkg-1.0.dist-info/WHEEL",
+            "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+        )
+        zf.writestr("pkg-1.0.dist-info/RECORD", "")
+
+    main(
+        [
+            "wheel",
+            "retag",
+            str(wheel),
+            "--tag=py2.py3-none-any",
+            "--tag=py3-none-manylinux_2_17_x86_64",
+            "--build-tag=1",
+            f"--outdir={tmp_path / 'out'}",
+        ]
+    )
+    out, _ = capsys.readouterr()
+    assert [Path(line).name for line in out.splitlines()] == [
+        "pkg-1.0-1-py2.py3-none-any.whl",
+        "pkg-1.0-1-py3-none-manylinux_2_17_x86_64.whl",
+    ]
+    with zipfile.ZipFile(tmp_path / "out" / "pkg-1.0-1-py2.py3-none-any.whl") as zf:
+        assert zf.testzip() is None
+        wheel_file = zf.read("pkg-1.0.dist-info/WHEEL").decode()
+    assert "Tag: py2-none-any\nTag: py3-none-any\nBuild: 1\n" in wheel_file
@@ -303,6 +303,58 @@ def test_install_targets(tmp_path: Path, fp):
     assert not any("--install" in c for c in fp.calls)
 
 
+@pytest.mark.parametrize("version", ["3.14", "3.15"])
+def test_build_targets(tmp_path: Path, fp, version: str):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    build_dir = tmp_path / "build"
+
+    config = CMaker(
+        CMake(Version(version), Path("cmake")),
+        source_dir=source_dir,
+        build_dir=build_dir,
+        build_type="Release",
+        single_config=True,
+    )
+
+    fp.register([fp.program("cmake"), fp.any()], occurrences=10)
+
+    config.build(["-j2"], targets=["one", "two"])
+    config.install(tmp_path / "prefix", targets=["install-one", "install-two"])
+
+    calls = [[os.fspath(arg) for arg in call] for call in fp.calls]
+    if version == "3.14":
+        # Only the last --target is used, so one call per target
+        assert calls == [
+            ["cmake", "--build", os.fspath(build_dir), "--target", "one", "-j2"],
+            ["cmake", "--build", os.fspath(build_dir), "--target", "two", "-j2"],
+            ["cmake", "--build", os.fspath(build_dir), "--target", "install-one"],
+            ["cmake", "--build", os.fspath(build_dir), "--target", "install-two"],
+        ]
+    else:
+        assert calls == [
+            [
+                "cmake",
+                "--build",
+                os.fspath(build_dir),
+                "--target",
+                "one",
+                "--target",
+                "two",
+                "-j2",
+            ],
+            [
+                "cmake",
+                "--build",
+                os.fspath(build_dir),
+                "--target",
+                "install-one",
+                "--target",
+                "install-two",
+            ],
+        ]
+
+
 def test_install_targets_and_components(tmp_path: Path, fp):
     source_dir = tmp_path / "src"
     source_dir.mkdir()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import shutil
+import subprocess
 import sys
 import threading
 from pathlib import Path
@@ -550,6 +552,40 @@ def test_nested_gitignore(
     assert result == expected | {Path("src/utils.py")}
 
 
+def test_nested_gitignore_above_starting_path(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mode: Literal["default", "classic", "manual"],
+) -> None:
+    """
+    Nested .gitignore files between the root and the starting path apply too.
+    """
+    monkeypatch.chdir(tmp_path)
+    set(
+        _mk_files(
+            tmp_path,
+            """
+        src/.gitignore: *.c
+        src/pkg/.gitignore: data/
+        src/pkg/__init__.py
+        src/pkg/module.c
+        src/pkg/data/file.txt
+        src/pkg/sub/data/file.txt
+        """,
+        )
+    )
+
+    result = set(each_unignored_file(Path("src/pkg"), mode=mode))
+    expected = {Path("src/pkg/.gitignore"), Path("src/pkg/__init__.py")}
+    if mode == "manual":
+        expected |= {
+            Path("src/pkg/module.c"),
+            Path("src/pkg/data/file.txt"),
+            Path("src/pkg/sub/data/file.txt"),
+        }
+    assert result == expected
+
+
 def test_build_dir_exclusion(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -853,3 +889,68 @@ def test_nonexistent_patterns(
             Path("tests/tmp.py"),
         }
     assert exclude_result == expected
+
+
+def _git(*args: str) -> None:
+    subprocess.run(["git", *args], check=True, capture_output=True)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is required")
+def test_git_mode(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    set(
+        _mk_files(
+            tmp_path,
+            """
+        pyproject.toml
+        .gitignore: *.log
+        src/pkg/__init__.py
+        src/pkg/tracked.log
+        src/pkg/untracked.py
+        src/pkg/generated.log
+        src/pkg/.gitignore: secret.txt
+        src/pkg/secret.txt
+        docs/index.md
+        build/out.txt
+        """,
+        )
+    )
+    _git("init")
+    _git("add", "pyproject.toml", ".gitignore", "src/pkg/__init__.py", "docs")
+    _git("add", "--force", "src/pkg/tracked.log")
+    (tmp_path / "docs" / "index.md").unlink()
+
+    result = set(each_unignored_file(Path(), build_dir="build", mode="git"))
+    assert result == {
+        Path(".gitignore"),
+        Path("pyproject.toml"),
+        Path("src/pkg/.gitignore"),
+        Path("src/pkg/__init__.py"),
+        Path("src/pkg/tracked.log"),
+        Path("src/pkg/untracked.py"),
+    }
+
+    result = set(
+        each_unignored_file(
+            Path("src/pkg"),
+            include=["generated.log"],
+            exclude=["untracked.py"],
+            mode="git",
+        )
+    )
+    assert result == {
+        Path("src/pkg/.gitignore"),
+        Path("src/pkg/__init__.py"),
+        Path("src/pkg/generated.log"),
+        Path("src/pkg/tracked.log"),
+    }
+
+
+def test_git_mode_falls_back(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    _setup_test_filesystem(tmp_path)
+
+    # The fake .git directory isn't a repository
+    assert set(each_unignored_file(Path(), mode="git")) == set(
+        each_unignored_file(Path(), mode="default")
+    )
@@ -17,6 +17,10 @@ def test_convert_str_or_bool():
     }
 
 
+def test_convert_int():
+    assert convert_type(int, normalize_keys=False) == {"type": "integer"}
+
+
 def test_convert_optional_str():
     assert convert_type(Optional[str], normalize_keys=False) == {"type": "string"}
 
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import itertools
+from pathlib import Path
+
+import pathspec
+import pytest
+
+from scikit_build_core.build._matcher import PathMatcher, path_matcher
+
+PATTERNS = [
+    "*.py",
+    "tests/",
+    "/build",
+    "docs/**",
+    "**/data/*.txt",
+    "pkg/sub",
+    "*.so",
+    "a?c",
+    "[ab]*/",
+    "# comment",
+    "",
+]
+
+PATHS = [
+    "setup.py",
+    "pkg/__init__.py",
+    "pkg/sub",
+    "pkg/sub/",
+    "pkg/sub/mod.c",
+    "tests",
+    "tests/",
+    "tests/test_x.py",
+    "tests/data/file.txt",
+    "src/tests/deep/file.c",
+    "build/file.o",
+    "src/build/file.o",
+    "docs/index.md",
+    "docs/api/",
+    "data/file.txt",
+    "pkg/data/file.txt",
+    "pkg/data/file.bin",
+    "abc",
+    "abc/x",
+    "bin/tool",
+    "lib/ext.so",
+    "README.md",
+]
+
+
+@pytest.mark.parametrize("negate", ["", "!pkg/sub/mod.c", "!tests/test_x.py"])
+def test_path_matcher_same_as_gitignorespec(negate: str) -> None:
+    for count in (0, 1, 3, len(PATTERNS)):
+        for lines in itertools.islice(itertools.combinations(PATTERNS, count), 50):
+            lines_ = [*lines, negate] if negate else list(lines)
+            spec = pathspec.GitIgnoreSpec.from_lines(lines_)
+            matcher = PathMatcher(lines_)
+            # Twice, the second time from the directory cache
+            for path in [*PATHS, *PATHS]:
+                expected = spec.check_file(path)
+                result = matcher.check_file(path)
+                assert result.include == expected.include, (lines_, path)
+                assert result.file == path
+                assert matcher.match_file(Path(path)) == spec.match_file(Path(path))
+
+
+def test_path_matcher_shared() -> None:
+    assert path_matcher(["*.py"]) is path_matcher(("*.py",))
+    assert path_matcher(["*.py"]) is not path_matcher(["*.pyc"])
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from scikit_build_core.build._prefetch import read_ahead
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_read_ahead(tmp_path: Path) -> None:
+    paths = []
+    for i in range(50):
+        path = tmp_path / f"file{i}.txt"
+        path.write_bytes(b"x" * i)
+        paths.append(path)
+    big = tmp_path / "big.txt"
+    big.write_bytes(b"y" * 100)
+    paths[10:10] = [tmp_path, big, tmp_path / "missing.txt"]
+
+    results = list(read_ahead(paths, max_bytes=60, threads=2))
+
+    # In order; None for a directory, a file over the limit, or a missing file
+    assert results[10:13] == [None, None, None]
+    del results[10:13]
+    assert results == [b"x" * i for i in range(50)]
+
+
+def test_read_ahead_bounded(tmp_path: Path) -> None:
+    paths = []
+    for i in range(20):
+        path = tmp_path / f"file{i}.txt"
+        path.write_bytes(b"x" * 10)
+        paths.append(path)
+
+    results = read_ahead(paths, max_bytes=30, threads=4)
+    assert next(results) == b"x" * 10
+    # Only what fits in the limit is read ahead, so the last file isn't read
+    # yet and the change is seen
+    paths[-1].write_bytes(b"z" * 10)
+    rest = list(results)
+    assert len(rest) == 19
+    assert rest[-1] == b"z" * 10
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import os
+import subprocess
 import sys
+import tempfile
 import textwrap
 import types
 from pathlib import Path
@@ -15,6 +18,7 @@ from scikit_build_core.build import (
 )
 from scikit_build_core.build.metadata import get_standard_metadata
 from scikit_build_core.settings.skbuild_model import ScikitBuildSettings
+from scikit_build_core.settings.skbuild_read_settings import SettingsReader
 
 
 @pytest.mark.parametrize("package", ["simplest_c"], indirect=True)
@@ -167,3 +171,128 @@ def test_prepare_metadata_for_build_wheel_variant(fp, monkeypatch, tmp_path):
     assert (
         mddir / out / "variant.json"
     ).read_text() == "label=cpu;properties=cpu :: abi :: cp313"
+
+
+REUSE_PYPROJECT = """\
+[build-system]
+requires = ["scikit-build-core"]
+build-backend = "scikit_build_core.build"
+
+[project]
+name = "pkg"
+version = "0.1.0"
+
+[tool.scikit-build]
+wheel.cmake = false
+wheel.reuse-metadata = true
+"""
+
+
+def _reuse_project(tmp_path: Path, pyproject: str = REUSE_PYPROJECT) -> Path:
+    root = tmp_path / "proj"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pyproject.toml").write_text(pyproject)
+    (root / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "metadata").mkdir()
+    return root
+
+
+def test_build_wheel_reuses_prepared_metadata(tmp_path, monkeypatch):
+    monkeypatch.chdir(_reuse_project(tmp_path))
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    from scikit_build_core.build import build_wheel
+
+    mddir = tmp_path / "metadata"
+    assert prepare_metadata_for_build_wheel(str(mddir)) == "pkg-0.1.0.dist-info"
+
+    def not_resolved(*_args: Any, **_kwargs: Any) -> None:
+        msg = "Should have been reused from the metadata hook"
+        raise AssertionError(msg)
+
+    validated: list[SettingsReader] = []
+
+    def validate(self: SettingsReader) -> None:
+        validated.append(self)
+
+    with monkeypatch.context() as m:
+        m.setattr("scikit_build_core.build.wheel.get_standard_metadata", not_resolved)
+        m.setattr(SettingsReader, "validate_may_exit", validate)
+        out = build_wheel(
+            str(tmp_path / "dist"), None, str(mddir / "pkg-0.1.0.dist-info")
+        )
+    assert out == "pkg-0.1.0-py3-none-any.whl"
+    # The settings are still validated
+    assert len(validated) == 1
+
+    # The snapshot is used once
+    (snapshots,) = tmp_path.glob("scikit-build-core-hooks*")
+    assert list(snapshots.iterdir()) == []
+
+
+def test_prepared_metadata_not_reused_with_state_override(tmp_path, monkeypatch):
+    pyproject = REUSE_PYPROJECT + textwrap.dedent(
+        """\
+        [[tool.scikit-build.overrides]]
+        if.state = "wheel"
+        wheel.packages = ["pkg"]
+        """
+    )
+    monkeypatch.chdir(_reuse_project(tmp_path, pyproject))
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    prepare_metadata_for_build_wheel(str(tmp_path / "metadata"))
+    assert not list(tmp_path.glob("scikit-build-core-hooks*/*"))
+
+
+def test_prepared_metadata_not_reused_with_provider_state_override(
+    tmp_path, monkeypatch
+):
+    # An installed package's config, not the project's
+    table = {"overrides": [{"if": {"state": "wheel"}, "wheel": {"packages": []}}]}
+    monkeypatch.setattr(
+        "scikit_build_core.settings.skbuild_read_settings.load_config_providers",
+        lambda **_: [("default", "distro", table)],
+    )
+    monkeypatch.chdir(_reuse_project(tmp_path))
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    prepare_metadata_for_build_wheel(str(tmp_path / "metadata"))
+    assert not list(tmp_path.glob("scikit-build-core-hooks*/*"))
+
+
+def test_prepared_metadata_handed_to_build_process(tmp_path):
+    root = _reuse_project(tmp_path)
+    env = {**os.environ, "TMPDIR": str(tmp_path)}
+    mddir = tmp_path / "metadata"
+    dist_info = mddir / "pkg-0.1.0.dist-info"
+
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "from scikit_build_core.build import prepare_metadata_for_build_wheel;"
+                f"prepare_metadata_for_build_wheel({str(mddir)!r})"
+            ),
+        ],
+        check=True,
+        cwd=root,
+        env=env,
+    )
+    # Like a frontend, run the build hook in another process
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import scikit_build_core.build.wheel as w;"
+                "w.get_standard_metadata = None;"
+                "from scikit_build_core.build import build_wheel;"
+                f"build_wheel({str(tmp_path / 'dist')!r}, None, {str(dist_info)!r})"
+            ),
+        ],
+        check=True,
+        cwd=root,
+        env=env,
+    )
+    assert (tmp_path / "dist" / "pkg-0.1.0-py3-none-any.whl").is_file()
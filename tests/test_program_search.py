@@ -2,19 +2,29 @@ from __future__ import annotations
 
 import logging
 import subprocess
-from pathlib import Path
+import sys
+import threading
+import types
+from pathlib import Path, PurePosixPath
 
 import pytest
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
 
+from scikit_build_core.builder.generator import get_default_from_cmake
+from scikit_build_core.cmake import CMake
 from scikit_build_core.program_search import (
+    Program,
     best_program,
     get_cmake_program,
     get_cmake_programs,
     get_ninja_programs,
 )
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pytest_subprocess import FakeProcess
+
 
 def test_get_cmake_programs_cmake_module(monkeypatch):
     cmake = pytest.importorskip("cmake")
@@ -190,3 +200,198 @@ def test_compute_timeout_ci_quadruples_base(monkeypatch: pytest.MonkeyPatch) ->
         assert compute_timeout(Path("cmake")) == 20
     finally:
         compute_timeout.cache_clear()
+
+
+def test_program_cache(monkeypatch, fp, tmp_path, caplog):
+    caplog.set_level(logging.INFO)
+    monkeypatch.delenv("SKBUILD_NO_PROGRAM_CACHE")
+    monkeypatch.setenv("SKBUILD_PROGRAM_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("CMAKE_GENERATOR", raising=False)
+    cmake_path = tmp_path / "cmake"
+    cmake_path.write_bytes(b"\x7fELF")
+    ninja_path = tmp_path / "ninja"
+    ninja_path.write_bytes(b"\x7fELF")
+    monkeypatch.setattr(
+        "shutil.which", lambda x: str(ninja_path) if x == "ninja" else None
+    )
+    fp.register(
+        [cmake_path, "-E", "capabilities"], stdout='{"version":{"string":"3.30.1"}}'
+    )
+    fp.register([ninja_path, "--version"], stdout="1.12.1")
+    fp.register(
+        [str(cmake_path), "--help"], stdout="* Ninja = Generates build.ninja files."
+    )
+    cmake = CMake(version=Version("3.30.1"), cmake_path=cmake_path)
+
+    # The second time, nothing is run, but the versions are still logged
+    for _ in range(2):
+        caplog.clear()
+        assert get_cmake_program(cmake_path).version == Version("3.30.1")
+        programs = list(get_ninja_programs(module=False))
+        assert programs == [Program(ninja_path, Version("1.12.1"))]
+        assert get_default_from_cmake(cmake) == "Ninja"
+        assert "CMake version: 3.30.1" in caplog.text
+        assert "Ninja version: 1.12.1" in caplog.text
+
+    # A changed program is run again
+    cmake_path.write_bytes(b"\x7fELF updated")
+    fp.register(
+        [cmake_path, "-E", "capabilities"], stdout='{"version":{"string":"3.31.0"}}'
+    )
+    assert get_cmake_program(cmake_path).version == Version("3.31.0")
+    assert get_cmake_program(cmake_path).version == Version("3.31.0")
+
+    # On Windows, the default depends on the Visual Studio installations found
+    monkeypatch.setattr("scikit_build_core.builder.generator.sys.platform", "win32")
+    for generator in ("Visual Studio 17 2022", "Visual Studio 16 2019"):
+        fp.register(
+            [str(cmake_path), "--help"],
+            stdout=f"* {generator} [arch] = Generates Visual Studio files.",
+        )
+        assert get_default_from_cmake(cmake) == generator
+
+
+def test_program_cache_skips_scripts_and_failures(monkeypatch, fp, tmp_path):
+    monkeypatch.delenv("SKBUILD_NO_PROGRAM_CACHE")
+    monkeypatch.setenv("SKBUILD_PROGRAM_CACHE_DIR", str(tmp_path / "cache"))
+    shim = tmp_path / "cmake"
+    shim.write_text('#!/bin/sh\nexec cmake-3.30 "$@"\n')
+    binary = tmp_path / "cmake3"
+    binary.write_bytes(b"\x7fELF")
+    for version in ("3.30.1", "3.31.0"):
+        fp.register(
+            [shim, "-E", "capabilities"],
+            stdout=f'{{"version":{{"string":"{version}"}}}}',
+        )
+        assert get_cmake_program(shim).version == Version(version)
+
+    # A failed probe may be temporary; it is not cached
+    fp.register([binary, "-E", "capabilities"], stdout="scrambled output\n")
+    assert get_cmake_program(binary).version is None
+    fp.register(
+        [binary, "-E", "capabilities"], stdout='{"version":{"string":"3.30.1"}}'
+    )
+    assert get_cmake_program(binary).version == Version("3.30.1")
+    assert get_cmake_program(binary).version == Version("3.30.1")
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX scripts")
+@pytest.mark.parametrize(
+    "header",
+    [
+        "#!{python}\n",
+        "#!/bin/sh\n'''exec' \"{python}\" \"$0\" \"$@\"\n' '''\n",
+    ],
+    ids=["shebang", "sh"],
+)
+def test_program_cache_console_script(monkeypatch, fp, tmp_path, header):
+    monkeypatch.delenv("SKBUILD_NO_PROGRAM_CACHE")
+    monkeypatch.setenv("SKBUILD_PROGRAM_CACHE_DIR", str(tmp_path / "cache"))
+    # Like the wrapper pip installs for the cmake package
+    script = tmp_path / "cmake"
+    script.write_text(
+        header.format(python=sys.executable) + "from cmake import cmake\ncmake()\n"
+    )
+    fp.register(
+        [script, "-E", "capabilities"], stdout='{"version":{"string":"3.30.1"}}'
+    )
+    for _ in range(2):
+        assert get_cmake_program(script).version == Version("3.30.1")
+
+
+def test_module_scripts_not_probed_again(
+    monkeypatch: pytest.MonkeyPatch, fp: FakeProcess, tmp_path: Path
+) -> None:
+    bin_dir = tmp_path / "site-packages" / "cmake" / "data" / "bin"
+    bin_dir.mkdir(parents=True)
+    scripts = tmp_path / "bin"
+    scripts.mkdir()
+    scripts.joinpath("cmake").write_text("#!/usr/bin/python\n")
+    scripts.joinpath("cmake3").write_bytes(b"\x7fELF")
+
+    class FakeDistribution:
+        files = (PurePosixPath("../bin/cmake"), PurePosixPath("cmake/__init__.py"))
+
+        def locate_file(self, file: PurePosixPath) -> Path:
+            return tmp_path / "site-packages" / file
+
+    monkeypatch.setitem(
+        sys.modules, "cmake", types.SimpleNamespace(CMAKE_BIN_DIR=str(bin_dir))
+    )
+    monkeypatch.setattr(
+        "scikit_build_core.program_search.importlib.metadata.distribution",
+        lambda _name: FakeDistribution(),
+    )
+    monkeypatch.setattr(
+        "shutil.which",
+        lambda x: str(scripts / x) if scripts.joinpath(x).is_file() else None,
+    )
+    fp.register(
+        [bin_dir / "cmake", "-E", "capabilities"],
+        stdout='{"version":{"string":"3.30.1"}}',
+    )
+    fp.register(
+        [scripts / "cmake3", "-E", "capabilities"],
+        stdout='{"version":{"string":"3.20.0"}}',
+    )
+    assert list(get_cmake_programs()) == [
+        Program(bin_dir / "cmake", Version("3.30.1")),
+        Program(scripts / "cmake3", Version("3.20.0")),
+    ]
+
+
+def test_get_cmake_programs_concurrent(monkeypatch, fp):
+    monkeypatch.setattr("shutil.which", lambda x: x)
+    cmake3_started = threading.Event()
+    cmake3_done = threading.Event()
+    concurrent = []
+
+    def cmake(_process):
+        concurrent.append(cmake3_started.wait(5))
+
+    def cmake3(_process):
+        cmake3_started.set()
+        cmake3_done.wait(5)
+
+    fp.register(
+        ["cmake", "-E", "capabilities"],
+        stdout='{"version":{"string":"3.20.0"}}',
+        callback=cmake,
+    )
+    fp.register(
+        ["cmake3", "-E", "capabilities"],
+        stdout='{"version":{"string":"3.19.0"}}',
+        callback=cmake3,
+    )
+
+    # The first acceptable candidate is used without waiting for the second
+    # (which only finishes after this), and both were probed at the same time
+    best = best_program(get_cmake_programs(module=False), version=None)
+    cmake3_done.set()
+    assert best == Program(Path("cmake"), Version("3.20.0"))
+    assert concurrent == [True]
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX scripts")
+def test_get_cmake_programs_kills_abandoned_probes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    tmp_path.joinpath("cmake").write_text(
+        '#!/bin/sh\necho \'{"version":{"string":"3.20.0"}}\'\n'
+    )
+    tmp_path.joinpath("cmake3").write_text("#!/bin/sh\nexec sleep 60\n")
+    for name in ("cmake", "cmake3"):
+        tmp_path.joinpath(name).chmod(0o755)
+    monkeypatch.setattr("shutil.which", lambda x: str(tmp_path / x))
+    monkeypatch.setattr(
+        "scikit_build_core.program_search.compute_timeout", lambda _path: 60
+    )
+
+    before = set(threading.enumerate())
+    best = best_program(get_cmake_programs(module=False), version=None)
+    assert best == Program(tmp_path / "cmake", Version("3.20.0"))
+
+    # The hanging probe is killed, so exiting does not wait for it
+    for thread in set(threading.enumerate()) - before:
+        thread.join(10)
+        assert not thread.is_alive()
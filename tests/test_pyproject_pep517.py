@@ -2,6 +2,7 @@ import gzip
 import hashlib
 import inspect
 import shutil
+import subprocess
 import sys
 import tarfile
 import time
@@ -17,6 +18,7 @@ from scikit_build_core.build import (
     build_wheel,
     prepare_metadata_for_build_wheel,
 )
+from scikit_build_core.build._gzip import ParallelGzipFile
 
 ENTRYPOINTS = """\
 [one.two]
@@ -98,6 +100,63 @@ def test_pep517_sdist_hash(monkeypatch, package_simple_pyproject_ext, tmp_path:
         assert f.mtime == 1667997441
 
 
+@pytest.mark.usefixtures("package_simple_pyproject_ext")
+def test_pep517_sdist_compression_level(tmp_path: Path):
+    dist = tmp_path / "dist"
+    best = dist / build_sdist(str(dist))
+    fast = tmp_path / "fast"
+    fast = fast / build_sdist(str(fast), {"sdist.compression.level": "1"})
+
+    # The gzip header records the fastest (4) and best (2) levels in XFL
+    assert best.read_bytes()[8] == 2
+    assert fast.read_bytes()[8] == 4
+    assert compute_uncompressed_hash(fast) == compute_uncompressed_hash(best)
+
+
+@pytest.mark.usefixtures("package_simple_pyproject_ext")
+def test_pep517_sdist_jobs(tmp_path: Path):
+    serial = tmp_path / "serial"
+    serial = serial / build_sdist(str(serial))
+    sdists = []
+    for jobs in ("0", "2", "3"):
+        dist = tmp_path / f"jobs{jobs}"
+        sdists.append(dist / build_sdist(str(dist), {"sdist.jobs": jobs}))
+
+    # Independent of the number of threads, and the same archive inside
+    assert len({sdist.read_bytes() for sdist in sdists}) == 1
+    assert sdists[0].read_bytes()[:10] == serial.read_bytes()[:10]
+    assert compute_uncompressed_hash(sdists[0]) == compute_uncompressed_hash(serial)
+
+
+@pytest.mark.usefixtures("package_simple_pyproject_ext")
+def test_pep517_sdist_read_ahead(tmp_path: Path):
+    dist = tmp_path / "dist"
+    plain = dist / build_sdist(str(dist))
+    # 1 MiB holds every file in flight at once
+    ahead = tmp_path / "ahead"
+    ahead = ahead / build_sdist(str(ahead), {"sdist.read-ahead": "1"})
+
+    assert ahead.read_bytes() == plain.read_bytes()
+
+
+def test_parallel_gzip_blocks(tmp_path: Path):
+    # Several blocks, with repeats across block boundaries
+    data = b"".join(
+        hashlib.sha256(str(i % 500).encode()).digest() for i in range(20000)
+    )
+    outputs = set()
+    for jobs in (1, 4):
+        path = tmp_path / f"{jobs}" / "data.gz"
+        path.parent.mkdir()
+        with ParallelGzipFile(path, compresslevel=6, mtime=0, jobs=jobs) as f:
+            for i in range(0, len(data), 10000):
+                f.write(data[i : i + 10000])
+        assert gzip.decompress(path.read_bytes()) == data
+        outputs.add(path.read_bytes())
+    assert len(outputs) == 1
+    assert len(outputs.pop()) < len(data) // 10
+
+
 @pytest.mark.usefixtures("package_simple_pyproject_ext")
 def test_pep517_sdist_time_hash(tmp_path: Path):
     dist = tmp_path / "dist"
@@ -356,6 +415,23 @@ def test_prepare_metadata_for_build_wheel(tmp_path):
     assert len(metadata) == len(answer)
 
 
+@pytest.mark.usefixtures("package_simple_pyproject_ext")
+def test_prepare_metadata_for_build_wheel_no_subprocess(tmp_path, monkeypatch):
+    def no_subprocess(*args, **_kwargs):
+        msg = f"Unexpected subprocess: {args}"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(subprocess, "Popen", no_subprocess)
+    mddir = tmp_path / "dist"
+    mddir.mkdir()
+    out = prepare_metadata_for_build_wheel(str(mddir), {})
+    assert out == "cmake_example-0.0.1.dist-info"
+    assert (mddir / out / "METADATA").is_file()
+    assert (mddir / out / "WHEEL").is_file()
+    # Nothing is staged next to the .dist-info
+    assert {p.name for p in mddir.iterdir()} == {out}
+
+
 @pytest.mark.usefixtures("package_simple_pyproject_ext")
 def test_prepare_metadata_for_build_wheel_by_hand(tmp_path):
     mddir = tmp_path / "dist"
@@ -505,3 +581,23 @@ def test_pep639_license_files_optout(tmp_path: Path, monkeypatch: pytest.MonkeyP
 
     assert not any("dist-info/licenses/" in n for n in names)
     assert "License-File:" not in metadata
+
+
+@pytest.mark.parametrize("package", ["pep639_pure"], indirect=True)
+@pytest.mark.usefixtures("package")
+def test_pep658_metadata_sidecar(tmp_path: Path):
+    config: dict[str, list[str] | str] = {"wheel.metadata-sidecar": "true"}
+    mddir = tmp_path / "metadata"
+    mddir.mkdir()
+    out = prepare_metadata_for_build_wheel(str(mddir), config)
+    prepared = (mddir / out / "METADATA").read_bytes()
+    (sidecar,) = mddir.glob("*.whl.metadata")
+    assert sidecar.name == "pep639_pure-0.1.0-py3-none-any.whl.metadata"
+    assert sidecar.read_bytes() == prepared
+
+    dist = tmp_path / "dist"
+    out = build_wheel(str(dist), config, str(mddir / out))
+    assert {p.name for p in dist.iterdir()} == {out, f"{out}.metadata"}
+    with zipfile.ZipFile(dist / out) as zf:
+        metadata = zf.read("pep639_pure-0.1.0.dist-info/METADATA")
+    assert (dist / f"{out}.metadata").read_bytes() == metadata == prepared
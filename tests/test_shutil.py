@@ -3,9 +3,13 @@ from __future__ import annotations
 import shutil
 import stat
 import sys
+import tempfile
+import threading
 
 import pytest
 
+from scikit_build_core._shutil import remove_in_background, temporary_directory
+
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from pathlib import Path
@@ -41,3 +45,33 @@ def test_broken_all_permissions(make_dir_with_ro: Path) -> None:
             shutil.rmtree(make_dir_with_ro)
     else:
         shutil.rmtree(make_dir_with_ro)
+
+
+def _join_trash_threads() -> None:
+    for thread in threading.enumerate():
+        if thread.name == "skbuild-trash":
+            thread.join()
+
+
+def test_remove_in_background(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    tree = tmp_path / "tree"
+    tree.joinpath("nested").mkdir(parents=True)
+    tree.joinpath("nested", "file.txt").write_text("x")
+
+    remove_in_background(tree)
+    assert not tree.exists()
+    _join_trash_threads()
+    (trash,) = tmp_path.iterdir()
+    assert trash.name.startswith("scikit-build-core-trash")
+    assert list(trash.iterdir()) == []
+
+    # Left by an earlier run that exited before removing it
+    leftover = trash / "leftover"
+    leftover.joinpath("nested").mkdir(parents=True)
+    with temporary_directory() as tmpdir:
+        assert tmpdir.parent == tmp_path
+        tmpdir.joinpath("file.txt").write_text("x")
+    assert not tmpdir.exists()
+    _join_trash_threads()
+    assert list(trash.iterdir()) == []
@@ -52,6 +52,24 @@ def test_skbuild_settings_default(tmp_path: Path):
     assert settings.wheel.license_files is None
     assert settings.wheel.exclude == []
     assert settings.wheel.build_tag == ""
+    assert settings.wheel.jobs == 0
+    assert settings.wheel.read_ahead == 0
+    assert not settings.wheel.compression.cache
+    assert settings.wheel.compression.cache_size == 1024
+    assert settings.wheel.compression.level == 6
+    assert settings.wheel.compression.store == []
+    assert not settings.wheel.compression.store_incompressible
+    assert not settings.wheel.size_report
+    assert not settings.wheel.metadata_sidecar
+    assert not settings.wheel.compile_bytecode
+    assert settings.wheel.staging == "auto"
+    assert settings.wheel.build_cache.dir == ""
+    assert settings.wheel.build_cache.max_size == 4096
+    assert settings.wheel.build_cache.backend == ""
+    assert not settings.wheel.reuse_metadata
+    assert settings.sdist.compression.level == 9
+    assert settings.sdist.jobs == 1
+    assert settings.sdist.read_ahead == 0
     assert settings.backport.find_python == Version("3.26.1")
     assert settings.strict_config
     assert not settings.experimental
@@ -292,6 +310,24 @@ def test_skbuild_settings_envvar(tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     monkeypatch.setenv("SKBUILD_WHEEL_LICENSE_FILES", "a;b;c")
     monkeypatch.setenv("SKBUILD_WHEEL_EXCLUDE", "b;y;e")
     monkeypatch.setenv("SKBUILD_WHEEL_BUILD_TAG", "1")
+    monkeypatch.setenv("SKBUILD_WHEEL_JOBS", "4")
+    monkeypatch.setenv("SKBUILD_WHEEL_READ_AHEAD", "16")
+    monkeypatch.setenv("SKBUILD_WHEEL_COMPRESSION_CACHE", "1")
+    monkeypatch.setenv("SKBUILD_WHEEL_COMPRESSION_CACHE_SIZE", "64")
+    monkeypatch.setenv("SKBUILD_WHEEL_COMPRESSION_LEVEL", "1")
+    monkeypatch.setenv("SKBUILD_WHEEL_COMPRESSION_STORE", "*.gz;*.png")
+    monkeypatch.setenv("SKBUILD_WHEEL_COMPRESSION_STORE_INCOMPRESSIBLE", "1")
+    monkeypatch.setenv("SKBUILD_WHEEL_SIZE_REPORT", "1")
+    monkeypatch.setenv("SKBUILD_WHEEL_METADATA_SIDECAR", "1")
+    monkeypatch.setenv("SKBUILD_WHEEL_COMPILE_BYTECODE", "1")
+    monkeypatch.setenv("SKBUILD_WHEEL_STAGING", "link")
+    monkeypatch.setenv("SKBUILD_WHEEL_BUILD_CACHE_DIR", "wheel-cache")
+    monkeypatch.setenv("SKBUILD_WHEEL_BUILD_CACHE_MAX_SIZE", "16")
+    monkeypatch.setenv("SKBUILD_WHEEL_BUILD_CACHE_BACKEND", "cache:Backend")
+    monkeypatch.setenv("SKBUILD_WHEEL_REUSE_METADATA", "1")
+    monkeypatch.setenv("SKBUILD_SDIST_COMPRESSION_LEVEL", "2")
+    monkeypatch.setenv("SKBUILD_SDIST_JOBS", "0")
+    monkeypatch.setenv("SKBUILD_SDIST_READ_AHEAD", "32")
     monkeypatch.setenv("SKBUILD_BACKPORT_FIND_PYTHON", "0")
     monkeypatch.setenv("SKBUILD_STRICT_CONFIG", "0")
     monkeypatch.setenv("SKBUILD_EXPERIMENTAL", "1")
@@ -345,6 +381,24 @@ def test_skbuild_settings_envvar(tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     assert settings.wheel.license_files == ["a", "b", "c"]
     assert settings.wheel.exclude == ["b", "y", "e"]
     assert settings.wheel.build_tag == "1"
+    assert settings.wheel.jobs == 4
+    assert settings.wheel.read_ahead == 16
+    assert settings.wheel.compression.cache
+    assert settings.wheel.compression.cache_size == 64
+    assert settings.wheel.compression.level == 1
+    assert settings.wheel.compression.store == ["*.gz", "*.png"]
+    assert settings.wheel.compression.store_incompressible
+    assert settings.wheel.size_report
+    assert settings.wheel.metadata_sidecar
+    assert settings.wheel.compile_bytecode
+    assert settings.wheel.staging == "link"
+    assert settings.wheel.build_cache.dir == "wheel-cache"
+    assert settings.wheel.build_cache.max_size == 16
+    assert settings.wheel.build_cache.backend == "cache:Backend"
+    assert settings.wheel.reuse_metadata
+    assert settings.sdist.compression.level == 2
+    assert settings.sdist.jobs == 0
+    assert settings.sdist.read_ahead == 32
     assert settings.backport.find_python == Version("0")
     assert not settings.strict_config
     assert settings.experimental
@@ -404,6 +458,24 @@ def test_skbuild_settings_config_settings(
         "wheel.license-files": ["a", "b", "c"],
         "wheel.exclude": ["b", "y", "e"],
         "wheel.build-tag": "1foo",
+        "wheel.jobs": "2",
+        "wheel.read-ahead": "8",
+        "wheel.compression.cache": "true",
+        "wheel.compression.cache-size": "32",
+        "wheel.compression.level": "3",
+        "wheel.compression.store": ["*.npz"],
+        "wheel.compression.store-incompressible": "true",
+        "wheel.size-report": "true",
+        "wheel.metadata-sidecar": "true",
+        "wheel.compile-bytecode": "true",
+        "wheel.staging": "link",
+        "wheel.build-cache.dir": "wheel-cache",
+        "wheel.build-cache.max-size": "16",
+        "wheel.build-cache.backend": "cache:Backend",
+        "wheel.reuse-metadata": "true",
+        "sdist.compression.level": "4",
+        "sdist.jobs": "4",
+        "sdist.read-ahead": "64",
         "backport.find-python": "0",
         "strict-config": "false",
         "experimental": "1",
@@ -454,6 +526,24 @@ def test_skbuild_settings_config_settings(
     assert settings.wheel.license_files == ["a", "b", "c"]
     assert settings.wheel.exclude == ["b", "y", "e"]
     assert settings.wheel.build_tag == "1foo"
+    assert settings.wheel.jobs == 2
+    assert settings.wheel.read_ahead == 8
+    assert settings.wheel.compression.cache
+    assert settings.wheel.compression.cache_size == 32
+    assert settings.wheel.compression.level == 3
+    assert settings.wheel.compression.store == ["*.npz"]
+    assert settings.wheel.compression.store_incompressible
+    assert settings.wheel.size_report
+    assert settings.wheel.metadata_sidecar
+    assert settings.wheel.compile_bytecode
+    assert settings.wheel.staging == "link"
+    assert settings.wheel.build_cache.dir == "wheel-cache"
+    assert settings.wheel.build_cache.max_size == 16
+    assert settings.wheel.build_cache.backend == "cache:Backend"
+    assert settings.wheel.reuse_metadata
+    assert settings.sdist.compression.level == 4
+    assert settings.sdist.jobs == 4
+    assert settings.sdist.read_ahead == 64
     assert settings.backport.find_python == Version("0")
     assert not settings.strict_config
     assert settings.experimental
@@ -509,6 +599,24 @@ def test_skbuild_settings_pyproject_toml(
             wheel.license-files = ["a", "b", "c"]
             wheel.exclude = ["b", "y", "e"]
             wheel.build-tag = "1_bar"
+            wheel.jobs = 8
+            wheel.read-ahead = 4
+            wheel.compression.cache = true
+            wheel.compression.cache-size = 16
+            wheel.compression.level = 5
+            wheel.compression.store = ["*.zip"]
+            wheel.compression.store-incompressible = true
+            wheel.size-report = true
+            wheel.metadata-sidecar = true
+            wheel.compile-bytecode = true
+            wheel.staging = "link"
+            wheel.build-cache.dir = "wheel-cache"
+            wheel.build-cache.max-size = 16
+            wheel.build-cache.backend = "cache:Backend"
+            wheel.reuse-metadata = true
+            sdist.compression.level = 7
+            sdist.jobs = 8
+            sdist.read-ahead = 128
             backport.find-python = "3.18"
             strict-config = false
             experimental = true
@@ -564,6 +672,24 @@ def test_skbuild_settings_pyproject_toml(
     assert settings.wheel.license_files == ["a", "b", "c"]
     assert settings.wheel.exclude == ["b", "y", "e"]
     assert settings.wheel.build_tag == "1_bar"
+    assert settings.wheel.jobs == 8
+    assert settings.wheel.read_ahead == 4
+    assert settings.wheel.compression.cache
+    assert settings.wheel.compression.cache_size == 16
+    assert settings.wheel.compression.level == 5
+    assert settings.wheel.compression.store == ["*.zip"]
+    assert settings.wheel.compression.store_incompressible
+    assert settings.wheel.size_report
+    assert settings.wheel.metadata_sidecar
+    assert settings.wheel.compile_bytecode
+    assert settings.wheel.staging == "link"
+    assert settings.wheel.build_cache.dir == "wheel-cache"
+    assert settings.wheel.build_cache.max_size == 16
+    assert settings.wheel.build_cache.backend == "cache:Backend"
+    assert settings.wheel.reuse_metadata
+    assert settings.sdist.compression.level == 7
+    assert settings.sdist.jobs == 8
+    assert settings.sdist.read_ahead == 128
     assert settings.backport.find_python == Version("3.18")
     assert not settings.strict_config
     assert settings.experimental
@@ -1274,6 +1400,39 @@ def test_editable_inplace_rebuild_dir_rejected(tmp_path: Path):
         SettingsReader.from_file(pyproject_toml)
 
 
+def test_compression_cache_requires_build_dir(tmp_path: Path):
+    pyproject_toml = tmp_path / "pyproject.toml"
+    pyproject_toml.write_text(
+        textwrap.dedent(
+            """\
+            [tool.scikit-build]
+            wheel.compression.cache = true
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(SystemExit):
+        SettingsReader.from_file(pyproject_toml)
+
+
+@pytest.mark.parametrize("table", ["sdist", "wheel"])
+def test_compression_level_range(tmp_path: Path, table: str):
+    pyproject_toml = tmp_path / "pyproject.toml"
+    pyproject_toml.write_text(
+        textwrap.dedent(
+            f"""\
+            [tool.scikit-build]
+            {table}.compression.level = 10
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(SystemExit):
+        SettingsReader.from_file(pyproject_toml)
+
+
 def test_skbuild_override_static(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -1446,3 +1605,26 @@ def test_sdist_inclusion_mode_explicit_requires_minimum_version(
     with pytest.raises(SystemExit):
         SettingsReader.from_file(pyproject_toml, {})
     assert "1.0" in capsys.readouterr().err
+
+
+def test_sdist_inclusion_mode_git_requires_minimum_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+):
+    monkeypatch.setattr(
+        scikit_build_core.settings.skbuild_read_settings, "__version__", "1.1.0"
+    )
+    monkeypatch.setenv("SKBUILD_SDIST_INCLUSION_MODE", "git")
+    pyproject_toml = tmp_path / "pyproject.toml"
+    pyproject_toml.write_text(
+        textwrap.dedent(
+            """\
+            [tool.scikit-build]
+            minimum-version = "1.0"
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(SystemExit):
+        SettingsReader.from_file(pyproject_toml, {})
+    assert "1.1" in capsys.readouterr().err
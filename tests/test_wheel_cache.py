@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scikit_build_core.build import build_wheel, prepare_metadata_for_build_wheel
+from scikit_build_core.build._wheel_cache import (
+    LocalWheelCache,
+    get_wheel_cache_backends,
+    wheel_cache_key,
+)
+from scikit_build_core.settings.skbuild_read_settings import SettingsReader
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PYPROJECT = """\
+[build-system]
+requires = ["scikit-build-core"]
+build-backend = "scikit_build_core.build"
+
+[project]
+name = "pkg"
+version = "0.1.0"
+
+[tool.scikit-build]
+wheel.cmake = false
+wheel.metadata-sidecar = true
+"""
+
+HTTP_BACKEND = """\
+import os
+import urllib.error
+import urllib.request
+
+
+class HTTPCache:
+    def __init__(self):
+        self.url = os.environ["TEST_WHEEL_CACHE_URL"]
+
+    def get(self, key, folder):
+        try:
+            with urllib.request.urlopen(f"{self.url}/{key}") as r:
+                names = r.read().decode().split()
+        except urllib.error.HTTPError:
+            return None
+        for name in names:
+            with urllib.request.urlopen(f"{self.url}/{key}/{name}") as r:
+                folder.joinpath(name).write_bytes(r.read())
+        return names
+
+    def put(self, key, files):
+        for file in files:
+            self._put(f"{key}/{file.name}", file.read_bytes())
+        self._put(key, " ".join(file.name for file in files).encode())
+
+    def _put(self, path, data):
+        request = urllib.request.Request(f"{self.url}/{path}", data, method="PUT")
+        urllib.request.urlopen(request).close()
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "proj"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pyproject.toml").write_text(PYPROJECT)
+    (root / "pkg" / "__init__.py").write_text("")
+    monkeypatch.chdir(root)
+    return root
+
+
+def _no_build(*_args: object, **_kwargs: object) -> None:
+    msg = "Should have been reused from the cache"
+    raise AssertionError(msg)
+
+
+def test_local_wheel_cache_lru(tmp_path: Path) -> None:
+    files = []
+    for name in ("a", "b", "c"):
+        files.append(tmp_path / f"{name}.whl")
+        files[-1].write_bytes(b"x" * 100)
+    cache = LocalWheelCache(tmp_path / "cache", max_size=250)
+
+    cache.put("a", files[:1])
+    cache.put("b", files[1:2])
+    os.utime(cache.path / "a", ns=(0, 0))
+    os.utime(cache.path / "b", ns=(0, 1))
+    out = tmp_path / "out"
+    out.mkdir()
+    # Using "a" makes "b" the least recently used
+    assert cache.get("a", out) == ["a.whl"]
+    assert (out / "a.whl").read_bytes() == b"x" * 100
+
+    cache.put("c", files[2:])
+    assert sorted(p.name for p in cache.path.iterdir()) == ["a", "c"]
+    assert cache.get("b", out) is None
+
+
+def test_wheel_cache_key(project: Path) -> None:
+    def key() -> str:
+        settings = SettingsReader.from_file("pyproject.toml").settings
+        return wheel_cache_key(
+            settings, version="0.1.0", tags="py3-none-any", cmake=None, env=env
+        )
+
+    env = {"PATH": os.environ.get("PATH", "")}
+    first = key()
+    assert key() == first
+
+    env["SKBUILD_WHEEL_BUILD_CACHE_DIR"] = "elsewhere"
+    env["CMAKE_BUILD_PARALLEL_LEVEL"] = "8"
+    env["HOME"] = "/nowhere"
+    assert key() == first
+
+    env["CFLAGS"] = "-O3"
+    assert key() != first
+    del env["CFLAGS"]
+
+    (project / "pkg" / "__init__.py").write_text("x = 1\n")
+    assert key() != first
+
+
+def test_wheel_cache_key_force_include(project: Path, tmp_path: Path) -> None:
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    outside.joinpath("data.txt").write_text("one")
+    with project.joinpath("pyproject.toml").open("a") as f:
+        f.write(f'wheel.force-include = {{"{outside.as_posix()}" = "pkg/data"}}\n')
+
+    def key() -> str:
+        settings = SettingsReader.from_file("pyproject.toml").settings
+        return wheel_cache_key(
+            settings, version="0.1.0", tags="py3-none-any", cmake=None, env={}
+        )
+
+    first = key()
+    outside.joinpath("data.txt").write_text("two")
+    assert key() != first
+
+
+@pytest.mark.parametrize(
+    "backend",
+    ["not_a_factory", "skbuild_bad_cache:missing", "skbuild_bad_cache:broken"],
+)
+def test_wheel_cache_bad_backend(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, backend: str
+) -> None:
+    tmp_path.joinpath("skbuild_bad_cache.py").write_text(
+        "def broken():\n    raise RuntimeError('no server')\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    with project.joinpath("pyproject.toml").open("a") as f:
+        f.write(f'wheel.build-cache.backend = "{backend}"\n')
+    settings = SettingsReader.from_file("pyproject.toml").settings
+    with pytest.raises(SystemExit):
+        get_wheel_cache_backends(settings)
+
+
+def test_wheel_reused_from_cache(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config: dict[str, list[str] | str] = {
+        "wheel.build-cache.dir": str(tmp_path / "cache")
+    }
+    out = build_wheel(str(tmp_path / "dist1"), config)
+    built = (tmp_path / "dist1" / out).read_bytes()
+
+    monkeypatch.setattr("scikit_build_core.build.wheel.temporary_directory", _no_build)
+    assert build_wheel(str(tmp_path / "dist2"), config) == out
+    assert (tmp_path / "dist2" / out).read_bytes() == built
+    assert (tmp_path / "dist2" / f"{out}.metadata").is_file()
+
+    # A changed source is built again
+    (project / "pkg" / "__init__.py").write_text("x = 1\n")
+    with pytest.raises(AssertionError, match="reused from the cache"):
+        build_wheel(str(tmp_path / "dist3"), config)
+
+
+@pytest.mark.usefixtures("project")
+def test_wheel_cache_checks_metadata(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config: dict[str, list[str] | str] = {
+        "wheel.build-cache.dir": str(tmp_path / "cache")
+    }
+    build_wheel(str(tmp_path / "dist1"), config)
+
+    metadata = tmp_path / "metadata"
+    metadata.mkdir()
+    dist_info = metadata / prepare_metadata_for_build_wheel(str(metadata), config)
+    monkeypatch.setattr("scikit_build_core.build.wheel.temporary_directory", _no_build)
+    build_wheel(str(tmp_path / "dist2"), config, str(dist_info))
+
+    dist_info.joinpath("METADATA").write_text("Metadata-Version: 2.1\n")
+    with pytest.raises(AssertionError, match="Metadata mismatch in METADATA"):
+        build_wheel(str(tmp_path / "dist3"), config, str(dist_info))
+
+
+@pytest.mark.usefixtures("project")
+def test_wheel_cache_backend(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store: dict[str, bytes] = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            data = store.get(self.path)
+            self.send_response(404 if data is None else 200)
+            self.end_headers()
+            self.wfile.write(data or b"")
+
+        def do_PUT(self) -> None:
+            store[self.path] = self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        backend_dir = tmp_path / "backend"
+        backend_dir.mkdir()
+        backend_dir.joinpath("skbuild_http_cache.py").write_text(HTTP_BACKEND)
+        monkeypatch.syspath_prepend(str(backend_dir))
+        monkeypatch.setenv(
+            "TEST_WHEEL_CACHE_URL", f"http://127.0.0.1:{server.server_port}"
+        )
+        config: dict[str, list[str] | str] = {
+            "wheel.build-cache.backend": "skbuild_http_cache:HTTPCache"
+        }
+
+        out = build_wheel(str(tmp_path / "dist1"), config)
+        assert len(store) == 3
+
+        monkeypatch.setattr(
+            "scikit_build_core.build.wheel.temporary_directory", _no_build
+        )
+        assert build_wheel(str(tmp_path / "dist2"), config) == out
+        assert (tmp_path / "dist2" / out).read_bytes() == (
+            tmp_path / "dist1" / out
+        ).read_bytes()
+    finally:
+        server.shutdown()
+        server.server_close()
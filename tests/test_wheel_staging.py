@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import os
+import time
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from scikit_build_core.build import build_wheel
+from scikit_build_core.build._pathutil import stage_file, sync_file, sync_files
+from scikit_build_core.build._scripts import process_script_dir
+from scikit_build_core.build.common_wheel_helpers import (
+    find_stale_files,
+    remove_stale_files,
+)
+
+PYPROJECT = """\
+[build-system]
+requires = ["scikit-build-core"]
+build-backend = "scikit_build_core.build"
+
+[project]
+name = "pkg"
+version = "0.1.0"
+
+[tool.scikit-build]
+wheel.cmake = false
+build-dir = "build"
+"""
+
+
+def test_sync_file(tmp_path: Path) -> None:
+    source = tmp_path / "source.txt"
+    source.write_text("one")
+    target = tmp_path / "target.txt"
+
+    assert sync_file(source, target)
+    assert target.read_text() == "one"
+    assert not sync_file(source, target)
+
+    source.write_text("two")
+    assert sync_file(source, target)
+    assert target.read_text() == "two"
+
+
+def test_sync_file_replaces_symlink(tmp_path: Path) -> None:
+    source = tmp_path / "source.txt"
+    source.write_text("new")
+    other = tmp_path / "other.txt"
+    other.write_text("old")
+    target = tmp_path / "target.txt"
+    try:
+        target.symlink_to(other)
+    except OSError:
+        pytest.skip("Symlinks not supported")
+
+    assert sync_file(source, target)
+    assert not target.is_symlink()
+    assert target.read_text() == "new"
+    assert other.read_text() == "old"
+
+
+@pytest.mark.parametrize("mode", ["copy", "link", "auto"])
+def test_stage_file(tmp_path: Path, mode: str) -> None:
+    source = tmp_path / "source.py"
+    source.write_text("x = 1\n")
+    source.chmod(0o755)
+    os.utime(source, ns=(0, 1_000_000_000))
+    target = tmp_path / "target.py"
+
+    stage_file(source, target, mode=mode)  # type: ignore[arg-type]
+    assert target.read_text() == "x = 1\n"
+    assert target.stat().st_mtime_ns == 1_000_000_000
+    assert target.stat().st_mode == source.stat().st_mode
+    assert not sync_file(source, target, mode=mode)  # type: ignore[arg-type]
+
+    # Staging over a (possibly hard linked) target leaves the source alone
+    other = tmp_path / "other.py"
+    other.write_text("y = 2\n")
+    stage_file(other, target, mode=mode)  # type: ignore[arg-type]
+    assert target.read_text() == "y = 2\n"
+    assert source.read_text() == "x = 1\n"
+
+
+def test_sync_files(tmp_path: Path) -> None:
+    mapping = {}
+    for i in range(20):
+        source = tmp_path / "src" / f"{i}.txt"
+        source.parent.mkdir(exist_ok=True)
+        source.write_text(str(i))
+        mapping[str(source)] = str(tmp_path / "dst" / f"sub{i % 3}" / f"{i}.txt")
+    # The last source for a target wins
+    mapping[str(tmp_path / "src" / "19.txt")] = str(tmp_path / "dst" / "sub0" / "0.txt")
+
+    staged = sync_files(mapping, mode="auto", jobs=4)
+    assert staged == {Path(v).absolute() for v in mapping.values()}
+    assert (tmp_path / "dst" / "sub2" / "5.txt").read_text() == "5"
+    assert (tmp_path / "dst" / "sub0" / "0.txt").read_text() == "19"
+
+
+def test_process_script_dir_breaks_hard_links(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    source.write_text("#!/usr/bin/python3\nprint()\n")
+    source.chmod(0o755)
+    scripts = tmp_path / "scripts"
+    scripts.mkdir()
+    try:
+        os.link(source, scripts / "run")
+    except OSError:
+        pytest.skip("Hard links not supported")
+
+    process_script_dir(scripts)
+    assert (scripts / "run").read_text() == "#!python\nprint()\n"
+    assert (scripts / "run").stat().st_mode == source.stat().st_mode
+    assert source.read_text() == "#!/usr/bin/python3\nprint()\n"
+
+
+def test_find_and_remove_stale_files(tmp_path: Path) -> None:
+    root = tmp_path / "wheel"
+    for name in (
+        "platlib/pkg/keep.py",
+        "platlib/pkg/old.py",
+        "platlib/pkg/generated.py",
+        "data/old/x.txt",
+    ):
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text("")
+        os.utime(root / name, ns=(0, 0))
+    (root / "scripts").mkdir()
+    start_ns = time.time_ns()
+    # Written during the build without being reported, like install(CODE)
+    (root / "platlib/pkg/generated.py").write_text("")
+
+    staged = {(root / "platlib/pkg/keep.py").absolute()}
+    stale = find_stale_files(root, staged, since_ns=start_ns)
+    assert stale == {
+        (root / "platlib/pkg/old.py").absolute(),
+        (root / "data/old/x.txt").absolute(),
+    }
+
+    remove_stale_files(root, stale)
+    assert sorted(p.relative_to(root).as_posix() for p in root.rglob("*")) == [
+        "data",
+        "platlib",
+        "platlib/pkg",
+        "platlib/pkg/generated.py",
+        "platlib/pkg/keep.py",
+        "scripts",
+    ]
+
+
+def test_persistent_staging_is_synced(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "proj"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pyproject.toml").write_text(PYPROJECT)
+    (root / "pkg" / "__init__.py").write_text("")
+    (root / "pkg" / "a.py").write_text("a = 1\n")
+    # Staged copies keep the sources' mtimes; make them clearly older than
+    # the next build
+    for path in (root / "pkg").iterdir():
+        os.utime(path, ns=(0, 0))
+    monkeypatch.chdir(root)
+
+    build_wheel(str(tmp_path / "dist1"))
+    staging = root / "build" / ".skbuild-wheel-staging" / "purelib" / "pkg"
+    assert sorted(p.name for p in staging.iterdir()) == ["__init__.py", "a.py"]
+
+    (root / "pkg" / "a.py").unlink()
+    (root / "pkg" / "b.py").write_text("b = 2\n")
+    copied = []
+    real_stage_file = stage_file
+
+    def staged_file(src: str, dst: Path, **kwargs: str) -> None:
+        copied.append(dst.name)
+        real_stage_file(src, dst, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr("scikit_build_core.build._pathutil.stage_file", staged_file)
+    out = build_wheel(str(tmp_path / "dist2"))
+
+    # Only the new file was copied, and the removed one is gone
+    assert copied == ["b.py"]
+    assert sorted(p.name for p in staging.iterdir()) == ["__init__.py", "b.py"]
+    with zipfile.ZipFile(tmp_path / "dist2" / out) as zf:
+        assert {n for n in zf.namelist() if n.startswith("pkg/")} == {
+            "pkg/__init__.py",
+            "pkg/b.py",
+        }
+
+
+def test_persistent_staging_quick_rebuild(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "proj"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pyproject.toml").write_text(PYPROJECT)
+    (root / "pkg" / "__init__.py").write_text("x = 1\n")
+    monkeypatch.chdir(root)
+    build_wheel(str(tmp_path / "dist1"))
+
+    # Edited right before the next build, so the previous copy is recent too
+    module = root / "pkg" / "__init__.py"
+    mtime_ns = module.stat().st_mtime_ns
+    module.write_text("x = 2\n")
+    os.utime(module, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    out = build_wheel(str(tmp_path / "dist2"))
+
+    with zipfile.ZipFile(tmp_path / "dist2" / out) as zf:
+        assert zf.read("pkg/__init__.py") == b"x = 2\n"
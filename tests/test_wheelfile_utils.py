@@ -1,19 +1,47 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
 import stat
+import subprocess
 import sys
+import textwrap
 import time
 import zipfile
 from pathlib import Path
 
+import pathspec
 import pytest
-from packaging.tags import Tag
+from packaging.tags import Tag, sys_tags
 
 import scikit_build_core.build._wheelfile
 from scikit_build_core._reproducible import MAX_TIMESTAMP, get_reproducible_epoch
 from scikit_build_core._vendor.pyproject_metadata import StandardMetadata
-from scikit_build_core.build._wheelfile import WheelWriter
-
-
-def _make_writer(tmp_path: Path, *, reproducible: bool = True) -> WheelWriter:
+from scikit_build_core.build._matcher import path_matcher
+from scikit_build_core.build._size_report import (
+    log_size_report,
+    size_report,
+    write_size_report,
+)
+from scikit_build_core.build._wheelfile import (
+    WheelWriter,
+    _b64encode,
+    _MemberCache,
+    _scan_wheel_dir,
+    retag_wheel,
+)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import IO
+
+
+def _make_writer(
+    tmp_path: Path, *, reproducible: bool = True, tag: Tag | None = None
+) -> WheelWriter:
     metadata = StandardMetadata.from_pyproject(
         {"project": {"name": "something", "version": "1.2.3"}},
         metadata_version="2.3",
@@ -21,7 +49,7 @@ def _make_writer(tmp_path: Path, *, reproducible: bool = True) -> WheelWriter:
     return scikit_build_core.build._wheelfile.WheelWriter(
         metadata,
         tmp_path / "out",
-        {Tag("py3", "none", "any")},
+        {tag or Tag("py3", "none", "any")},
         scikit_build_core.build._wheelfile.WheelMetadata(),
         None,
         reproducible=reproducible,
@@ -184,8 +212,8 @@ def test_wheel_writer_simple(tmp_path, monkeypatch):
 
     with zipfile.ZipFile(out_dir / "something-1.2.3-py3-none-any.whl") as zf:
         assert zf.namelist() == [
-            "something-1.2.3.dist-info/METADATA",
             "something-1.2.3.dist-info/WHEEL",
+            "something-1.2.3.dist-info/METADATA",
             "something-1.2.3.dist-info/RECORD",
         ]
 
@@ -249,3 +277,617 @@ def test_wheel_writer_variant_metadata_dir_conflict(tmp_path):
 
     with pytest.raises(ValueError, match=r"variant\.json"):
         wheel.dist_info_contents()
+
+
+def test_wheel_compile_bytecode(tmp_path, monkeypatch, caplog):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    monkeypatch.setattr(
+        scikit_build_core.build._wheelfile, "MIN_FILES_PER_COMPILE_WORKER", 1
+    )
+    platlib = tmp_path / "platlib"
+    (platlib / "pkg").mkdir(parents=True)
+    (platlib / "top.py").write_text("x = 1\n")
+    (platlib / "pkg" / "__init__.py").write_text("def f():\n    return 2\n")
+    (platlib / "pkg" / "broken.py").write_text("def (:\n")
+    (platlib / "pkg" / "data.txt").write_text("not python\n")
+    scripts = tmp_path / "scripts"
+    scripts.mkdir()
+    (scripts / "tool.py").write_text("print('hi')\n")
+
+    wheels = []
+    for jobs in (1, 2):
+        wheel = _make_writer(tmp_path / str(jobs), tag=next(sys_tags()))
+        wheel.compile_bytecode = True
+        wheel.jobs = jobs
+        with wheel:
+            wheel.build({"platlib": platlib, "scripts": scripts})
+        wheels.append(wheel.wheelpath)
+
+    # Compiling on a thread pool gives the same bytes
+    assert wheels[0].read_bytes() == wheels[1].read_bytes()
+    assert "Not compiling pkg/broken.py to bytecode" in caplog.text
+
+    tag = sys.implementation.cache_tag
+    with zipfile.ZipFile(wheels[0]) as zf:
+        names = zf.namelist()
+        record = zf.read("something-1.2.3.dist-info/RECORD").decode()
+        zf.extractall(tmp_path / "site")
+    pycs = {name for name in names if name.endswith(".pyc")}
+    assert pycs == {
+        f"pkg/__pycache__/__init__.{tag}.pyc",
+        f"__pycache__/top.{tag}.pyc",
+    }
+    for name in pycs:
+        assert f"{name},sha256=" in record
+
+    # Unchecked: the installed pyc is used even if the source changes
+    (tmp_path / "site" / "pkg" / "__init__.py").write_text("def f():\n    return 3\n")
+    result = subprocess.run(
+        [sys.executable, "-c", "import pkg; print(pkg.f(), pkg.__cached__)"],
+        cwd=tmp_path / "site",
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    value, cached = result.stdout.split()
+    assert value == "2"
+    assert Path(cached).name == f"__init__.{tag}.pyc"
+
+
+@pytest.mark.parametrize("abi", ["none", "abi3"])
+def test_wheel_compile_bytecode_other_pythons(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, abi: str
+) -> None:
+    platlib = tmp_path / "platlib"
+    platlib.mkdir()
+    (platlib / "top.py").write_text("x = 1\n")
+    interpreter = "py3" if abi == "none" else next(sys_tags()).interpreter
+    wheel = _make_writer(tmp_path, tag=Tag(interpreter, abi, "any"))
+    wheel.compile_bytecode = True
+    with wheel:
+        wheel.build({"platlib": platlib})
+
+    # Only this Python would load the pycs
+    assert "Not compiling bytecode" in caplog.text
+    with zipfile.ZipFile(wheel.wheelpath) as zf:
+        assert not [name for name in zf.namelist() if name.endswith(".pyc")]
+
+
+def test_compile_bytecode_ignores_optimize_flag(tmp_path: Path) -> None:
+    # The pyc goes at the non-optimized tag, so it keeps asserts under -O
+    source = tmp_path / "mod.py"
+    source.write_text("assert False, 'kept'\n")
+    script = textwrap.dedent(
+        """\
+        import marshal, sys
+        from scikit_build_core.build._wheelfile import _compile_bytecode
+
+        pyc = _compile_bytecode(sys.argv[1], "mod.py")
+        exec(marshal.loads(pyc[16:]), {})
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-O", "-c", script, str(source)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert "AssertionError: kept" in result.stderr
+
+
+class _TailOnly(io.BytesIO):
+    """A wheel where only the bytes from ``start`` on have been downloaded."""
+
+    def __init__(self, data: bytes, start: int) -> None:
+        super().__init__(data)
+        self.start = start
+
+    def read(self, size: int | None = -1) -> bytes:
+        assert self.tell() >= self.start, "read before the tail window"
+        return super().read(size)
+
+
+def test_wheel_dist_info_at_end(tmp_path, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    metadata = StandardMetadata.from_pyproject(
+        {
+            "project": {
+                "name": "something",
+                "version": "1.2.3",
+                "scripts": {"something": "pkg:main"},
+            },
+        },
+        metadata_version="2.3",
+    )
+    platlib = tmp_path / "platlib"
+    (platlib / "pkg").mkdir(parents=True)
+    (platlib / "pkg" / "__init__.py").write_bytes(b"def main(): pass\n")
+    metadata_dir = tmp_path / "metadata"
+    (metadata_dir / "licenses").mkdir(parents=True)
+    (metadata_dir / "licenses" / "LICENSE").write_bytes(os.urandom(100_000))
+    (metadata_dir / "extra.txt").write_bytes(b"extra\n")
+
+    wheel = scikit_build_core.build._wheelfile.WheelWriter(
+        metadata,
+        tmp_path / "out",
+        {Tag("py3", "none", "any")},
+        scikit_build_core.build._wheelfile.WheelMetadata(),
+        metadata_dir,
+    )
+    with wheel:
+        wheel.build({"platlib": platlib})
+        # Written after build, as editable installs do
+        wheel.writestr("something.pth", b"import pkg\n")
+
+    data = wheel.wheelpath.read_bytes()
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        names = zf.namelist()
+        metadata_offset = zf.getinfo("something-1.2.3.dist-info/METADATA").header_offset
+
+    assert names == [
+        "pkg/__init__.py",
+        "something.pth",
+        "something-1.2.3.dist-info/licenses/LICENSE",
+        "something-1.2.3.dist-info/extra.txt",
+        "something-1.2.3.dist-info/entry_points.txt",
+        "something-1.2.3.dist-info/WHEEL",
+        "something-1.2.3.dist-info/METADATA",
+        "something-1.2.3.dist-info/RECORD",
+    ]
+
+    # A range request for the last few KiB is enough to read METADATA
+    assert len(data) - metadata_offset < 4096
+    with zipfile.ZipFile(_TailOnly(data, metadata_offset)) as zf:
+        assert zf.read("something-1.2.3.dist-info/METADATA") == bytes(
+            metadata.as_rfc822()
+        )
+
+
+def test_wheel_record_matches_members(tmp_path, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    platlib = tmp_path / "platlib"
+    (platlib / "pkg").mkdir(parents=True)
+    (platlib / "pkg" / "__init__.py").write_text("x = 1\n")
+    (platlib / "pkg" / "data.bin").write_bytes(bytes(range(256)) * 100)
+
+    wheel = _make_writer(tmp_path)
+    with wheel:
+        wheel.build({"platlib": platlib})
+        wheel.writestr("pkg/extra.txt", b"")
+
+    with zipfile.ZipFile(wheel.wheelpath) as zf:
+        record = zf.read("something-1.2.3.dist-info/RECORD").decode("utf-8")
+        # RECORD is built while writing; it must agree with re-reading the zip.
+        expected = []
+        for info in zf.infolist():
+            if info.filename.endswith("/RECORD"):
+                continue
+            data = zf.read(info)
+            digest = _b64encode(hashlib.sha256(data).digest()).decode("ascii")
+            expected.append(f"{info.filename},sha256={digest},{len(data)}")
+    expected.append("something-1.2.3.dist-info/RECORD,,")
+    assert record.splitlines() == expected
+
+
+def test_wheel_parallel_compression_is_deterministic(tmp_path, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    platlib = tmp_path / "platlib"
+    for i in range(20):
+        path = platlib / "pkg" / f"sub{i % 3}" / f"mod{i}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"value = %d\n" % i * (i * 500))
+    (platlib / "pkg" / "empty.txt").write_bytes(b"")
+
+    outputs = []
+    for jobs in (1, 2, 8):
+        wheel = _make_writer(tmp_path)
+        wheel.jobs = jobs
+        wheel.folder = tmp_path / f"out{jobs}"
+        with wheel:
+            wheel.build({"platlib": platlib})
+        outputs.append(wheel.wheelpath.read_bytes())
+
+    # Precompressed members are appended in the same order with the same
+    # headers, so the archive is byte-identical to serial compression.
+    assert outputs[0] == outputs[1] == outputs[2]
+    with zipfile.ZipFile(io.BytesIO(outputs[2])) as zf:
+        assert zf.testzip() is None
+        assert zf.read("pkg/sub1/mod1.py") == b"value = 1\n" * 500
+
+
+def test_wheel_read_ahead(tmp_path, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    platlib = tmp_path / "platlib"
+    for i in range(20):
+        path = platlib / "pkg" / f"mod{i}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"value = %d\n" % i * (i * 500))
+
+    outputs = []
+    # Larger files than the limit are read when they're written instead
+    for read_ahead in (0, 20_000, 1024 * 1024):
+        wheel = _make_writer(tmp_path)
+        wheel.read_ahead = read_ahead
+        wheel.folder = tmp_path / f"out{read_ahead}"
+        with wheel:
+            wheel.build({"platlib": platlib})
+        outputs.append(wheel.wheelpath.read_bytes())
+
+    assert outputs[0] == outputs[1] == outputs[2]
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_wheel_compression_cache(tmp_path, monkeypatch, jobs):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    platlib = tmp_path / "platlib"
+    for i in range(5):
+        path = platlib / "pkg" / f"mod{i}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"value = %d\n" % i * 1000)
+
+    stored: list[bytes] = []
+    put = _MemberCache.put
+
+    def spy(self: _MemberCache, digest: bytes, data: IO[bytes]) -> None:
+        stored.append(digest)
+        put(self, digest, data)
+
+    monkeypatch.setattr(_MemberCache, "put", spy)
+
+    def build(name: str, cache_dir: Path | None = None) -> bytes:
+        wheel = _make_writer(tmp_path)
+        wheel.jobs = jobs
+        wheel.folder = tmp_path / name
+        wheel.cache_dir = cache_dir
+        with wheel:
+            wheel.build({"platlib": platlib})
+        return wheel.wheelpath.read_bytes()
+
+    uncached = build("uncached")
+    assert build("cold", tmp_path / "cache") == uncached
+    assert len(stored) == 5
+    assert build("warm", tmp_path / "cache") == uncached
+    assert len(stored) == 5
+
+    # Only the changed file is compressed again
+    (platlib / "pkg" / "mod3.py").write_bytes(b"changed = True\n")
+    stored.clear()
+    rebuilt = build("changed", tmp_path / "cache")
+    assert len(stored) == 1
+    with zipfile.ZipFile(io.BytesIO(rebuilt)) as zf:
+        assert zf.testzip() is None
+        assert zf.read("pkg/mod3.py") == b"changed = True\n"
+        assert zf.read("pkg/mod4.py") == b"value = 4\n" * 1000
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_wheel_compression_store(tmp_path, monkeypatch, jobs):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    platlib = tmp_path / "platlib"
+    (platlib / "pkg").mkdir(parents=True)
+    (platlib / "pkg" / "__init__.py").write_bytes(b"x = 1\n" * 1000)
+    (platlib / "pkg" / "data.gz").write_bytes(b"a" * 1000)
+    (platlib / "pkg" / "random.bin").write_bytes(os.urandom(100_000))
+
+    outputs = []
+    for store_incompressible in (False, True):
+        wheel = _make_writer(tmp_path)
+        wheel.jobs = jobs
+        wheel.folder = tmp_path / f"out{store_incompressible}"
+        wheel.store = ["*.gz"]
+        wheel.store_incompressible = store_incompressible
+        with wheel:
+            wheel.build({"platlib": platlib})
+        outputs.append(wheel.wheelpath)
+
+    with zipfile.ZipFile(outputs[0]) as zf:
+        assert zf.testzip() is None
+        assert zf.getinfo("pkg/__init__.py").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("pkg/data.gz").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("pkg/random.bin").compress_type == zipfile.ZIP_DEFLATED
+    with zipfile.ZipFile(outputs[1]) as zf:
+        assert zf.testzip() is None
+        assert zf.getinfo("pkg/__init__.py").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("pkg/random.bin").compress_type == zipfile.ZIP_STORED
+        assert (
+            zf.read("pkg/random.bin") == (platlib / "pkg" / "random.bin").read_bytes()
+        )
+
+
+def test_wheel_compression_level(tmp_path, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    platlib = tmp_path / "platlib"
+    (platlib / "pkg").mkdir(parents=True)
+    words = [b"alpha", b"beta", b"gamma", b"delta", b"epsilon"]
+    (platlib / "pkg" / "words.txt").write_bytes(
+        b" ".join(
+            words[hashlib.sha256(b"%d" % i).digest()[0] % 5] for i in range(100_000)
+        )
+    )
+
+    sizes = {}
+    for level, jobs in ((1, 1), (1, 4), (9, 1), (9, 4)):
+        wheel = _make_writer(tmp_path)
+        wheel.jobs = jobs
+        wheel.folder = tmp_path / f"out{level}-{jobs}"
+        wheel.compresslevel = level
+        with wheel:
+            wheel.build({"platlib": platlib})
+        with zipfile.ZipFile(wheel.wheelpath) as zf:
+            assert zf.testzip() is None
+            sizes[level, jobs] = zf.getinfo("pkg/words.txt").compress_size
+
+    assert sizes[1, 1] == sizes[1, 4]
+    assert sizes[9, 1] == sizes[9, 4]
+    assert sizes[9, 1] < sizes[1, 1]
+
+
+def test_compression_cache_evicts_least_recently_used(tmp_path):
+    cache = _MemberCache(tmp_path, max_size=250)
+    digests = [hashlib.sha256(bytes([i])).digest() for i in range(4)]
+    for i, digest in enumerate(digests):
+        cache.put(digest, io.BytesIO(b"x" * 100))
+        entry = cache._entry(digest)
+        os.utime(entry, (1000 + i, 1000 + i))
+
+    # Reading an entry marks it as recently used
+    cached = cache.get(digests[0])
+    assert cached is not None
+    cached.close()
+
+    cache.prune()
+    assert cache.get(digests[1]) is None
+    assert cache.get(digests[2]) is None
+    for digest in (digests[0], digests[3]):
+        cached = cache.get(digest)
+        assert cached is not None
+        with cached:
+            assert cached.read() == b"x" * 100
+
+
+def test_retag_wheel(tmp_path, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    platlib = tmp_path / "platlib"
+    (platlib / "pkg").mkdir(parents=True)
+    (platlib / "pkg" / "__init__.py").write_bytes(b"x = 1\n" * 1000)
+    (platlib / "pkg" / "data.gz").write_bytes(b"a" * 1000)
+
+    wheel = _make_writer(tmp_path)
+    wheel.store = ["*.gz"]
+    with wheel:
+        wheel.build({"platlib": platlib})
+
+    tags = {Tag("cp39", "abi3", "linux_x86_64"), Tag("cp39", "abi3", "linux_i686")}
+    retagged = retag_wheel(
+        wheel.wheelpath, tmp_path / "retag", tags=tags, build_tag="2"
+    )
+    assert retagged.name == "something-1.2.3-2-cp39-abi3-linux_i686.linux_x86_64.whl"
+
+    with zipfile.ZipFile(wheel.wheelpath) as zf, zipfile.ZipFile(retagged) as new:
+        assert new.testzip() is None
+        assert new.namelist() == zf.namelist()
+        # Compressed payloads are copied verbatim
+        for info in zf.infolist():
+            new_info = new.getinfo(info.filename)
+            assert new_info.compress_type == info.compress_type
+            if "dist-info" not in info.filename:
+                assert new_info.compress_size == info.compress_size
+                assert new_info.CRC == info.CRC
+                assert new.read(info) == zf.read(info)
+
+        wheel_file = new.read("something-1.2.3.dist-info/WHEEL").decode()
+        assert "Tag: cp39-abi3-linux_i686\nTag: cp39-abi3-linux_x86_64\n" in wheel_file
+        assert "Build: 2\n" in wheel_file
+        assert "Tag: py3-none-any" not in wheel_file
+
+        record = new.read("something-1.2.3.dist-info/RECORD").decode()
+        expected = []
+        for info in new.infolist():
+            if info.filename.endswith("/RECORD"):
+                continue
+            data = new.read(info)
+            digest = _b64encode(hashlib.sha256(data).digest()).decode("ascii")
+            expected.append(f"{info.filename},sha256={digest},{len(data)}")
+    expected.append("something-1.2.3.dist-info/RECORD,,")
+    assert record.splitlines() == expected
+
+    # Retagging back gives the original wheel
+    restored = retag_wheel(
+        retagged, tmp_path / "restored", tags={Tag("py3", "none", "any")}, build_tag=""
+    )
+    assert restored.read_bytes() == wheel.wheelpath.read_bytes()
+
+    with pytest.raises(ValueError, match="overwrite"):
+        retag_wheel(wheel.wheelpath, wheel.folder)
+
+
+def _glob_wheel_dir(
+    root: Path, exclude_spec: pathspec.GitIgnoreSpec, exclude_exempt: set[Path]
+) -> Iterator[str]:
+    # The sorted-glob walk _scan_wheel_dir replaced
+    for filename in sorted(root.glob("**/*")):
+        if not filename.is_file():
+            continue
+        if any(x.endswith(".dist-info") for x in filename.parts):
+            continue
+        if filename.suffix in {".pyc", ".pyo"}:
+            continue
+        relpath = filename.relative_to(root)
+        if (
+            exclude_spec.match_file(relpath)
+            and filename.resolve() not in exclude_exempt
+        ):
+            continue
+        yield relpath.as_posix()
+
+
+@pytest.mark.parametrize(
+    "exclude",
+    [
+        [],
+        ["tests/"],
+        ["tests"],
+        ["*.txt"],
+        ["tests/", "!tests/keep.py"],
+        ["pkg/sub*/"],
+        ["**/deep/"],
+        ["/data"],
+    ],
+)
+def test_scan_wheel_dir_matches_glob(tmp_path, exclude):
+    root = tmp_path / "platlib"
+    for name in [
+        "a.py",
+        "a-b.py",
+        "a/b.py",
+        "a/.hidden",
+        "pkg/__init__.py",
+        "pkg/__pycache__/__init__.cpython-39.pyc",
+        "pkg/.pyc",
+        "pkg/mod.pyo",
+        "pkg/sub1/x.txt",
+        "pkg/sub2/deep/y.py",
+        "pkg/tests/z.py",
+        "tests/keep.py",
+        "tests/drop.py",
+        "tests/force.py",
+        "data/d.txt",
+        "other.dist-info/METADATA",
+        "pkg/file.dist-info",
+    ]:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name)
+    if not sys.platform.startswith("win"):
+        (tmp_path / "outside").mkdir()
+        (tmp_path / "outside" / "o.py").write_text("")
+        (root / "pkg" / "linked").symlink_to(tmp_path / "outside")
+        (root / "pkg" / "linked.py").symlink_to(root / "a.py")
+        (root / "pkg" / "dangling.py").symlink_to(tmp_path / "missing")
+
+    exempt = {(root / "tests" / "force.py").resolve()}
+    scanned = _scan_wheel_dir(root, path_matcher(exclude), exempt)
+    # Checked against plain pathspec, too
+    spec = pathspec.GitIgnoreSpec.from_lines(exclude)
+    assert [relpath for relpath, _ in scanned] == list(
+        _glob_wheel_dir(root, spec, exempt)
+    )
+    for relpath, st in scanned:
+        assert st.st_size == (root / relpath).stat().st_size
+
+
+def test_wheel_size_report(tmp_path, monkeypatch, caplog):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    platlib = tmp_path / "platlib"
+    (platlib / "pkg" / "data").mkdir(parents=True)
+    (platlib / "pkg" / "__init__.py").write_bytes(b"x = 1\n" * 1000)
+    (platlib / "pkg" / "data" / "big.bin").write_bytes(os.urandom(50_000))
+    (platlib / "pkg" / "empty.txt").write_bytes(b"")
+
+    wheel = _make_writer(tmp_path)
+    with wheel:
+        wheel.build({"platlib": platlib})
+
+    report = size_report(wheel.wheelpath, wheel.member_sizes)
+    with zipfile.ZipFile(wheel.wheelpath) as zf:
+        infos = zf.infolist()
+    assert report["wheel_size"] == wheel.wheelpath.stat().st_size
+    assert report["size"] == sum(info.file_size for info in infos)
+    assert report["compressed_size"] == sum(info.compress_size for info in infos)
+    assert len(report["files"]) == len(infos)
+
+    first = report["files"][0]
+    assert first["path"] == "pkg/data/big.bin"
+    assert first["size"] == 50_000
+    assert first["ratio"] > 0.99
+    (empty,) = (f for f in report["files"] if f["path"] == "pkg/empty.txt")
+    assert empty["ratio"] == 1.0
+
+    directories = {d["path"]: d for d in report["directories"]}
+    assert directories.keys() == {
+        "pkg/",
+        "pkg/data/",
+        "something-1.2.3.dist-info/",
+    }
+    assert directories["pkg/"]["files"] == 3
+    assert directories["pkg/"]["size"] == 6000 + 50_000
+    assert report["directories"][0]["path"] == "pkg/"
+
+    caplog.set_level("INFO", logger="scikit_build_core")
+    log_size_report(report, top=1)
+    messages = [record.getMessage() for record in caplog.records]
+    # Compressed and uncompressed sizes both come from the members
+    assert messages[0].startswith("Wheel size: ")
+    compressed = report["compressed_size"] / 1024
+    size = report["size"] / 1024
+    assert messages[0].endswith(
+        f"({compressed:.1f} KiB of members compressed from {size:.1f} KiB, "
+        f"{report['ratio']:.0%})"
+    )
+    assert messages[1] == "Largest files (compressed, uncompressed, ratio):"
+    assert messages[2].endswith("  pkg/data/big.bin")
+    assert messages[3] == "Largest directories (compressed, uncompressed, ratio):"
+    assert messages[4].endswith("  pkg/")
+    assert len(messages) == 5
+
+    path = write_size_report(report, wheel.wheelpath)
+    assert path == tmp_path / "out" / "something-1.2.3-py3-none-any.size-report.json"
+    assert json.loads(path.read_text(encoding="utf-8")) == report
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Needs resource module")
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_wheel_large_file_memory_is_bounded(tmp_path, jobs):
+    payload = tmp_path / "platlib" / "pkg" / "payload.bin"
+    payload.parent.mkdir(parents=True)
+    size = 256 * 1024 * 1024
+    with payload.open("wb") as f:
+        f.truncate(size)
+
+    # Run in a fresh process, since ru_maxrss is a high-water mark for the
+    # whole process and would be polluted by other tests.
+    script = textwrap.dedent(
+        """\
+        import resource
+        import sys
+        from pathlib import Path
+
+        from packaging.tags import Tag
+
+        from scikit_build_core._vendor.pyproject_metadata import StandardMetadata
+        from scikit_build_core.build._wheelfile import WheelMetadata, WheelWriter
+
+
+        def peak():
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return rss if sys.platform == "darwin" else rss * 1024
+
+
+        root = Path(sys.argv[1])
+        metadata = StandardMetadata.from_pyproject(
+            {"project": {"name": "big", "version": "1.0"}}
+        )
+        wheel = WheelWriter(
+            metadata,
+            root / "out",
+            {Tag("py3", "none", "any")},
+            WheelMetadata(),
+            None,
+            jobs=int(sys.argv[2]),
+        )
+        before = peak()
+        with wheel:
+            wheel.build({"platlib": root / "platlib"})
+        print(peak() - before)
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script, str(tmp_path), str(jobs)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert int(result.stdout) < 64 * 1024 * 1024
+
+    with zipfile.ZipFile(tmp_path / "out" / "big-1.0-py3-none-any.whl") as zf:
+        assert zf.getinfo("pkg/payload.bin").file_size == size